@@ -9,8 +9,10 @@ Username: SIDAY032
 This is my own work as defined by the University's Academic Integrity Policy.
 """
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
 
-from health_record import HealthRecord
+from health_record import HealthRecord, Severity
 
 class Animal(ABC):
     """
@@ -19,13 +21,26 @@ class Animal(ABC):
     and defines common behaviours that all animals share.
 
      Attributes:
+        __animal_id (int): Unique, automatically assigned animal ID (read-only).
         _name (str): The animal's name.
         _species (str): The species or type of the animal.
         _age (int): The age of the animal.
         _dietary_needs (str): Description of the animal's diet.
         _environment (str): The type of environment suitable for the animals  (e.g., aquatic, savannah).
-        __health_records (list): List storing the animal's health records privately.
+        __health_records (list): The animal's health records, kept sorted by reported date.
+        __critical_record_count (int): Number of health records that are currently High or Critical.
+        __record_keys (dict): Health record key -> number of this animal's records with that key
+                              (None until the first record is added).
+        _zoo (Zoo): The zoo this animal currently belongs to (None if not in a zoo).
     """
+    # Fixed attribute layout (no per-instance __dict__) to keep large populations compact.
+    # Private names are mangled in __slots__ just like in normal attribute access.
+    __slots__ = ('__animal_id', '_zoo', '_name', '_species', '_age', '_dietary_needs', '_environment',
+                 '__health_records', '__critical_record_count', '__record_keys', '__weakref__')
+
+    # Class level sequence used to hand out unique animal IDs
+    _id_sequence = count(1)
+
 # ============================ Constructor =======================================================
 
     def __init__(self, name: str, species: str, age: int, dietary_needs: str, environment: str) -> None:
@@ -39,6 +54,12 @@ class Animal(ABC):
             dietary_needs (str): The animal's dietary type (e.g., Carnivore, Herbivore).
             environment (str): The type of environment suitable for the animal (e.g., Savannah, Aquatic).
         """
+        # Unique ID assigned once and never changed, used for hashing and equality
+        self.__animal_id = next(Animal._id_sequence)
+
+        # The owning zoo is set by Zoo.add_animal so it can keep its indexes up to date
+        self._zoo = None
+
         # Use properties to ensure validation via setters
         self.name = name
         self.species = species
@@ -46,11 +67,20 @@ class Animal(ABC):
         self.dietary_needs = dietary_needs
         self.environment = environment
 
-        # Initialize empty list to store health records
+        # Initialize empty list to store health records (sorted by date_ordinal)
         self.__health_records = []
+        # Running count of critical records so health checks do not rescan the list
+        self.__critical_record_count = 0
+        # Keys of the records already added, so duplicate checks are a single lookup.
+        # Created on the first record, so animals without records do not carry an empty dict.
+        self.__record_keys = None
 
 # ============================ Getters ==========================================================
     # Return the current value of each attribute
+    def get_animal_id(self) -> int:
+        """Return the animal's unique ID."""
+        return self.__animal_id
+
     def get_name(self) -> str:
         """Return the animal's name."""
         return self._name
@@ -87,8 +117,13 @@ class Animal(ABC):
         # Validate not empty
         if new_name.strip() == '':
             raise ValueError('Name cannot be empty.')
+        old_name = getattr(self, '_name', None)
         self._name = new_name
 
+        # Let the owning zoo update its name index
+        if self._zoo is not None:
+            self._zoo._animal_renamed(self, old_name)
+
     def set_species(self, new_species: str) -> None:
         """
         Set a new species for the animal.
@@ -103,8 +138,13 @@ class Animal(ABC):
         # Validate not empty
         if new_species.strip() == '':
             raise ValueError('Species cannot be empty.')
+        old_species = getattr(self, '_species', None)
         self._species = new_species
 
+        # Let the owning zoo update its species index
+        if self._zoo is not None:
+            self._zoo._animal_respeciated(self, old_species)
+
     def set_age(self, new_age: int) -> None:
         """
         Set a new age for the animal.
@@ -157,6 +197,7 @@ class Animal(ABC):
 
 # ============================ Properties ======================================================
     # Create Python properties for attribute access
+    animal_id = property(get_animal_id)  # Read only
     name = property(get_name, set_name)
     species = property(get_species, set_species)
     age = property(get_age, set_age)
@@ -186,13 +227,15 @@ class Animal(ABC):
         Add a HealthRecord instance to this animal's health records.
 
         This method ensures that only unique health records are added
-        by comparing the record's description, date reported, and severity level.
+        by comparing the record's description, date reported, and severity level
+        (one hashed lookup of the record's key).
 
         Args:
             record (HealthRecord): A HealthRecord object representing a medical record.
 
         Raises:
             TypeError: If 'record' is not an instance of HealthRecord.
+            ValueError: If the record has already been added to a different animal.
 
         Returns:
             str: Confirmation message after adding the record, or a notice
@@ -202,20 +245,132 @@ class Animal(ABC):
         if not isinstance(record, HealthRecord):
             raise TypeError('Record must be a HealthRecord instance.')
 
-        # Prevent duplicate records using __eq__
-        if record in self.__health_records:
+        # Prevent duplicate records by looking up the record's key
+        key = record.get_key()
+        if self.__record_keys is not None and key in self.__record_keys:
             return f'Record already exists for {self.name}.'
 
-        # Add the record to the internal list
-        self.__health_records.append(record)
+        # A record describes a single animal's health
+        if record._animal is not None:
+            raise ValueError(f'This health record already belongs to {record._animal.name}.')
+
+        # Insert the record in date order (after any records from the same day)
+        insort(self.__health_records, record, key=HealthRecord.get_date_ordinal)
+        if self.__record_keys is None:
+            self.__record_keys = {}
+        self.__record_keys[key] = 1
+        record._animal = self
+
+        # Count critical records and let the owning zoo index the record
+        # and know the animal may now be critical
+        if record.is_critical():
+            self.__critical_record_count += 1
+        if self._zoo is not None:
+            self._zoo._health_record_added(self, record)
+            if record.is_critical():
+                self._zoo._animal_health_changed(self)
         return f'Health record added to {self.name}.'
 
+    def _record_severity_changed(self, record: HealthRecord, old_severity: Severity) -> None:
+        """
+        Called by HealthRecord when the severity of one of this animal's records changes.
+        Updates the critical record counter and lets the owning zoo re-index the record
+        and re-check this animal.
+
+        Args:
+            record (HealthRecord): The record whose severity changed.
+            old_severity (Severity): The record's severity before the change.
+        """
+        if self._zoo is not None:
+            self._zoo._health_record_changed(self, record, record.date_ordinal, old_severity)
+
+        # Nothing more to do if the record stayed on the same side of the critical threshold
+        was_critical = old_severity.is_critical
+        if record.is_critical() == was_critical:
+            return
+
+        self.__critical_record_count += 1 if not was_critical else -1
+        if self._zoo is not None:
+            self._zoo._animal_health_changed(self)
+
+    def _record_key_changed(self, record: HealthRecord, old_key: tuple) -> None:
+        """
+        Called by HealthRecord when the issue, date or severity of one of this animal's records changes.
+        Moves the record's entry in the set of known keys.
+
+        Args:
+            record (HealthRecord): The record whose key changed.
+            old_key (tuple): The record's key before the change.
+        """
+        if self.__record_keys is None:
+            self.__record_keys = {}
+
+        # Edited records can end up sharing a key, so keys are counted
+        remaining = self.__record_keys.get(old_key, 0) - 1
+        if remaining > 0:
+            self.__record_keys[old_key] = remaining
+        else:
+            self.__record_keys.pop(old_key, None)
+        new_key = record.get_key()
+        self.__record_keys[new_key] = self.__record_keys.get(new_key, 0) + 1
+
+    def _record_date_changed(self, record: HealthRecord, old_ordinal: int) -> None:
+        """
+        Called by HealthRecord when the date of one of this animal's records changes.
+        Moves the record to its new position so the list stays in date order.
+
+        Args:
+            record (HealthRecord): The record whose date changed.
+            old_ordinal (int): The record's date ordinal before the change.
+        """
+        # The record still sits at its old position, so search with its old date
+        # and only look through the records from that day
+        def sort_key(stored):
+            return old_ordinal if stored is record else stored.date_ordinal
+
+        low = bisect_left(self.__health_records, old_ordinal, key=sort_key)
+        high = bisect_right(self.__health_records, old_ordinal, key=sort_key)
+        for position in range(low, high):
+            if self.__health_records[position] is record:
+                del self.__health_records[position]
+                break
+        insort(self.__health_records, record, key=HealthRecord.get_date_ordinal)
+
+        # Let the owning zoo move the record in its health timelines
+        if self._zoo is not None:
+            self._zoo._health_record_changed(self, record, old_ordinal, record.severity)
+
+    def records_between(self, start, end) -> list:
+        """
+        Return the health records reported between two dates, inclusive.
+
+        Args:
+            start (str | date): First date to include (YYYY-MM-DD string or datetime.date).
+            end (str | date): Last date to include (YYYY-MM-DD string or datetime.date).
+
+        Raises:
+            TypeError: If start or end is neither a string nor a date.
+            ValueError: If a date string is invalid, or start is after end.
+
+        Returns:
+            list: HealthRecord objects in date order. Empty list if none match.
+        """
+        start_ordinal = HealthRecord.to_ordinal(start)
+        end_ordinal = HealthRecord.to_ordinal(end)
+        if start_ordinal > end_ordinal:
+            raise ValueError('Start date must not be after end date.')
+
+        # Binary search for both ends of the range, then slice
+        low = bisect_left(self.__health_records, start_ordinal, key=HealthRecord.get_date_ordinal)
+        high = bisect_right(self.__health_records, end_ordinal, key=HealthRecord.get_date_ordinal)
+        return self.__health_records[low:high]
+
     def display_health_records(self) -> list:
         """
         Display all health records for this animal.
 
         Returns:
-            list: A list of HealthRecord objects. Empty list if none exist.
+            list: A list of HealthRecord objects in date order. Empty list if none exist.
         """
         # Returns empty list [] if no records
         return list(self.__health_records)
@@ -227,12 +382,8 @@ class Animal(ABC):
         Returns:
             bool: True if any health record is critical, False otherwise.
         """
-        # Loop through all health records
-        for record in self.__health_records:
-            # Check if any record is marked as critical using HealthRecord's is_critical() method
-            if record.is_critical():
-                return True  # Found at least one critical issue
-        return False   # No critical issues found
+        # Use the running count instead of scanning every record
+        return self.__critical_record_count > 0
 
     def can_be_moved(self) -> bool:
         """
@@ -263,11 +414,30 @@ class Animal(ABC):
                 f'Dietary needs: {self.dietary_needs}\n'
                 f'Environment: {self.environment}\n')
 
-# ================================ Equal Method ===================================================
+# ================================ Equality ========================================================
 
     def __eq__(self, other) -> bool:
         """
-               Compare two Animal objects based on their attributes.
+        Compare two Animal objects by their unique animal_id.
+
+        Args:
+            other (Animal): Another animal to compare.
+
+        Returns:
+            bool: True if both objects are the same animal, False otherwise.
+        """
+        # Compare animal objects using unique ID
+        if not isinstance(other, Animal):
+            return False
+        return self.__animal_id == other.__animal_id
+
+    def __hash__(self) -> int:
+        """Return a hash based on the unique animal_id, so animals can be used in sets and dicts."""
+        return hash(self.__animal_id)
+
+    def same_attributes(self, other) -> bool:
+        """
+        Compare two Animal objects based on their attributes.
 
         Args:
             other (Animal): Another animal to compare.
@@ -296,6 +466,8 @@ class Mammal(Animal):
         hair_type (str): Description of hair or fur type.
         blood_type (str): Type of blood temperature regulation (e.g., warm-blooded).
     """
+    # Mammal specific attributes stored in slots like the Animal base class
+    __slots__ = ('_sound', '_hair_type', '_blood_type')
 
     def __init__(self, name: str, species: str, age: int, dietary_needs: str, environment: str,
                  sound: str, hair_type: str, blood_type: str) -> None:
@@ -407,8 +579,8 @@ class Mammal(Animal):
                 f'Hair type: {self.hair_type}\n'
                 f'Blood type: {self.blood_type}\n')
 
-# =================================== Equal Method =================================================
-    def __eq__(self, other) -> bool:
+# =================================== Attribute Comparison =========================================
+    def same_attributes(self, other) -> bool:
         """
         Compare two mammals based on both their Animal and Mammal attributes.
 
@@ -422,7 +594,7 @@ class Mammal(Animal):
         if not isinstance(other, Mammal):
             return False
         # Compare parent attributes AND Mammal specific attributes
-        return (super().__eq__(other) and
+        return (super().same_attributes(other) and
                 self.sound == other.sound and
                 self.hair_type == other.hair_type and
                 self.blood_type == other.blood_type)
@@ -439,6 +611,8 @@ class Reptile(Animal):
         blood_type (str): Blood temperature type (e.g., cold-blooded).
         is_venomous (bool): Indicates if the reptile is venomous.
     """
+    # Reptile specific attributes stored in slots like the Animal base class
+    __slots__ = ('_sound', '_skin_type', '_blood_type', '_is_venomous')
 
     def __init__(self, name: str, species: str, age: int, dietary_needs: str, environment: str,
                  sound: str, skin_type: str, blood_type: str, is_venomous: bool) -> None:
@@ -568,8 +742,8 @@ class Reptile(Animal):
                 f'Blood type: {self.blood_type}\n'
                 f'Is Venomous: {self.is_venomous}\n')
 
-    # ====================================== Equal Method =============================================
-    def __eq__(self, other) -> bool:
+    # ====================================== Attribute Comparison =====================================
+    def same_attributes(self, other) -> bool:
         """
         Compare two reptiles based on both their Animal and Reptile attributes.
 
@@ -583,7 +757,7 @@ class Reptile(Animal):
         if not isinstance(other, Reptile):
             return False
         # Compare parent attributes AND Reptile specific attributes
-        return (super().__eq__(other) and
+        return (super().same_attributes(other) and
                 self.sound == other.sound and
                 self.skin_type == other.skin_type and
                 self.blood_type == other.blood_type and
@@ -602,6 +776,8 @@ class Bird(Animal):
         blood_type (str): Blood temperature type (e.g., warm-blooded).
         can_fly (bool): Indicates if the bird can fly.
     """
+    # Bird specific attributes stored in slots like the Animal base class
+    __slots__ = ('_sound', '_feather_type', '_blood_type', '_can_fly')
 
     def __init__(self, name: str, species: str, age: int, dietary_needs: str, environment: str,
                  sound: str, feather_type: str, blood_type: str, can_fly: bool) -> None:
@@ -730,7 +906,7 @@ class Bird(Animal):
                 f'Blood type: {self.blood_type}\n'
                 f'Can Fly: {self.can_fly}\n')
 
-    def __eq__(self, other) -> bool:
+    def same_attributes(self, other) -> bool:
         """
         Compare two birds based on both their Animal and Bird attributes.
 
@@ -744,7 +920,7 @@ class Bird(Animal):
         if not isinstance(other, Bird):
             return False
         # Compare parent attributes and Bird specific attributes
-        return (super().__eq__(other) and
+        return (super().same_attributes(other) and
                 self.sound == other.sound and
                 self.feather_type == other.feather_type and
                 self.blood_type == other.blood_type and
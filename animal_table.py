@@ -0,0 +1,267 @@
+"""
+File: animal_table.py
+Description: This module defines the AnimalTable class, a column-oriented snapshot of the
+animals in a zoo used for fast filtering and aggregation in reports.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+from array import array
+
+
+class AnimalTable:
+    """
+    Column-oriented store of animal details for analytics queries.
+
+    Each animal becomes one row. Text columns with few distinct values (species, diet,
+    environment, class) are stored as integer codes into a list of categories, and every
+    category also keeps a bitmask of the rows that have it. Filters combine those bitmasks
+    with integer AND / OR operations instead of looping over Animal objects.
+
+    The table is a snapshot: build a new one (e.g. with AnimalTable.from_zoo) to pick up
+    later changes to the zoo.
+
+    Attributes:
+        __names (list): Animal names, one per row.
+        __animal_ids (array): animal_id of the animal in each row.
+        __ages (array): Animal ages, one per row.
+        __codes (dict): Categorical column name -> array of category codes per row.
+        __categories (dict): Categorical column name -> list of distinct values (index = code).
+        __lookups (dict): Categorical column name -> dict of value -> code.
+        __masks (dict): Categorical column name -> list of row bitmasks (index = code).
+        __age_masks (dict): Age -> bitmask of rows with that age.
+    """
+    # Columns stored as interned category codes
+    CATEGORICAL_COLUMNS = ('species', 'dietary_needs', 'environment', 'animal_class')
+
+# ============================ Constructor ========================================================
+    def __init__(self, animals) -> None:
+        """
+        Build the table from an iterable of Animal objects.
+
+        Args:
+            animals (iterable): The animals to store, one row each, in iteration order.
+        """
+        self.__names = []
+        self.__animal_ids = array('q')
+        self.__ages = array('q')
+        self.__codes = {column: array('l') for column in self.CATEGORICAL_COLUMNS}
+        self.__categories = {column: [] for column in self.CATEGORICAL_COLUMNS}
+
+        # Value -> code lookups used to intern the categorical columns
+        self.__lookups = {column: {} for column in self.CATEGORICAL_COLUMNS}
+        # Rows per category and per age, turned into bitmasks once all rows are known
+        rows_by_code = {column: [] for column in self.CATEGORICAL_COLUMNS}
+        rows_by_age = {}
+
+        for row, animal in enumerate(animals):
+            self.__names.append(animal.name)
+            self.__animal_ids.append(animal.animal_id)
+            self.__ages.append(animal.age)
+            rows_by_age.setdefault(animal.age, []).append(row)
+
+            values = (animal.species, animal.dietary_needs, animal.environment, type(animal).__name__)
+            for column, value in zip(self.CATEGORICAL_COLUMNS, values):
+                code = self.__lookups[column].get(value)
+                if code is None:
+                    # First time this value is seen: give it the next code
+                    code = len(self.__categories[column])
+                    self.__lookups[column][value] = code
+                    self.__categories[column].append(value)
+                    rows_by_code[column].append([])
+                self.__codes[column].append(code)
+                rows_by_code[column][code].append(row)
+
+        row_count = len(self.__names)
+        self.__masks = {column: [self.__rows_to_mask(rows, row_count) for rows in rows_by_code[column]]
+                        for column in self.CATEGORICAL_COLUMNS}
+        self.__age_masks = {age: self.__rows_to_mask(rows, row_count) for age, rows in rows_by_age.items()}
+        self.__all_rows = (1 << row_count) - 1
+
+    @classmethod
+    def from_zoo(cls, zoo) -> 'AnimalTable':
+        """
+        Build a table from every animal currently in a zoo.
+
+        Args:
+            zoo (Zoo): The zoo to snapshot.
+
+        Returns:
+            AnimalTable: A table with one row per animal, in the zoo's order.
+        """
+        return cls(zoo.animals)
+
+    @staticmethod
+    def __rows_to_mask(rows: list, row_count: int) -> int:
+        """Convert a list of row indexes into an integer bitmask (bit i set = row i)."""
+        # Setting bits in a bytearray avoids rebuilding a large int for every row
+        bits = bytearray((row_count + 7) // 8)
+        for row in rows:
+            bits[row >> 3] |= 1 << (row & 7)
+        return int.from_bytes(bits, 'little')
+
+# ============================ Getters ============================================================
+    def get_names(self) -> list:
+        """Return a copy of the name column."""
+        return list(self.__names)
+
+    def get_animal_ids(self) -> array:
+        """Return a copy of the animal_id column."""
+        return array('q', self.__animal_ids)
+
+    def get_ages(self) -> array:
+        """Return a copy of the age column."""
+        return array('q', self.__ages)
+
+    def get_categories(self, column: str) -> list:
+        """
+        Return the distinct values of a categorical column, in code order.
+
+        Raises:
+            ValueError: If column is not a categorical column.
+        """
+        self.__check_column(column)
+        return list(self.__categories[column])
+
+    def get_codes(self, column: str) -> array:
+        """
+        Return a copy of the category codes of a categorical column, one per row.
+
+        Raises:
+            ValueError: If column is not a categorical column.
+        """
+        self.__check_column(column)
+        return array('l', self.__codes[column])
+
+    def get_row(self, row: int) -> dict:
+        """
+        Return one row as a dictionary of column name -> value.
+
+        Raises:
+            IndexError: If row is out of range.
+        """
+        row_values = {'animal_id': self.__animal_ids[row], 'name': self.__names[row], 'age': self.__ages[row]}
+        for column in self.CATEGORICAL_COLUMNS:
+            row_values[column] = self.__categories[column][self.__codes[column][row]]
+        return row_values
+
+# ============================ Properties =========================================================
+    names = property(get_names)  # Read-only copy
+    animal_ids = property(get_animal_ids)  # Read-only copy
+    ages = property(get_ages)  # Read-only copy
+
+# ============================ Queries ============================================================
+    def mask(self, species: str = None, dietary_needs: str = None, environment: str = None,
+             animal_class: str = None, min_age: int = None, max_age: int = None) -> int:
+        """
+        Return the bitmask of rows matching every given filter (bit i set = row i matches).
+
+        Text filters match exactly; None means "any". Ages are inclusive bounds.
+
+        Args:
+            species (str): Species to match.
+            dietary_needs (str): Dietary needs to match.
+            environment (str): Environment to match.
+            animal_class (str): Animal class name to match (e.g. 'Mammal').
+            min_age (int): Lowest age to include.
+            max_age (int): Highest age to include.
+
+        Returns:
+            int: Bitmask of matching rows.
+        """
+        result = self.__all_rows
+        filters = (species, dietary_needs, environment, animal_class)
+        for column, value in zip(self.CATEGORICAL_COLUMNS, filters):
+            if value is None:
+                continue
+            code = self.__lookups[column].get(value)
+            if code is None:
+                return 0  # No row has this value
+            result &= self.__masks[column][code]
+
+        if min_age is not None or max_age is not None:
+            low = min_age if min_age is not None else 0
+            high = max_age if max_age is not None else max(self.__age_masks, default=0)
+            # Only distinct ages are visited, not rows
+            age_mask = 0
+            for age, rows in self.__age_masks.items():
+                if low <= age <= high:
+                    age_mask |= rows
+            result &= age_mask
+        return result
+
+    def where(self, **filters) -> list:
+        """
+        Return the indexes of rows matching every filter (see mask() for the filters).
+
+        Returns:
+            list: Matching row indexes in ascending order.
+        """
+        # Walk the set bits via str.find so runs of non-matching rows are skipped quickly
+        bits = bin(self.mask(**filters))[:1:-1]
+        rows = []
+        row = bits.find('1')
+        while row != -1:
+            rows.append(row)
+            row = bits.find('1', row + 1)
+        return rows
+
+    def count(self, **filters) -> int:
+        """
+        Return the number of rows matching every filter (see mask() for the filters).
+
+        Returns:
+            int: Number of matching rows.
+        """
+        return self.mask(**filters).bit_count()
+
+    def count_by(self, column: str, **filters) -> dict:
+        """
+        Count matching rows for each value of a categorical column.
+
+        Args:
+            column (str): Categorical column to group by.
+            **filters: Optional filters, see mask().
+
+        Raises:
+            ValueError: If column is not a categorical column.
+
+        Returns:
+            dict: Column value -> number of matching rows (values with no rows are left out).
+        """
+        self.__check_column(column)
+        selected = self.mask(**filters)
+        counts = {}
+        for value, rows in zip(self.__categories[column], self.__masks[column]):
+            matching = (rows & selected).bit_count()
+            if matching:
+                counts[value] = matching
+        return counts
+
+    def mean_age(self, **filters) -> float:
+        """
+        Return the average age of the rows matching every filter.
+
+        Returns:
+            float: Mean age, or 0.0 if no rows match.
+        """
+        selected = self.mask(**filters)
+        total = 0
+        matching = 0
+        # Aggregate per distinct age rather than per row
+        for age, rows in self.__age_masks.items():
+            rows_with_age = (rows & selected).bit_count()
+            total += age * rows_with_age
+            matching += rows_with_age
+        return total / matching if matching else 0.0
+
+    def __check_column(self, column: str) -> None:
+        """Raise ValueError if column is not one of the categorical columns."""
+        if column not in self.CATEGORICAL_COLUMNS:
+            raise ValueError(f'Column must be one of: {", ".join(self.CATEGORICAL_COLUMNS)}')
+
+# ============================ Special Methods ====================================================
+    def __len__(self) -> int:
+        """Return the number of rows in the table."""
+        return len(self.__names)
@@ -0,0 +1,252 @@
+"""
+File: benchmarks.py
+Description: Performance and memory benchmarks for the zoo management system.
+Run with: python benchmarks.py
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+import gc
+import os
+import time
+import tracemalloc
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from animal import Mammal
+from enclosure import Enclosure
+from health_record import HealthRecord
+from placement import PlacementEngine
+from staff import Zookeeper
+from zoo import Zoo
+
+
+# ============================ Helpers ===========================================================
+def measure_allocated_bytes(factory, count: int) -> int:
+    """
+    Measure how many bytes are allocated while creating objects.
+
+    Args:
+        factory (callable): Called with the loop index, returns one new object.
+        count (int): Number of objects to create.
+
+    Returns:
+        int: Bytes still allocated by the created objects.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # Keep references alive so the memory is still allocated when measured
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def current_rss_bytes() -> int:
+    """
+    Return the resident set size (RSS) of this process in bytes.
+
+    Reads /proc/self/statm on Linux; elsewhere falls back to the peak RSS reported by
+    the resource module, which is close enough when measured in a fresh process.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on other platforms
+        return peak if os.uname().sysname == 'Darwin' else peak * 1024
+
+
+def print_result(title: str, before: float, after: float, unit: str) -> None:
+    """Print a before/after comparison in a consistent format."""
+    print(f'{title}')
+    print(f'  Before: {before:,.1f} {unit}')
+    print(f'  After:  {after:,.1f} {unit}')
+    saved = (1 - after / before) * 100
+    print(f'  Saved:  {saved:.1f}%' if saved >= 0 else f'  Grew:   {-saved:.1f}%')
+
+
+# ============================ Animal Memory =====================================================
+class _UnslottedMammal:
+    """
+    The original Mammal layout: exactly the attributes Mammal had before animal IDs, zoo
+    back-pointers, health counters and __slots__ were added, stored in a per-instance __dict__.
+    Only used as the benchmark baseline, so any per-animal growth from later fields shows up.
+    """
+
+    def __init__(self, name, species, age, dietary_needs, environment, sound, hair_type, blood_type):
+        self._name = name
+        self._species = species
+        self._age = age
+        self._dietary_needs = dietary_needs
+        self._environment = environment
+        self._Animal__health_records = []
+        self._sound = sound
+        self._hair_type = hair_type
+        self._blood_type = blood_type
+
+
+def benchmark_animal_memory(count: int = 100_000) -> None:
+    """
+    Compare bytes per animal for the current Mammal against the original __dict__ based layout.
+
+    Args:
+        count (int): Number of animals to create for each layout.
+    """
+    # Each animal gets its own name, like a real census; the other strings are shared
+    def unslotted(i):
+        return _UnslottedMammal(f'Lion {i}', 'Lion', 5, 'Carnivore', 'Savannah',
+                                'Roar', 'Golden', 'Warm-blooded')
+
+    def slotted(i):
+        return Mammal(f'Lion {i}', 'Lion', 5, 'Carnivore', 'Savannah',
+                      'Roar', 'Golden', 'Warm-blooded')
+
+    before = measure_allocated_bytes(unslotted, count) / count
+    after = measure_allocated_bytes(slotted, count) / count
+    print_result(f'Animal memory ({count:,} mammals)', before, after, 'bytes per animal')
+
+
+# ============================ Health Record Memory ==============================================
+class _UnslottedHealthRecord:
+    """
+    HealthRecord with the same attributes as the real class, stored in a per-instance __dict__
+    and without pooling its text, the way HealthRecord did before. Only used as the benchmark baseline.
+    """
+
+    def __init__(self, issue, date_reported, severity_level, treatment_plan):
+        self._animal = None
+        self._HealthRecord__issue = issue
+        self._HealthRecord__date_reported = date_reported
+        self._HealthRecord__date_ordinal = HealthRecord.to_ordinal(date_reported)
+        self._HealthRecord__severity_level = severity_level
+        self._HealthRecord__severity = None
+        self._HealthRecord__treatment_plan = treatment_plan
+
+
+# A small vocabulary of issue and treatment text, repeated the way real vet archives are
+_ISSUES = ('Routine checkup', 'Vaccination', 'Dental cleaning', 'Minor injury', 'Weight check',
+           'Parasite treatment', 'Skin irritation', 'Eye infection')
+_TREATMENTS = ('All clear, healthy', 'Booster in 12 months', 'Rest and observation',
+               'Antibiotics for 7 days', 'Dietary adjustment', 'Topical ointment')
+_SEVERITIES = ('Low', 'Medium', 'High', 'Critical')
+
+
+def _archive_lines(count: int):
+    """Yield tab-separated lines for count health records covering one year of dates."""
+    for i in range(count):
+        yield (f'{_ISSUES[i % len(_ISSUES)]}\t2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}\t'
+               f'{_SEVERITIES[i % len(_SEVERITIES)]}\t{_TREATMENTS[i % len(_TREATMENTS)]}')
+
+
+def _health_record_rss(slotted: bool, count: int) -> int:
+    """
+    Build count health records from parsed text and return how much RSS grew.
+    Runs in a fresh worker process so each layout starts from the same baseline.
+    """
+    factory = HealthRecord if slotted else _UnslottedHealthRecord
+    gc.collect()
+    before = current_rss_bytes()
+    # Splitting each line gives new string objects per record, as reading a file would
+    records = [factory(*line.split('\t')) for line in _archive_lines(count)]
+    after = current_rss_bytes()
+    del records
+    return after - before
+
+
+def benchmark_health_record_memory(count: int = 1_000_000) -> None:
+    """
+    Compare process RSS for an archive of health records: __dict__ based records holding
+    their own copy of every string against slotted records with pooled text.
+
+    Args:
+        count (int): Number of health records to create for each layout.
+    """
+    results = []
+    for slotted in (False, True):
+        # A new process per layout, so memory freed by the first run cannot be reused by the second
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results.append(executor.submit(_health_record_rss, slotted, count).result())
+    before, after = results
+    print_result(f'Health record RSS ({count:,} records)', before / 2 ** 20, after / 2 ** 20, 'MiB')
+
+
+# ============================ Removal Leak Check ================================================
+def benchmark_removal_leak(count: int = 20_000) -> None:
+    """
+    Remove animals that are placed in enclosures and assigned to staff, then check
+    that every removed animal is garbage-collected.
+
+    Args:
+        count (int): Number of animals to add and remove.
+    """
+    zoo = Zoo('Benchmark Zoo')
+    enclosures = [Enclosure('Large', 'Savannah', Mammal) for _ in range(100)]
+    keepers = [Zookeeper(f'Keeper {i}', i) for i in range(count // Zookeeper.MAX_ANIMALS_PER_STAFF + 1)]
+    zoo.add_enclosures(enclosures)
+    zoo.add_staff_members(keepers)
+
+    animals = [Mammal(f'Lion {i}', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+               for i in range(count)]
+    zoo.add_animals(animals)
+    for i, animal in enumerate(animals):
+        zoo.assign_animal_to_enclosure(animal, enclosures[i % len(enclosures)])
+        keepers[i // Zookeeper.MAX_ANIMALS_PER_STAFF].assign_animal(animal)
+
+    # Only weak references survive the removal
+    references = [weakref.ref(animal) for animal in animals]
+    start = time.perf_counter()
+    for animal in animals:
+        zoo.remove_animal(animal)
+    elapsed = time.perf_counter() - start
+    del animals, animal
+    gc.collect()
+
+    alive = sum(1 for reference in references if reference() is not None)
+    print(f'Removal leak check ({count:,} animals)')
+    print(f'  Removal time:   {elapsed:.3f} s ({elapsed / count * 1e6:.1f} us per animal)')
+    print(f'  Still alive:    {alive}')
+    print(f'  Result:         {"OK" if alive == 0 else "LEAK"}')
+
+
+# ============================ Batch Placement ===================================================
+def benchmark_placement(count: int = 5_000, enclosure_count: int = 50) -> None:
+    """
+    Time placing a whole intake batch with the placement engine.
+
+    Args:
+        count (int): Number of animals to place.
+        enclosure_count (int): Number of compatible enclosures to spread them over.
+    """
+    zoo = Zoo('Benchmark Zoo')
+    zoo.add_enclosures([Enclosure('Large', 'Savannah', Mammal) for _ in range(enclosure_count)])
+    animals = [Mammal(f'Lion {i}', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+               for i in range(count)]
+    zoo.add_animals(animals)
+
+    start = time.perf_counter()
+    result = PlacementEngine(zoo).place_animals(animals)
+    elapsed = time.perf_counter() - start
+
+    counts = [enclosure.count_animals() for enclosure in zoo.enclosures]
+    print(f'Batch placement ({count:,} animals, {enclosure_count} enclosures)')
+    print(f'  Placement time: {elapsed:.3f} s ({elapsed / count * 1e6:.1f} us per animal)')
+    print(f'  Placed:         {len(result.placements):,}')
+    print(f'  Per enclosure:  {min(counts)} to {max(counts)} animals')
+
+
+# ============================ Main ==============================================================
+def main() -> None:
+    """Run every benchmark."""
+    benchmark_animal_memory()
+    benchmark_health_record_memory()
+    benchmark_removal_leak()
+    benchmark_placement()
+
+
+if __name__ == '__main__':
+    main()
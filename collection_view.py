@@ -0,0 +1,107 @@
+"""
+File: collection_view.py
+Description: This module defines the ReadOnlyView class, a zero-copy, read-only sequence
+view used to expose the zoo's internal collections without copying them.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+from collections.abc import Sequence
+from itertools import islice
+
+
+class ReadOnlyView(Sequence):
+    """
+    Read-only view over a list, or over the values of an insertion-ordered dict.
+
+    The view always reflects the current contents of the underlying collection and
+    never copies it. It supports len(), iteration, reversed(), indexing, slicing
+    (slices return a new list), 'in' and comparison with other sequences, but has
+    no methods that change the collection. Use list(view) to take a snapshot,
+    e.g. before removing items while iterating: changing a dict while a view
+    over it is being iterated raises RuntimeError.
+
+    Attributes:
+        __items (list | dict): The underlying collection.
+        __key (callable): For dicts, maps an item to its dictionary key (None for lists).
+    """
+    __slots__ = ('__items', '__key')
+
+    def __init__(self, items, key=None) -> None:
+        """
+        Initialize a new ReadOnlyView.
+
+        Args:
+            items (list | dict): The collection to view. For a dict, the values are the items.
+            key (callable): For dicts, returns the dictionary key of an item (e.g. Animal.get_animal_id),
+                            so membership tests are a single lookup.
+        """
+        self.__items = items
+        self.__key = key
+
+    def __len__(self) -> int:
+        """Return the number of items (O(1))."""
+        return len(self.__items)
+
+    def __iter__(self):
+        """Iterate over the items in order."""
+        if isinstance(self.__items, dict):
+            return iter(self.__items.values())
+        return iter(self.__items)
+
+    def __reversed__(self):
+        """Iterate over the items in reverse order."""
+        if isinstance(self.__items, dict):
+            return reversed(self.__items.values())
+        return reversed(self.__items)
+
+    def __contains__(self, item) -> bool:
+        """Return True if item is in the collection (O(1) for dicts)."""
+        if not isinstance(self.__items, dict):
+            return item in self.__items
+        try:
+            stored = self.__items.get(self.__key(item))
+        except (AttributeError, TypeError):
+            return False  # Not an object of the stored type
+        return stored is not None and stored == item
+
+    def __getitem__(self, index):
+        """
+        Return the item at a position, or a list of items for a slice.
+
+        For dicts, a single position is found by walking from the nearest end, so it
+        costs O(n) rather than O(1); iterate over the view, or index a list(view)
+        snapshot, when many positions are needed.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not isinstance(self.__items, dict):
+            items = self.__items[index]
+            return list(items) if isinstance(index, slice) else items
+        if isinstance(index, slice):
+            return list(self.__items.values())[index]
+
+        # Dicts are not indexable, so walk to the position from the nearest end
+        size = len(self.__items)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('View index out of range.')
+        if index < size // 2:
+            return next(islice(self.__items.values(), index, None))
+        return next(islice(reversed(self.__items.values()), size - 1 - index, None))
+
+    def __eq__(self, other) -> bool:
+        """Compare item by item with another sequence (list, tuple or view)."""
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    # Views are live and mutable underneath, so they must not be hashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return a representation showing the current items."""
+        return f'ReadOnlyView({list(self)!r})'
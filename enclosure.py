@@ -6,7 +6,10 @@ ID: 110481368
 Username: SIDAY032
 This is my own work as defined by the University's Academic Integrity Policy.
 """
+from itertools import count
+
 from animal import Animal
+from collection_view import ReadOnlyView
 
 
 class Enclosure:
@@ -16,13 +19,18 @@ class Enclosure:
     Each enclosure houses only one type of animal, such as Mammal, Bird, or Reptile.
 
     Attributes:
+        __enclosure_id (int): Unique, automatically assigned enclosure ID (read-only).
         __size (str): The size of the enclosure (e.g., "Large", "Medium").
         __environmental_type (str): The type of environment suitable for the animals (e.g., 'Savannah', 'Aquatic').
         __animal_type (Animal subclass): The class of animal allowed in this enclosure.
         __cleanliness_level (float): The cleanliness level of the enclosure (0 to 100).
-        __animals (list): List storing the animals currently in the enclosure.
+        __animals (dict): Animals currently in the enclosure, keyed by animal_id (insertion-ordered).
+        _zoo (Zoo): The zoo this enclosure currently belongs to (None if not in a zoo).
     """
 
+    # Class level sequence used to hand out unique enclosure IDs
+    _id_sequence = count(1)
+
     def __init__(self, size: str, environmental_type: str, animal_type: type[Animal], cleanliness_level: float = 100) -> None:
         """
         Initialize a new Enclosure instance.
@@ -33,18 +41,30 @@ class Enclosure:
             animal_type (type[Animal]): The Animal subclass (e.g., Mammal, Bird) allowed in this enclosure.
             cleanliness_level (float): Initial cleanliness level (default is 100).
         """
+        # Unique ID assigned once and never changed, used for hashing and equality
+        self.__enclosure_id = next(Enclosure._id_sequence)
+
+        # The owning zoo is set by Zoo.add_enclosure so it can keep its placement index and
+        # animal -> enclosure map up to date
+        self._zoo = None
+
         # Use properties to ensure validation via setters
         self.size = size
         self.environmental_type = environmental_type
         self.animal_type = animal_type
         self.cleanliness_level = cleanliness_level
 
-        # Private list of actual Animal instances inside this enclosure
-        self.__animals = []
+        # Private insertion-ordered dict of the Animal instances inside this enclosure,
+        # keyed by animal_id so add, remove and membership checks are O(1)
+        self.__animals = {}
 
 
 # ============================ Getters ===============================================================
     # Return the current value of each enclosure attribute
+    def get_enclosure_id(self) -> int:
+        """Return the enclosure's unique ID."""
+        return self.__enclosure_id
+
     def get_size(self) -> str:
         """Return the size of the enclosure."""
         return self.__size
@@ -61,11 +81,16 @@ class Enclosure:
         """Return the cleanliness level of the enclosure."""
         return self.__cleanliness_level
 
-    def get_animals(self) -> list:
+    def get_animals(self) -> ReadOnlyView:
         """
-        Return a copy of the animals list to prevent external modification.
+        Return a read-only view of the animals to prevent external modification
+        without copying the list.
         """
-        return list(self.__animals)
+        return ReadOnlyView(self.__animals, Animal.get_animal_id)
+
+    def count_animals(self) -> int:
+        """Return the number of animals in the enclosure."""
+        return len(self.__animals)
 
 # ========================== Setters ================================================================
     # Validate and set new values for enclosure attributes
@@ -97,8 +122,13 @@ class Enclosure:
             raise TypeError('Environmental type must be a string.')
         if new_type.strip() == '':
             raise ValueError('Environmental type cannot be empty.')
+        old_type = getattr(self, '_Enclosure__environmental_type', None)
         self.__environmental_type = new_type
 
+        # Let the owning zoo update its placement index
+        if self._zoo is not None:
+            self._zoo._enclosure_retyped(self, old_type, self.__animal_type)
+
     def set_animal_type(self, new_type: type[Animal]) -> None:
         """
         Validate and set the allowed animal type for this enclosure.
@@ -111,8 +141,13 @@ class Enclosure:
         if not isinstance(new_type, type) or not issubclass(new_type, Animal):
             raise TypeError('animal_type must be a subclass of Animal.')
         # Set the validated animal type
+        old_type = getattr(self, '_Enclosure__animal_type', None)
         self.__animal_type = new_type
 
+        # Let the owning zoo update its placement index
+        if self._zoo is not None:
+            self._zoo._enclosure_retyped(self, self.__environmental_type, old_type)
+
     def set_cleanliness_level(self, new_level: float) -> None:
         """
         Set a new cleanliness level for the enclosure.
@@ -130,11 +165,12 @@ class Enclosure:
 
 # ============================ Properties ================================================================
     # Define properties to make access cleaner while maintaining encapsulation
+    enclosure_id = property(get_enclosure_id)  # Read only
     size = property(get_size, set_size)
     environmental_type = property(get_environmental_type, set_environmental_type)
     animal_type = property(get_animal_type, set_animal_type)
     cleanliness_level = property(get_cleanliness_level, set_cleanliness_level)
-    animals = property(get_animals)  # Read-only, modify via add/remove methods
+    animals = property(get_animals)  # Read-only view, modify via add/remove methods
 
 # ============================ Methods ====================================================================
     # Methods for managing animals and enclosure maintenance
@@ -142,6 +178,9 @@ class Enclosure:
         """
         Add an animal to the enclosure if it matches the allowed type and environment.
 
+        If the enclosure belongs to a zoo and the animal already lives in another
+        enclosure of that zoo, the animal is moved: the zoo takes it out of the other one.
+
         Args:
             animal (Animal): Animal instance to add.
 
@@ -161,15 +200,17 @@ class Enclosure:
             raise TypeError(f'This enclosure only accepts {self.animal_type.__name__}s.')
 
         # Avoid duplicates
-        if animal in self.__animals:
+        if animal.animal_id in self.__animals:
             raise ValueError(f'{animal.name} is already in this enclosure.')
 
         # Ensure the environment matches
         if animal.environment != self.environmental_type:
             raise ValueError(f'{animal.name} cannot be placed in a {self.environmental_type} enclosure.')
 
-        # Passed all checks, add to list
-        self.__animals.append(animal)
+        # Passed all checks, add to the enclosure and let the owning zoo track where the animal lives
+        self.__animals[animal.animal_id] = animal
+        if self._zoo is not None:
+            self._zoo._enclosure_animal_added(self, animal)
         return f'{animal.name} the {animal.species} has been added to the enclosure.'
 
     def remove_animal(self, animal) -> str:
@@ -191,11 +232,13 @@ class Enclosure:
             raise TypeError('Only Animal objects can be removed from an enclosure.')
 
         # Check if the animal actually exists inside
-        if animal not in self.__animals:
+        if animal.animal_id not in self.__animals:
             raise ValueError(f'{animal.name} is not in this enclosure.')
 
-        # Remove and confirm
-        self.__animals.remove(animal)
+        # Remove, update the owning zoo and confirm
+        del self.__animals[animal.animal_id]
+        if self._zoo is not None:
+            self._zoo._enclosure_animal_removed(self, animal)
         return f'{animal.name} the {animal.species} has been removed from the enclosure.'
 
 
@@ -262,8 +305,8 @@ class Enclosure:
                  number of animals, and list of animals.
         """
         # Prepare list of animals or show 'no animals' message
-        if self.animals:
-            animal_list = ', '.join([animal.name for animal in self.animals])
+        if self.__animals:
+            animal_list = ', '.join([animal.name for animal in self.__animals.values()])
         else:
             animal_list = 'No animals currently in this enclosure.'
 
@@ -272,7 +315,7 @@ class Enclosure:
                 f'Environment: {self.environmental_type}\n'
                 f'Size: {self.size}\n'
                 f'Cleanliness level: {self.cleanliness_level}\n'
-                f'Number of animals: {len(self.animals)}\n'
+                f'Number of animals: {len(self.__animals)}\n'
                 f'List of animals: {animal_list}\n')
 
     def __str__(self) -> str:
@@ -285,3 +328,21 @@ class Enclosure:
         # When print() is called on the object, display full status
         return self.report_status()
 
+    def __eq__(self, other) -> bool:
+        """
+        Compare enclosure objects by their unique enclosure_id.
+
+        Args:
+            other (Enclosure): Another enclosure to compare.
+
+        Returns:
+            bool: True if both objects are the same enclosure, False otherwise.
+        """
+        if not isinstance(other, Enclosure):
+            return False
+        return self.__enclosure_id == other.__enclosure_id
+
+    def __hash__(self) -> int:
+        """Return a hash based on the unique enclosure_id, so enclosures can be used in sets and dicts."""
+        return hash(self.__enclosure_id)
+
@@ -6,18 +6,96 @@ ID: 110481368
 Username: SIDAY032
 This is my own work as defined by the University's Academic Integrity Policy.
 """
+import re
+from datetime import date
+from enum import IntEnum
+
+# Dates must be written exactly as YYYY-MM-DD (date.fromisoformat alone also accepts e.g. '20251110')
+_ISO_DATE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# Pool of issue and treatment text shared between health records. The pool keeps its strings
+# alive, so it is bounded: once it holds _TEXT_POOL_LIMIT entries it is cleared and starts again.
+# Records keep the strings they already share, and text that only becomes common later is
+# still pooled in the next round.
+_TEXT_POOL = {}
+_TEXT_POOL_LIMIT = 10_000
+
+
+def _pooled(text: str) -> str:
+    """Return the pooled copy of text, adding it to the pool (clearing a full pool first)."""
+    pooled = _TEXT_POOL.get(text)
+    if pooled is not None:
+        return pooled
+    if len(_TEXT_POOL) >= _TEXT_POOL_LIMIT:
+        _TEXT_POOL.clear()
+    _TEXT_POOL[text] = text
+    return text
+
+
+class Severity(IntEnum):
+    """
+    Severity of a health issue, ordered by rank so levels can be compared
+    (e.g. record.severity >= Severity.HIGH).
+    """
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+    @classmethod
+    def parse(cls, value) -> 'Severity':
+        """
+        Convert a case-insensitive level name (e.g. 'High') or a Severity into a Severity.
+
+        Raises:
+            TypeError: If value is neither a string nor a Severity.
+            ValueError: If value is not a valid level name.
+        """
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, str):
+            raise TypeError('Severity level must be a string.')
+        level = cls.__members__.get(value.upper())
+        if level is None:
+            raise ValueError(f'Severity level must be one of: {", ".join(HealthRecord.VALID_SEVERITY_LEVELS)}')
+        return level
+
+    def get_is_critical(self) -> bool:
+        """Return True for the levels that count as critical (High and Critical)."""
+        return self >= Severity.HIGH
+
+    is_critical = property(get_is_critical)  # Read only
+
+
+# Shared copies of the usual spellings of each severity level (e.g. 'high', 'High', 'HIGH')
+_SEVERITY_TEXT = {text: text for level in Severity
+                  for text in (level.name.lower(), level.name.capitalize(), level.name)}
+
+
 class HealthRecord:
     """
     The health record class stores information about a specific health issue
     or treatment for an animal.
      Attributes:
         __issue (str): Description of the health issue.
-        __date_reported (str): Date the issue was reported.
-        __severity_level (str): Severity level of the issue (e.g., Low, Medium, High, Critical).
+        __date_reported (str): Date the issue was reported, as given (YYYY-MM-DD).
+        __date_ordinal (int): The reported date as a proleptic Gregorian ordinal, parsed once for sorting and range queries.
+        __severity_level (str): Severity level of the issue as given, for display (e.g., Low, Medium, High, Critical).
+        __severity (Severity): The parsed severity level, used for comparisons.
         __treatment_plan (str): Treatment plan or notes for the issue.
+        _animal (Animal): The animal this record has been added to (None until added).
+
+    Issue and treatment text is taken from a bounded module-level pool, and the usual severity
+    spellings from fixed constants, so records that repeat the same text (e.g. 'Routine checkup')
+    share one string object instead of each holding a copy.
     """
+    # Fixed attribute layout (no per-instance __dict__) to keep large record archives compact.
+    # Private names are mangled in __slots__ just like in normal attribute access.
+    __slots__ = ('_animal', '__issue', '__date_reported', '__date_ordinal', '__severity_level',
+                 '__severity', '__treatment_plan')
+
     # Class level constant
-    VALID_SEVERITY_LEVELS = ('low', 'medium', 'high', 'critical')
+    VALID_SEVERITY_LEVELS = tuple(level.name.lower() for level in Severity)
 
 # ============================== Constructor ============================================================================
     def __init__(self, issue: str, date_reported: str, severity_level: str, treatment_plan: str) -> None:
@@ -26,10 +104,13 @@ class HealthRecord:
 
         Args:
             issue (str): Description of the health issue.
-            date_reported (str): Date the issue was reported.
-            severity_level (str): Severity level of the issue.
+            date_reported (str): Date the issue was reported (YYYY-MM-DD).
+            severity_level (str | Severity): Severity level of the issue (case-insensitive).
             treatment_plan (str): Treatment plan for the issue.
         """
+        # The owning animal is set by Animal.add_health_record
+        self._animal = None
+
         # Use property setters for validation
         self.issue = issue
         self.date_reported = date_reported
@@ -45,10 +126,27 @@ class HealthRecord:
         """Return the date the issue was reported."""
         return self.__date_reported
 
+    def get_date_ordinal(self) -> int:
+        """Return the reported date as an ordinal (see datetime.date.toordinal)."""
+        return self.__date_ordinal
+
+    def get_key(self) -> tuple:
+        """
+        Return the identity key (issue, date ordinal, severity) used for equality and hashing.
+
+        The parsed date is used rather than the date text, so ' 2025-11-10' and '2025-11-10'
+        are the same day.
+        """
+        return self.__issue, self.__date_ordinal, self.__severity
+
     def get_severity_level(self) -> str:
-        """Return the severity level."""
+        """Return the severity level as it was given."""
         return self.__severity_level
 
+    def get_severity(self) -> Severity:
+        """Return the severity level as a Severity."""
+        return self.__severity
+
     def get_treatment_plan(self) -> str:
         """Return the current treatment plan."""
         return self.__treatment_plan
@@ -70,48 +168,75 @@ class HealthRecord:
             raise TypeError('Issue must be a string.')
         if issue.strip() == '':
             raise ValueError('Issue should not be empty.')
-        self.__issue = issue
+        old_key = self.__key_before_change()
+        self.__issue = _pooled(issue)
+        self.__key_changed(old_key)
 
     def set_date_reported(self, date_reported: str) -> None:
         """
         Set a new date for when the health issue was reported.
 
+        The date is parsed once here; the original string is kept for display.
+
         Args:
-            date_reported (str): New date to set.
+            date_reported (str): New date to set, in ISO format (YYYY-MM-DD).
 
         Raises:
             TypeError: If date_reported is not a string.
-            ValueError: If date_reported is empty.
+            ValueError: If date_reported is empty or not a valid date written as YYYY-MM-DD.
         """
         # Validate and set a new date
         if not isinstance(date_reported, str):
             raise TypeError('Date must be a string.')
         if date_reported.strip() == '':
             raise ValueError('Date should not be empty.')
+        date_ordinal = self.to_ordinal(date_reported)
+
+        old_ordinal = getattr(self, '_HealthRecord__date_ordinal', None)
+        old_key = self.__key_before_change()
         self.__date_reported = date_reported
+        self.__date_ordinal = date_ordinal
+        self.__key_changed(old_key)
+
+        # Let the owning animal keep its records in date order
+        if self._animal is not None and old_ordinal != date_ordinal:
+            self._animal._record_date_changed(self, old_ordinal)
 
     def set_severity_level(self, severity_level: str) -> None:
         """
         Set a new severity level for the health issue.
 
+        The level name is case-insensitive and is kept as given for display;
+        a Severity is displayed by its name (e.g. 'High').
+
         Args:
-            severity_level (str): New severity level to set.
+            severity_level (str | Severity): New severity level to set.
 
         Raises:
-            TypeError: If severity_level is not a string.
-            ValueError: If severity_level is empty.
+            TypeError: If severity_level is not a string or Severity.
+            ValueError: If severity_level is empty or not a valid level.
         """
         # Validate and set a new severity level
+        if isinstance(severity_level, Severity):
+            severity_level = severity_level.name.capitalize()
         if not isinstance(severity_level, str):
             raise TypeError('Severity level must be a string.')
         if severity_level.strip() == '':
             raise ValueError('Severity level should not be empty.')
 
         # Validate against allowed values
-        if severity_level.lower() not in self.VALID_SEVERITY_LEVELS:
-            raise ValueError(f'Severity level must be one of: {", ".join(self.VALID_SEVERITY_LEVELS)}')
+        severity = Severity.parse(severity_level)
 
-        self.__severity_level = severity_level
+        # Remember the old level so the owning animal can update its counter and the zoo its indexes
+        old_severity = getattr(self, '_HealthRecord__severity', None)
+        old_key = self.__key_before_change()
+        self.__severity_level = _SEVERITY_TEXT.get(severity_level, severity_level)
+        self.__severity = severity
+        self.__key_changed(old_key)
+
+        # Let the owning animal (and through it, the zoo) know the severity changed
+        if self._animal is not None and severity != old_severity:
+            self._animal._record_severity_changed(self, old_severity)
 
     def set_treatment_plan(self, treatment_plan: str) -> None:
         """
@@ -129,13 +254,56 @@ class HealthRecord:
             raise TypeError('Treatment plan must be a string.')
         if treatment_plan.strip() == '':
             raise ValueError('Treatment plan should not be empty.')
-        self.__treatment_plan = treatment_plan
+        self.__treatment_plan = _pooled(treatment_plan)
 
 # =========================== Properties =============================================================
     issue = property(get_issue, set_issue)
     date_reported = property(get_date_reported, set_date_reported)
     severity_level = property(get_severity_level, set_severity_level)
+    severity = property(get_severity)  # Read only, follows severity_level
     treatment_plan = property(get_treatment_plan, set_treatment_plan)
+    date_ordinal = property(get_date_ordinal)  # Read only, follows date_reported
+    key = property(get_key)  # Read only
+
+# =========================== Key Tracking ==========================================================
+    # The owning animal keeps a set of record keys for fast duplicate checks,
+    # so it is told whenever one of the key fields changes
+    def __key_before_change(self):
+        """Return the current key if an animal tracks it, otherwise None."""
+        return self.get_key() if self._animal is not None else None
+
+    def __key_changed(self, old_key) -> None:
+        """Tell the owning animal that the key changed from old_key."""
+        if old_key is not None and old_key != self.get_key():
+            self._animal._record_key_changed(self, old_key)
+
+# =========================== Date Conversion =======================================================
+    @staticmethod
+    def to_ordinal(value) -> int:
+        """
+        Convert an ISO date string (YYYY-MM-DD) or a datetime.date into a date ordinal.
+
+        Args:
+            value (str | date): The date to convert.
+
+        Raises:
+            TypeError: If value is neither a string nor a date.
+            ValueError: If the string is not a valid date written as YYYY-MM-DD.
+
+        Returns:
+            int: The date's proleptic Gregorian ordinal.
+        """
+        if isinstance(value, date):
+            return value.toordinal()
+        if not isinstance(value, str):
+            raise TypeError('Date must be a string or a datetime.date.')
+        text = value.strip()
+        try:
+            if not _ISO_DATE.fullmatch(text):
+                raise ValueError
+            return date.fromisoformat(text).toordinal()
+        except ValueError:
+            raise ValueError(f'Date must be a valid date in YYYY-MM-DD format, got "{value}".') from None
 
 # =========================== Methods ===============================================================
     def update_treatment(self, new_plan: str) -> str:
@@ -167,11 +335,16 @@ class HealthRecord:
         Updates the severity level of this record.
 
         Args:
-            new_level (str): New severity level.
+            new_level (str | Severity): New severity level.
 
         Returns:
             str: Confirmation message after updating.
         """
+        # Levels can be given as a Severity directly
+        if isinstance(new_level, Severity):
+            self.severity_level = new_level
+            return f'Severity level updated: {self.severity_level}'
+
         # Ensure the new severity level is a string
         if not isinstance(new_level, str):
             raise TypeError('The severity level must be a string.')
@@ -203,8 +376,8 @@ class HealthRecord:
         Returns:
             bool: True if severity is 'High' or 'Critical', False otherwise.
         """
-        # Check if the severity level is critical (High or Critical)
-        return self.severity_level.lower() in ('high', 'critical')
+        # Check if the severity level is critical (High or Critical) by rank
+        return self.__severity.is_critical
 
 
     def __str__(self) -> str:
@@ -232,6 +405,13 @@ class HealthRecord:
         """
         if not isinstance(other, HealthRecord):
             return False
-        return (self.issue == other.issue and
-                self.date_reported == other.date_reported and
-                self.severity_level == other.severity_level)
\ No newline at end of file
+        return self.get_key() == other.get_key()
+
+    def __hash__(self) -> int:
+        """
+        Hash based on the same key attributes as __eq__.
+
+        The hash changes if the issue, date or severity is changed, so do not change
+        those fields while the record is stored in a set or used as a dict key.
+        """
+        return hash(self.get_key())
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+File: health_timeline.py
+Description: This module defines the HealthTimeline class, a date-ordered index of
+health events (animal, health record) used by the zoo for time-based health queries.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+from bisect import bisect_left, bisect_right
+
+
+class HealthTimeline:
+    """
+    Health events kept sorted by the date they were reported.
+
+    Each event is an (animal, record) pair. The events are stored alongside a parallel
+    list of date ordinals, so date lookups are binary searches over plain integers and a
+    date range is returned as a single slice. Events from the same day keep the order in
+    which they were added.
+
+    Attributes:
+        __ordinals (list): Date ordinal of each event, in ascending order.
+        __events (list): (animal, record) pairs, in the same order as __ordinals.
+    """
+    __slots__ = ('__ordinals', '__events')
+
+    def __init__(self) -> None:
+        """Initialize an empty timeline."""
+        self.__ordinals = []
+        self.__events = []
+
+# ============================ Updates ============================================================
+    def add(self, animal, record, ordinal: int) -> None:
+        """
+        Add an event after any events from the same day.
+
+        Args:
+            animal (Animal): The animal the record belongs to.
+            record (HealthRecord): The health record.
+            ordinal (int): The record's date ordinal.
+        """
+        position = bisect_right(self.__ordinals, ordinal)
+        self.__ordinals.insert(position, ordinal)
+        self.__events.insert(position, (animal, record))
+
+    def remove(self, record, ordinal: int) -> None:
+        """
+        Remove the event for a record, if present.
+
+        Args:
+            record (HealthRecord): The health record to remove.
+            ordinal (int): The date ordinal the record was added with.
+        """
+        # Only events from that day need to be searched
+        low = bisect_left(self.__ordinals, ordinal)
+        high = bisect_right(self.__ordinals, ordinal, low)
+        for position in range(low, high):
+            if self.__events[position][1] is record:
+                del self.__ordinals[position]
+                del self.__events[position]
+                return
+
+# ============================ Queries ============================================================
+    def between(self, start_ordinal: int, end_ordinal: int) -> list:
+        """
+        Return the events reported between two date ordinals, inclusive.
+
+        Returns:
+            list: (animal, record) pairs, oldest first.
+        """
+        low = bisect_left(self.__ordinals, start_ordinal)
+        high = bisect_right(self.__ordinals, end_ordinal, low)
+        return self.__events[low:high]
+
+    def latest(self, count: int) -> list:
+        """
+        Return the most recently reported events.
+
+        Args:
+            count (int): Maximum number of events to return.
+
+        Returns:
+            list: Up to count (animal, record) pairs, newest first.
+        """
+        if count <= 0:
+            return []
+        return self.__events[:-count - 1:-1]
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self.__events)
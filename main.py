@@ -136,21 +136,21 @@ def demonstrate_zoo_operations(zoo, animals, enclosures, staff_list):
     for animal in animals:
         result = zoo.add_animal(animal)
         print(result)
-    print(f'\n* Total animals in zoo: {len(zoo.animals)}')
+    print(f'\n* Total animals in zoo: {zoo.count_animals()}')
 
     # Add all enclosures to zoo
     print('\n--- Adding enclosures to zoo ---')
     for enclosure in enclosures:
         result = zoo.add_enclosure(enclosure)
         print(result)
-    print(f'\n* Total enclosures in zoo: {len(zoo.enclosures)}')
+    print(f'\n* Total enclosures in zoo: {zoo.count_enclosures()}')
 
     # Add all staff to zoo
     print('\n--- Adding staff to zoo ---')
     for staff_member in staff_list:
         result = zoo.add_staff(staff_member)
         print(result)
-    print(f'\n* Total staff in zoo: {len(zoo.staff)}')
+    print(f'\n* Total staff in zoo: {zoo.count_staff()}')
 
 # ============================ STEP 6: ASSIGN ANIMALS TO ENCLOSURES ===============================
 def demonstrate_animal_enclosure_assignment(zoo, animals, enclosures):
@@ -404,9 +404,9 @@ def print_final_statistics(zoo):
 
     # Print final statistics
     print(f'\nFinal Zoo Statistics:')
-    print(f'  Animals: {len(zoo.animals)}')
-    print(f'  Enclosures: {len(zoo.enclosures)}')
-    print(f'  Staff: {len(zoo.staff)}')
+    print(f'  Animals: {zoo.count_animals()}')
+    print(f'  Enclosures: {zoo.count_enclosures()}')
+    print(f'  Staff: {zoo.count_staff()}')
     print(f'  Animals with critical health: {len(zoo.list_animals_with_critical_health())}')
 
     print('\n' + '=' * 70)
@@ -424,9 +424,9 @@ def main():
     print_section('Creating the Zoo')
     taronga_zoo = Zoo('Taronga Zoo')
     print(f'* Created: {taronga_zoo.name}')
-    print(f'  Initial animals: {len(taronga_zoo.animals)}')
-    print(f'  Initial enclosures: {len(taronga_zoo.enclosures)}')
-    print(f'  Initial staff: {len(taronga_zoo.staff)}')
+    print(f'  Initial animals: {taronga_zoo.count_animals()}')
+    print(f'  Initial enclosures: {taronga_zoo.count_enclosures()}')
+    print(f'  Initial staff: {taronga_zoo.count_staff()}')
 
     # Create animals and demonstrate polymorphism
     animals = demonstrate_animal_creation()
@@ -0,0 +1,167 @@
+"""
+File: placement.py
+Description: This module defines the PlacementEngine class, which places a whole batch of
+animals into compatible enclosures of a zoo while keeping enclosure sizes balanced.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+import heapq
+
+from animal import Animal
+from enclosure import Enclosure
+from zoo import Zoo
+
+
+class PlacementResult:
+    """
+    Outcome of a batch placement.
+
+    Attributes:
+        __placements (list): (animal, enclosure) pairs for every animal that was placed.
+        __unplaceable (list): (animal, reason) pairs for every animal that could not be placed.
+    """
+
+    def __init__(self, placements: list, unplaceable: list) -> None:
+        """
+        Initialize a new PlacementResult.
+
+        Args:
+            placements (list): (animal, enclosure) pairs, in placement order.
+            unplaceable (list): (animal, reason) pairs, in batch order.
+        """
+        self.__placements = placements
+        self.__unplaceable = unplaceable
+
+    def get_placements(self) -> list:
+        """Return a copy of the (animal, enclosure) pairs that were placed."""
+        return list(self.__placements)
+
+    def get_unplaceable(self) -> list:
+        """Return a copy of the (animal, reason) pairs that could not be placed."""
+        return list(self.__unplaceable)
+
+    placements = property(get_placements)  # Read-only copy
+    unplaceable = property(get_unplaceable)  # Read-only copy
+
+    def __str__(self) -> str:
+        """Return a short summary, listing every animal that could not be placed."""
+        lines = [f'{len(self.__placements)} animals placed, {len(self.__unplaceable)} could not be placed.']
+        for animal, reason in self.__unplaceable:
+            lines.append(f'  - {animal.name} the {animal.species}: {reason}')
+        return '\n'.join(lines)
+
+
+class PlacementEngine:
+    """
+    Places batches of animals into the enclosures of a zoo.
+
+    Each animal goes to the compatible enclosure (matching animal type and environment)
+    that currently holds the fewest animals, so enclosures fill up evenly. Compatible
+    enclosures come from the zoo's placement index and are kept in a min-heap keyed by
+    animal count, so a batch of n animals over m enclosures takes O(n log m).
+
+    Attributes:
+        __zoo (Zoo): The zoo whose animals and enclosures are used.
+    """
+
+    # Reasons reported for animals that cannot be placed
+    CRITICAL_HEALTH = 'has critical health issues and cannot be moved'
+    NO_ENCLOSURE = 'no compatible enclosure'
+
+# ============================ Constructor ========================================================
+    def __init__(self, zoo: Zoo) -> None:
+        """
+        Initialize a new PlacementEngine.
+
+        Args:
+            zoo (Zoo): The zoo to place animals in.
+
+        Raises:
+            TypeError: If zoo is not a Zoo instance.
+        """
+        # Validate type
+        if not isinstance(zoo, Zoo):
+            raise TypeError('zoo must be a Zoo instance.')
+        self.__zoo = zoo
+
+    def get_zoo(self) -> Zoo:
+        """Return the zoo this engine places animals in."""
+        return self.__zoo
+
+    zoo = property(get_zoo)  # Read only
+
+# ============================ Placement ==========================================================
+    def place_animals(self, animals) -> PlacementResult:
+        """
+        Places every unhoused animal of a batch into a compatible enclosure.
+
+        The batch is validated before anything moves. Animals that are already in an
+        enclosure are left where they are. Animals that cannot be moved, or for which
+        the zoo has no compatible enclosure, are reported instead of raising.
+
+        Args:
+            animals (iterable): The Animal objects to place. They must already be in the zoo.
+
+        Raises:
+            TypeError: If any item is not an Animal instance.
+            ValueError: If an animal appears twice in the batch or is not in the zoo.
+
+        Returns:
+            PlacementResult: The placements made and the animals that could not be placed.
+        """
+        batch = {}
+        for animal in animals:
+            # Validate that animal is an Animal instance
+            if not isinstance(animal, Animal):
+                raise TypeError('Only Animal objects can be placed.')
+            # Check for duplicates inside the batch
+            if animal.animal_id in batch:
+                raise ValueError(f'{animal.name} the {animal.species} appears twice in the batch.')
+            # enclosure_of raises ValueError for animals that are not in the zoo
+            if self.__zoo.enclosure_of(animal) is None:
+                batch[animal.animal_id] = animal
+
+        placements = []
+        unplaceable = []
+        # One heap per (environment, animal class), shared by every animal with that key
+        heaps = {}
+        for animal in batch.values():
+            if not animal.can_be_moved():
+                unplaceable.append((animal, self.CRITICAL_HEALTH))
+                continue
+
+            key = (animal.environment, type(animal))
+            heap = heaps.get(key)
+            if heap is None:
+                heap = [(enclosure.count_animals(), enclosure.enclosure_id, enclosure)
+                        for enclosure in self.__zoo.find_compatible_enclosures(animal)]
+                heapq.heapify(heap)
+                heaps[key] = heap
+            if not heap:
+                unplaceable.append((animal, self.NO_ENCLOSURE))
+                continue
+
+            enclosure = self.__pop_least_full(heap)
+            self.__zoo.assign_animal_to_enclosure(animal, enclosure)
+            heapq.heappush(heap, (enclosure.count_animals(), enclosure.enclosure_id, enclosure))
+            placements.append((animal, enclosure))
+
+        return PlacementResult(placements, unplaceable)
+
+    @staticmethod
+    def __pop_least_full(heap: list) -> Enclosure:
+        """
+        Pop the enclosure with the fewest animals from a heap of (count, enclosure_id, enclosure).
+
+        An enclosure can sit in several heaps (e.g. one for Mammal and one for Animal), so a
+        stored count may be out of date. Counts only grow during placement, so a stale entry
+        is pushed back with its current count and the next smallest is tried.
+        """
+        while True:
+            count, enclosure_id, enclosure = heapq.heappop(heap)
+            current = enclosure.count_animals()
+            if current == count:
+                return enclosure
+            heapq.heappush(heap, (current, enclosure_id, enclosure))
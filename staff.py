@@ -9,6 +9,7 @@ This is my own work as defined by the University's Academic Integrity Policy.
 """
 from abc import ABC, abstractmethod
 from animal import Animal, Mammal
+from collection_view import ReadOnlyView
 from enclosure import Enclosure
 from health_record import HealthRecord
 
@@ -24,8 +25,9 @@ class Staff(ABC):
         _name (str): Staff member's name.
         __staff_id (int): Unique staff ID (private).
         _role (str): Staff role, e.g., 'Zookeeper' or 'Veterinarian'.
-        _assigned_animals (list): List of Animal instances assigned to the staff member.
-        _assigned_enclosures (list): List of Enclosure instances assigned to the staff member.
+        _assigned_animals (dict): Animals assigned to the staff member, keyed by animal_id (insertion-ordered).
+        _assigned_enclosures (dict): Enclosures assigned to the staff member, keyed by enclosure_id (insertion-ordered).
+        _zoo (Zoo): The zoo this staff member currently works at (None if not in a zoo).
     """
 # ====================== Class level constants ================================================
     # Maximum number of animals a staff member can manage
@@ -43,14 +45,17 @@ class Staff(ABC):
             staff_id (int): Unique staff ID.
             role (str): Role of the staff member.
         """
+        # The owning zoo is set by Zoo.add_staff so it can keep its indexes up to date
+        self._zoo = None
+
         # Basic staff information
         self.name = name
         self.__staff_id = staff_id
         self.role = role
 
-        # Containers for assigned responsibilities
-        self._assigned_animals = []
-        self._assigned_enclosures = []
+        # Containers for assigned responsibilities, keyed by ID so assignment checks are O(1)
+        self._assigned_animals = {}
+        self._assigned_enclosures = {}
 # ======================= Getters =====================================================
     # Return the current value of each staff attribute
     def get_name(self) -> str:
@@ -65,13 +70,21 @@ class Staff(ABC):
         """Return the staff member's role."""
         return self._role
 
-    def get_assigned_animals(self) -> list[Animal]:
-        """Return a copy of the list of assigned animals."""
-        return list(self._assigned_animals)
+    def get_assigned_animals(self) -> ReadOnlyView:
+        """Return a read-only view of the assigned animals (no copy is made)."""
+        return ReadOnlyView(self._assigned_animals, Animal.get_animal_id)
+
+    def get_assigned_enclosures(self) -> ReadOnlyView:
+        """Return a read-only view of the assigned enclosures (no copy is made)."""
+        return ReadOnlyView(self._assigned_enclosures, Enclosure.get_enclosure_id)
+
+    def count_assigned_animals(self) -> int:
+        """Return the number of animals assigned to the staff member."""
+        return len(self._assigned_animals)
 
-    def get_assigned_enclosures(self) -> list[Enclosure]:
-        """Return a copy of the list of assigned enclosures."""
-        return list(self._assigned_enclosures)
+    def count_assigned_enclosures(self) -> int:
+        """Return the number of enclosures assigned to the staff member."""
+        return len(self._assigned_enclosures)
 
 # ====================== Setters =======================================================
     # Validate and set new values for staff attributes
@@ -105,15 +118,20 @@ class Staff(ABC):
         # Validate not empty
         if role.strip() == '':
             raise ValueError('Role cannot be an empty string.')
+        old_role = getattr(self, '_role', None)
         self._role = role
 
+        # Let the owning zoo update its role index
+        if self._zoo is not None:
+            self._zoo._staff_role_changed(self, old_role)
+
 # ====================== Properties ======================================================
     # Define properties for attribute access
     name = property(get_name, set_name)
     staff_id = property(get_staff_id)    # Read only
     role = property(get_role, set_role)
-    assigned_animals = property(get_assigned_animals)  # Read only copy
-    assigned_enclosures = property(get_assigned_enclosures) # Read only copy
+    assigned_animals = property(get_assigned_animals)  # Read only view
+    assigned_enclosures = property(get_assigned_enclosures) # Read only view
 
 # ====================== Methods ===========================================================
     # Methods for assigning animals and enclosures to staff members
@@ -136,17 +154,47 @@ class Staff(ABC):
             raise TypeError('Animal must be an Animal instance.')
 
         # Avoid duplicate assignment
-        if animal in self._assigned_animals:
+        if animal.animal_id in self._assigned_animals:
             raise ValueError(f'{animal.name} the {animal.species} is already assigned.')
 
         # Enforce maximum animals limit
         if len(self._assigned_animals) >= self.MAX_ANIMALS_PER_STAFF:
             raise ValueError('Cannot assign more animals to this staff member.')
 
-        # Assign the animal
-        self._assigned_animals.append(animal)
+        # Assign the animal and update the owning zoo's animal -> staff index
+        self._assigned_animals[animal.animal_id] = animal
+        if self._zoo is not None:
+            self._zoo._staff_assigned_animal(self, animal)
         return f'{animal.name} the {animal.species} has been assigned to {self.name}.'
 
+    def unassign_animal(self, animal: Animal) -> str:
+        """
+        Removes an Animal instance from the staff member's assignments.
+
+        Args:
+            animal (Animal): The animal to unassign.
+
+        Raises:
+            TypeError: If the argument is not an Animal instance.
+            ValueError: If the animal is not assigned to this staff member.
+
+        Returns:
+            str: Confirmation message after unassignment.
+        """
+        # Ensure only Animal instances are unassigned
+        if not isinstance(animal, Animal):
+            raise TypeError('Animal must be an Animal instance.')
+
+        # Check the animal is actually assigned
+        if animal.animal_id not in self._assigned_animals:
+            raise ValueError(f'{animal.name} the {animal.species} is not assigned to {self.name}.')
+
+        # Unassign the animal and update the owning zoo's animal -> staff index
+        del self._assigned_animals[animal.animal_id]
+        if self._zoo is not None:
+            self._zoo._staff_unassigned_animal(self, animal)
+        return f'{animal.name} the {animal.species} has been unassigned from {self.name}.'
+
     def assign_enclosure(self, enclosure: Enclosure) -> str:
         """
         Assigns an Enclosure instance to the staff member.
@@ -166,17 +214,47 @@ class Staff(ABC):
             raise TypeError('Enclosure must be an Enclosure instance.')
 
         # Avoid duplicate assignment
-        if enclosure in self._assigned_enclosures:
+        if enclosure.enclosure_id in self._assigned_enclosures:
             raise ValueError(f'{enclosure.environmental_type} enclosure is already assigned.')
 
         # Ensure maximum enclosure limit
         if len(self._assigned_enclosures) >= self.MAX_ENCLOSURES_PER_STAFF:
             raise ValueError('Cannot assign more enclosures to this staff member.')
 
-        # Assign the enclosure
-        self._assigned_enclosures.append(enclosure)
+        # Assign the enclosure and update the owning zoo's enclosure -> staff index
+        self._assigned_enclosures[enclosure.enclosure_id] = enclosure
+        if self._zoo is not None:
+            self._zoo._staff_assigned_enclosure(self, enclosure)
         return f'{enclosure.environmental_type} enclosure has been assigned to {self.name}.'
 
+    def unassign_enclosure(self, enclosure: Enclosure) -> str:
+        """
+        Removes an Enclosure instance from the staff member's assignments.
+
+        Args:
+            enclosure (Enclosure): The enclosure to unassign.
+
+        Raises:
+            TypeError: If the argument is not an Enclosure instance.
+            ValueError: If the enclosure is not assigned to this staff member.
+
+        Returns:
+            str: Confirmation message after unassignment.
+        """
+        # Ensure only Enclosure instances are unassigned
+        if not isinstance(enclosure, Enclosure):
+            raise TypeError('Enclosure must be an Enclosure instance.')
+
+        # Check the enclosure is actually assigned
+        if enclosure.enclosure_id not in self._assigned_enclosures:
+            raise ValueError(f'{enclosure.environmental_type} enclosure is not assigned to {self.name}.')
+
+        # Unassign the enclosure and update the owning zoo's enclosure -> staff index
+        del self._assigned_enclosures[enclosure.enclosure_id]
+        if self._zoo is not None:
+            self._zoo._staff_unassigned_enclosure(self, enclosure)
+        return f'{enclosure.environmental_type} enclosure has been unassigned from {self.name}.'
+
 # ================================ Abstract Method ===============================================
     # This method must be implemented by all subclasses
     @abstractmethod
@@ -199,9 +277,9 @@ class Staff(ABC):
             - List of assigned enclosures (or 'None')
         """
         # Generate human-readable summary of staff and assignments
-        animal_list = ', '.join([f'{a.name} ({a.species})' for a in self._assigned_animals]) \
+        animal_list = ', '.join([f'{a.name} ({a.species})' for a in self._assigned_animals.values()]) \
                     if self._assigned_animals else 'None'
-        enclosure_list = ', '.join([f'{e.environmental_type} enclosure' for e in self._assigned_enclosures]) \
+        enclosure_list = ', '.join([f'{e.environmental_type} enclosure' for e in self._assigned_enclosures.values()]) \
                     if self._assigned_enclosures else 'None'
 
         return (f'Staff Name: {self._name}\n'
@@ -226,6 +304,10 @@ class Staff(ABC):
             return False
         return self.__staff_id == other.__staff_id
 
+    def __hash__(self) -> int:
+        """Return a hash based on the unique staff_id, consistent with __eq__."""
+        return hash(self.__staff_id)
+
 
 
 class Zookeeper(Staff):
@@ -264,7 +346,7 @@ class Zookeeper(Staff):
             raise TypeError('Animal must be an Animal instance.')
 
         # Check if this animal is assigned to this zookeeper
-        if animal not in self._assigned_animals:
+        if animal.animal_id not in self._assigned_animals:
             raise ValueError(f'{animal.name} the {animal.species} is not assigned to {self.name}.')
 
         # Return a message confirming the feeding action
@@ -289,7 +371,7 @@ class Zookeeper(Staff):
             raise TypeError('Enclosure must be an Enclosure instance.')
 
         # Check if this enclosure is assigned to this zookeeper
-        if enclosure not in self._assigned_enclosures:
+        if enclosure.enclosure_id not in self._assigned_enclosures:
             raise ValueError(f'{enclosure.environmental_type} enclosure is not assigned to {self.name}.')
         # Clean the enclosure by calling the clean enclosure method from enclosure class
         cleaning_result = enclosure.clean_enclosure()
@@ -306,10 +388,10 @@ class Zookeeper(Staff):
             str: Summary of performed duties.
         """
         # Prepare a readable list of animals and enclosures handled by the zookeeper
-        fed_animals = ', '.join([f'{a.name} ({a.species})' for a in self._assigned_animals]) \
+        fed_animals = ', '.join([f'{a.name} ({a.species})' for a in self._assigned_animals.values()]) \
             if self._assigned_animals else 'None'
 
-        clean_enclosures = ', '.join([f'{e.environmental_type} enclosure' for e in self._assigned_enclosures]) \
+        clean_enclosures = ', '.join([f'{e.environmental_type} enclosure' for e in self._assigned_enclosures.values()]) \
             if self._assigned_enclosures else 'None'
 
         # Return a summary of tasks completed
@@ -354,7 +436,7 @@ class Veterinarian(Staff):
             raise TypeError('Animal must be an Animal instance.')
 
         # Ensure the veterinarian is assigned to this animal
-        if animal not in self._assigned_animals:
+        if animal.animal_id not in self._assigned_animals:
             raise ValueError(f'{animal.name} the {animal.species} is not assigned to {self.name}.')
 
         # Return a confirmation string
@@ -380,7 +462,7 @@ class Veterinarian(Staff):
             raise TypeError('Animal must be an Animal instance.')
 
         # Ensure the veterinarian is assigned to this animal
-        if animal not in self._assigned_animals:
+        if animal.animal_id not in self._assigned_animals:
             raise ValueError(f'{animal.name} the {animal.species} is not assigned to {self.name}.')
 
         # Ensure that health_record is a HealthRecord instance
@@ -402,12 +484,12 @@ class Veterinarian(Staff):
             str: Summary of performed duties.
         """
         # Prepare a comma-separated list of assigned animals
-        animals_list = ', '.join([f'{a.name} ({a.species})' for a in self._assigned_animals]) \
+        animals_list = ', '.join([f'{a.name} ({a.species})' for a in self._assigned_animals.values()]) \
             if self._assigned_animals else 'None'
 
         # Collect all health records for assigned animals into a summary
         records_list = []
-        for a in self._assigned_animals:
+        for a in self._assigned_animals.values():
             for r in a.display_health_records():  # Retrieve health records
                 records_list.append(f'{a.name}: {r.summary()}')  # Append summary of each record
         records_summary = '; '.join(records_list) if records_list else 'None'
@@ -10,6 +10,8 @@ This is my own work as defined by the University's Academic Integrity Policy.
 """
 
 
+from datetime import date
+
 import pytest
 from animal import Animal, Mammal, Reptile, Bird
 from health_record import HealthRecord
@@ -172,6 +174,40 @@ def test_duplicate_health_record(lion):
     assert 'Health record added to Simba.' in msg1
     assert 'Record already exists for Simba' in msg2
 
+def test_duplicate_health_record_equal_copy(lion):
+    """A different record with the same issue, date and severity counts as a duplicate."""
+    lion.add_health_record(HealthRecord('Vaccinated', '2025-11-09', 'Low', 'Routine check'))
+    msg = lion.add_health_record(HealthRecord('Vaccinated', '2025-11-09', 'Low', 'Other notes'))
+    assert 'Record already exists for Simba' in msg
+    assert len(lion.display_health_records()) == 1
+
+def test_duplicate_health_record_same_day_other_text(lion):
+    """A record for the same day written with surrounding spaces still counts as a duplicate."""
+    lion.add_health_record(HealthRecord('Vaccinated', '2025-11-09', 'Low', 'Routine check'))
+    msg = lion.add_health_record(HealthRecord('Vaccinated', ' 2025-11-09 ', 'Low', 'Routine check'))
+    assert 'Record already exists for Simba' in msg
+
+def test_duplicate_check_follows_record_edits(lion):
+    """Editing a record's issue, date or severity updates the duplicate check."""
+    rec = HealthRecord('Vaccinated', '2025-11-09', 'Low', 'Routine check')
+    lion.add_health_record(rec)
+
+    # After the edit the old details are free again and the new ones are taken
+    rec.issue = 'Dewormed'
+    rec.date_reported = '2025-11-10'
+    rec.severity_level = 'Medium'
+    assert 'Health record added' in lion.add_health_record(HealthRecord('Vaccinated', '2025-11-09', 'Low', 'Routine'))
+    assert 'already exists' in lion.add_health_record(HealthRecord('Dewormed', '2025-11-10', 'Medium', 'Routine'))
+
+def test_health_record_belongs_to_one_animal(lion):
+    """A HealthRecord already added to one animal cannot be added to another."""
+    other = Mammal('Nala', 'Lion', 4, 'Carnivore', 'Savannah', 'Roar', 'Tan', 'Warm-blooded')
+    rec = HealthRecord('Vaccinated', '2025-11-09', 'Low', 'Routine check')
+    lion.add_health_record(rec)
+    with pytest.raises(ValueError):
+        other.add_health_record(rec)
+    assert other.display_health_records() == []
+
 def test_has_critical_health_issues(lion):
     """Check has_critical_health_issues detects critical records correctly."""
     # No records → not critical
@@ -187,6 +223,29 @@ def test_has_critical_health_issues(lion):
     lion.add_health_record(rec2)
     assert lion.has_critical_health_issues() is True
 
+def test_critical_health_follows_severity_updates(lion):
+    """has_critical_health_issues and can_be_moved follow severity changes on existing records."""
+    rec1 = HealthRecord('Injury', '2025-11-10', 'Critical', 'Immediate attention')
+    rec2 = HealthRecord('Surgery', '2025-11-11', 'High', 'Monitor')
+    lion.add_health_record(rec1)
+    lion.add_health_record(rec2)
+    assert lion.can_be_moved() is False
+
+    # Still critical while one of the two records is High or Critical
+    rec1.update_severity('Low')
+    assert lion.has_critical_health_issues() is True
+
+    # Downgrading the last critical record clears the flag
+    rec2.severity_level = 'medium'
+    assert lion.has_critical_health_issues() is False
+    assert lion.can_be_moved() is True
+
+    # Changing between two critical levels keeps the count correct
+    rec1.update_severity('High')
+    rec1.update_severity('critical')
+    rec1.update_severity('low')
+    assert lion.has_critical_health_issues() is False
+
 def test_can_be_moved(lion):
     """Verify can_be_moved returns False if there are critical health issues."""
     # Initially no records, safe to move
@@ -220,6 +279,55 @@ def test_display_health_records_nonempty(lion):
     assert rec1 in records
     assert rec2 in records
 
+def test_health_records_sorted_by_date(lion):
+    """Records are kept in date order, with same-day records in the order they were added."""
+    rec1 = HealthRecord('Checkup', '2025-11-10', 'Low', 'Routine check')
+    rec2 = HealthRecord('Vaccinated', '2025-11-01', 'Low', 'Routine check')
+    rec3 = HealthRecord('Limping', '2025-11-10', 'Medium', 'Rest')
+    for rec in (rec1, rec2, rec3):
+        lion.add_health_record(rec)
+    assert lion.display_health_records() == [rec2, rec1, rec3]
+
+    # Changing a date moves the record to its new position
+    rec2.date_reported = '2025-12-01'
+    assert lion.display_health_records() == [rec1, rec3, rec2]
+
+def test_records_between(lion):
+    """records_between returns the records in an inclusive date range."""
+    dates = ['2025-10-30', '2025-11-01', '2025-11-05', '2025-11-10', '2025-11-12']
+    records = [HealthRecord(f'Check {i}', day, 'Low', 'Routine') for i, day in enumerate(dates)]
+    for rec in reversed(records):
+        lion.add_health_record(rec)
+
+    assert lion.records_between('2025-11-01', '2025-11-10') == records[1:4]
+    assert lion.records_between(date(2025, 11, 6), date(2025, 11, 9)) == []
+    assert lion.records_between('2025-01-01', '2025-12-31') == records
+    assert lion.records_between('2025-11-12', '2025-11-12') == [records[4]]
+
+def test_records_between_invalid(lion):
+    """records_between rejects bad dates and reversed ranges."""
+    with pytest.raises(ValueError):
+        lion.records_between('2025-11-10', '2025-11-01')
+    with pytest.raises(ValueError):
+        lion.records_between('last week', '2025-11-01')
+    with pytest.raises(TypeError):
+        lion.records_between(None, '2025-11-01')
+
+# ==== Memory Layout Tests ====
+# Animals use __slots__ so no per-instance __dict__ is created
+def test_animals_use_slots(lion):
+    """Test that animals have no __dict__ but keep property validation."""
+    snake = Reptile('Python', 'Snake', 4, 'Carnivore', 'Jungle', 'Hiss', 'Scaly', 'Cold-blooded', True)
+    parrot = Bird('Polly', 'Parrot', 2, 'Seeds', 'Tropical', 'Squawk', 'Colorful', 'Warm-blooded', True)
+    for animal in (lion, snake, parrot):
+        assert not hasattr(animal, '__dict__')
+        # Unknown attributes cannot be added
+        with pytest.raises(AttributeError):
+            animal.nickname = 'Buddy'
+    # Validation still runs through the property setters
+    with pytest.raises(ValueError):
+        lion.age = -1
+
 # ==== String Method Test ====
 # Test that __str__ returns a formatted string containing all attributes
 def test_mammal_str(lion):
@@ -235,14 +343,36 @@ def test_mammal_str(lion):
     assert 'Blood type: Warm-blooded' in st
 
 # ==== Equality Tests ====
-# Test that __eq__ correctly identifies identical and different Mammal instances
+# Test that same_attributes correctly identifies identical and different Mammal instances
 def test_mammal_equality():
-    """Test __eq__ method for comparing two Mammals and differences in attributes."""
+    """Test same_attributes for comparing two Mammals and differences in attributes."""
     lion1 = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Long and thick', 'Warm-blooded')
     lion2 = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Long and thick', 'Warm-blooded')
     lion3 = Mammal('Leo', 'Lion', 4, 'Carnivore', 'Jungle', 'Roar', 'Short', 'Warm-blooded')
-    assert lion1 == lion2
-    assert lion1 != lion3
+    assert lion1.same_attributes(lion2)
+    assert not lion1.same_attributes(lion3)
+    assert not lion1.same_attributes('not a mammal')
+
+def test_mammal_identity_equality():
+    """Test that __eq__ and __hash__ use the unique animal_id."""
+    lion1 = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Long and thick', 'Warm-blooded')
+    lion2 = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Long and thick', 'Warm-blooded')
+    # Identical details are still two different animals
+    assert lion1.animal_id != lion2.animal_id
+    assert lion1 == lion1
+    assert lion1 != lion2
+    # Animals can be stored in sets and used as dictionary keys
+    assert len({lion1, lion2, lion1}) == 2
+    assert {lion1: 'a'}[lion1] == 'a'
+
+def test_animal_id_read_only(lion):
+    """Test that animal_id is read-only and stays the same after attribute changes."""
+    animal_id = lion.animal_id
+    lion.name = 'Leo'
+    assert lion.animal_id == animal_id
+    assert hash(lion) == hash(animal_id)
+    with pytest.raises(AttributeError):
+        lion.animal_id = 999
 
 def test_mammal_equality_with_different_type(lion):
     """Test that __eq__ returns False when comparing with non-Mammal object."""
@@ -466,12 +596,14 @@ def test_reptile_str(snake):
 # ==== Equality Tests ====
 # Verifies __eq__ behavior for identical and different Reptiles, and non-Reptile comparisons
 def test_reptile_equality():
-    """Test __eq__ for Reptile objects."""
+    """Test same_attributes and __eq__ for Reptile objects."""
     r1 = Reptile('Python', 'Snake', 4, 'Carnivore', 'Jungle', 'Hiss', 'Scaly', 'Cold-blooded', True)
     r2 = Reptile('Python', 'Snake', 4, 'Carnivore', 'Jungle', 'Hiss', 'Scaly', 'Cold-blooded', True)
     r3 = Reptile('Kobra', 'Snake', 3, 'Carnivore', 'Grasslands', 'Sss', 'Smooth', 'Cold-blooded', False)
-    assert r1 == r2
-    assert r1 != r3
+    assert r1.same_attributes(r2)
+    assert not r1.same_attributes(r3)
+    assert r1 != r2
+    assert r1 == r1
 
 def test_reptile_equality_with_different_type(snake):
     """Ensure Reptile __eq__ returns False when compared to non-Reptile object."""
@@ -686,12 +818,14 @@ def test_bird_str(parrot):
 # ==== Equality Tests ====
 # Verifies __eq__ behavior for identical and different Birds, and non-Bird comparisons
 def test_bird_equality():
-    """Test __eq__ for Bird objects."""
+    """Test same_attributes and __eq__ for Bird objects."""
     b1 = Bird('Polly', 'Parrot', 2, 'Seeds', 'Tropical', 'Squawk', 'Colorful', 'Warm-blooded', True)
     b2 = Bird('Polly', 'Parrot', 2, 'Seeds', 'Tropical', 'Squawk', 'Colorful', 'Warm-blooded', True)
     b3 = Bird('Kiwi', 'Parrot', 1, 'Seeds', 'Cage', 'Chirp', 'Green', 'Warm-blooded', False)
-    assert b1 == b2
-    assert b1 != b3
+    assert b1.same_attributes(b2)
+    assert not b1.same_attributes(b3)
+    assert b1 != b2
+    assert b1 == b1
 
 
 
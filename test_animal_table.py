@@ -0,0 +1,114 @@
+"""
+File: test_animal_table.py
+Description: Test suite for the AnimalTable class.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+import pytest
+from animal import Mammal, Reptile, Bird
+from animal_table import AnimalTable
+from zoo import Zoo
+
+
+# ============================ Fixtures ===============================================================
+@pytest.fixture
+def animals():
+    """Fixture to create a mixed list of animals."""
+    return [
+        Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded'),
+        Mammal('Nala', 'Lion', 12, 'Carnivore', 'Savannah', 'Roar', 'Tan', 'Warm-blooded'),
+        Mammal('Dumbo', 'Elephant', 15, 'Herbivore', 'Savannah', 'Trumpet', 'Grey', 'Warm-blooded'),
+        Reptile('Steve', 'Crocodile', 30, 'Carnivore', 'Aquatic', 'Hiss', 'Scaly', 'Cold-blooded', False),
+        Bird('Polly', 'Parrot', 2, 'Seeds', 'Tropical', 'Squawk', 'Colorful', 'Warm-blooded', True),
+    ]
+
+
+@pytest.fixture
+def table(animals):
+    """Fixture to create an AnimalTable from the sample animals."""
+    return AnimalTable(animals)
+
+
+# ============================ Construction Tests =====================================================
+def test_table_columns(table, animals):
+    """Test that every column holds one value per animal in order."""
+    assert len(table) == 5
+    assert table.names == ['Simba', 'Nala', 'Dumbo', 'Steve', 'Polly']
+    assert list(table.ages) == [5, 12, 15, 30, 2]
+    assert list(table.animal_ids) == [animal.animal_id for animal in animals]
+
+
+def test_table_categories_are_interned(table):
+    """Test that repeated text values share a single category code."""
+    assert table.get_categories('species') == ['Lion', 'Elephant', 'Crocodile', 'Parrot']
+    assert list(table.get_codes('species')) == [0, 0, 1, 2, 3]
+    assert table.get_categories('animal_class') == ['Mammal', 'Reptile', 'Bird']
+
+
+def test_table_get_row(table):
+    """Test reading a single row back as a dictionary."""
+    row = table.get_row(3)
+    assert row['name'] == 'Steve'
+    assert row['species'] == 'Crocodile'
+    assert row['environment'] == 'Aquatic'
+    assert row['animal_class'] == 'Reptile'
+    assert row['age'] == 30
+
+
+def test_table_from_zoo(animals):
+    """Test building a table from a zoo."""
+    zoo = Zoo('Taronga Zoo')
+    for animal in animals:
+        zoo.add_animal(animal)
+    assert AnimalTable.from_zoo(zoo).names == [animal.name for animal in animals]
+
+
+def test_empty_table():
+    """Test that an empty table answers queries with no rows."""
+    table = AnimalTable([])
+    assert len(table) == 0
+    assert table.where(species='Lion') == []
+    assert table.count() == 0
+    assert table.mean_age() == 0.0
+
+
+# ============================ Query Tests ============================================================
+def test_where_combined_filters(table):
+    """Test filtering by age and environment together."""
+    # Animals older than 10 living in the Savannah
+    assert table.where(min_age=11, environment='Savannah') == [1, 2]
+    assert table.count(min_age=11, environment='Savannah') == 2
+
+
+def test_where_age_range(table):
+    """Test inclusive age bounds."""
+    assert table.where(min_age=5, max_age=15) == [0, 1, 2]
+    assert table.where(max_age=4) == [4]
+
+
+def test_where_unknown_value(table):
+    """Test that a value not in the table matches nothing."""
+    assert table.where(species='Tiger') == []
+    assert table.count(environment='Arctic') == 0
+
+
+def test_count_by(table):
+    """Test grouped counts over a categorical column."""
+    assert table.count_by('species') == {'Lion': 2, 'Elephant': 1, 'Crocodile': 1, 'Parrot': 1}
+    assert table.count_by('dietary_needs', environment='Savannah') == {'Carnivore': 2, 'Herbivore': 1}
+
+
+def test_mean_age(table):
+    """Test average age with and without filters."""
+    assert table.mean_age() == pytest.approx(64 / 5)
+    assert table.mean_age(species='Lion') == pytest.approx(8.5)
+
+
+def test_invalid_column(table):
+    """Test that unknown column names raise ValueError."""
+    with pytest.raises(ValueError):
+        table.get_categories('name')
+    with pytest.raises(ValueError):
+        table.count_by('age')
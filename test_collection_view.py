@@ -0,0 +1,85 @@
+"""
+File: test_collection_view.py
+Description: Test suite for the ReadOnlyView class.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+import pytest
+from animal import Mammal
+from collection_view import ReadOnlyView
+
+
+# ============================ Fixtures ===============================================================
+@pytest.fixture
+def lions():
+    """Fixture to create three sample Mammals."""
+    return [Mammal(name, 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+            for name in ('Simba', 'Nala', 'Kiara')]
+
+
+@pytest.fixture
+def dict_view(lions):
+    """Fixture to create a view over a dict keyed by animal_id."""
+    return ReadOnlyView({lion.animal_id: lion for lion in lions}, Mammal.get_animal_id)
+
+
+# ============================ List Backed Views ======================================================
+def test_list_view_reads_through(lions):
+    """Test that a list view reflects the list without copying it."""
+    items = list(lions)
+    view = ReadOnlyView(items)
+    assert len(view) == 3
+    assert view[1] is lions[1]
+    assert view[1:] == lions[1:]
+
+    # Changes to the underlying list show up in the view
+    items.pop()
+    assert len(view) == 2
+    assert lions[2] not in view
+
+
+# ============================ Dict Backed Views ======================================================
+def test_dict_view_sequence_operations(dict_view, lions):
+    """Test len, iteration, indexing and reversing over dict values."""
+    assert len(dict_view) == 3
+    assert list(dict_view) == lions
+    assert [dict_view[i] for i in range(3)] == lions
+    assert [dict_view[i] for i in (-1, -2, -3)] == lions[::-1]
+    assert list(reversed(dict_view)) == lions[::-1]
+    assert dict_view[:2] == lions[:2]
+    with pytest.raises(IndexError):
+        dict_view[3]
+    with pytest.raises(IndexError):
+        dict_view[-4]
+
+
+def test_dict_view_membership(dict_view, lions):
+    """Test membership lookups by key, including unrelated objects."""
+    stranger = Mammal('Scar', 'Lion', 9, 'Carnivore', 'Savannah', 'Roar', 'Dark', 'Warm-blooded')
+    assert lions[0] in dict_view
+    assert stranger not in dict_view
+    assert 'Simba' not in dict_view
+    assert None not in dict_view
+
+
+def test_view_is_read_only(dict_view):
+    """Test that the view exposes no mutating operations."""
+    with pytest.raises(AttributeError):
+        dict_view.append('x')
+    with pytest.raises(TypeError):
+        dict_view[0] = 'x'
+    with pytest.raises(TypeError):
+        hash(dict_view)
+
+
+def test_view_equality(dict_view, lions):
+    """Test comparing views with lists, tuples and other views."""
+    assert dict_view == lions
+    assert lions == dict_view
+    assert dict_view == tuple(lions)
+    assert dict_view == ReadOnlyView(list(lions))
+    assert dict_view != lions[:2]
+    assert dict_view != 'Simba'
+    assert ReadOnlyView([]) == []
@@ -42,6 +42,16 @@ def test_init_default_cleanliness():
     enclosure = Enclosure('Medium', 'Jungle', Mammal)
     assert enclosure.cleanliness_level == 100
 
+def test_enclosure_id_and_hash():
+    """Test that each enclosure gets a unique, read-only ID used for equality and hashing."""
+    enclosure1 = Enclosure('Large', 'Savannah', Mammal)
+    enclosure2 = Enclosure('Large', 'Savannah', Mammal)
+    assert enclosure1.enclosure_id != enclosure2.enclosure_id
+    assert enclosure1 != enclosure2
+    assert len({enclosure1, enclosure2, enclosure1}) == 2
+    with pytest.raises(AttributeError):
+        enclosure1.enclosure_id = 5
+
 # ============================ Setters (Valid Cases) ====================================================
 # Test that setting valid attributes works as expected
 def test_set_valid_values(mammal_enclosure):
@@ -142,6 +152,39 @@ def test_remove_animal_invalid_type(mammal_enclosure):
     with pytest.raises(TypeError):
         mammal_enclosure.remove_animal(None)
 
+def test_animals_view_is_read_only(mammal_enclosure, sample_mammal):
+    """Test that animals is a live, read-only view and count_animals matches it."""
+    animals_view = mammal_enclosure.animals
+    assert mammal_enclosure.count_animals() == 0
+
+    mammal_enclosure.add_animal(sample_mammal)
+    assert animals_view == [sample_mammal]
+    assert mammal_enclosure.count_animals() == 1
+    with pytest.raises(AttributeError):
+        animals_view.append('fake animal')
+
+def test_membership_keeps_insertion_order(mammal_enclosure):
+    """Test that animals keep their order across removals and re-adds."""
+    lions = [Mammal(name, 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+             for name in ('Simba', 'Nala', 'Kiara')]
+    for lion in lions:
+        mammal_enclosure.add_animal(lion)
+
+    # Removing from the middle keeps the rest in order, re-adding goes to the end
+    mammal_enclosure.remove_animal(lions[1])
+    assert mammal_enclosure.animals == [lions[0], lions[2]]
+    assert lions[1] not in mammal_enclosure.animals
+    mammal_enclosure.add_animal(lions[1])
+    assert mammal_enclosure.animals == [lions[0], lions[2], lions[1]]
+
+def test_membership_uses_identity_not_attributes(mammal_enclosure, sample_mammal):
+    """Test that a different animal with the same details is not treated as a duplicate."""
+    twin = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Long and blond', 'Warm-blooded')
+    mammal_enclosure.add_animal(sample_mammal)
+    assert twin not in mammal_enclosure.animals
+    mammal_enclosure.add_animal(twin)
+    assert mammal_enclosure.count_animals() == 2
+
 # ============================ Clean Enclosure ======================================================
 # Test the clean_enclosure method including already-clean edge case
 def test_clean_enclosure(mammal_enclosure):
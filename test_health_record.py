@@ -6,8 +6,11 @@ ID: 110481368
 Username: SIDAY032
 This is my own work as defined by the University's Academic Integrity Policy.
 """
+from datetime import date
+
 import pytest
-from health_record import HealthRecord
+import health_record
+from health_record import HealthRecord, Severity
 
 # ===============================================
 #        HealthRecord Tests
@@ -70,6 +73,38 @@ def test_date_validation(sample_record):
     with pytest.raises(ValueError):
         sample_record.date_reported = ''
 
+    # Value error: date must be a real ISO date
+    with pytest.raises(ValueError):
+        sample_record.date_reported = '10/11/2025'
+    with pytest.raises(ValueError):
+        sample_record.date_reported = '2025-02-30'
+
+    # A rejected date leaves the record unchanged
+    assert sample_record.date_reported == '2025-11-10'
+
+def test_date_ordinal(sample_record):
+    """Test that the date is parsed into an ordinal that follows the date string."""
+    assert sample_record.date_ordinal == date(2025, 11, 10).toordinal()
+    sample_record.date_reported = '2025-12-01'
+    assert sample_record.date_ordinal == date(2025, 12, 1).toordinal()
+    assert sample_record.date_reported == '2025-12-01'
+    with pytest.raises(AttributeError):
+        sample_record.date_ordinal = 1
+
+def test_to_ordinal():
+    """Test converting strings and date objects into ordinals."""
+    assert HealthRecord.to_ordinal('2025-11-10') == date(2025, 11, 10).toordinal()
+    assert HealthRecord.to_ordinal(date(2025, 11, 10)) == date(2025, 11, 10).toordinal()
+    with pytest.raises(TypeError):
+        HealthRecord.to_ordinal(20251110)
+    with pytest.raises(ValueError):
+        HealthRecord.to_ordinal('yesterday')
+
+    # Only YYYY-MM-DD is accepted, not the other ISO 8601 forms
+    for text in ('20251110', '2025-W46-1', '2025-1-5', '2025-11-10T00:00'):
+        with pytest.raises(ValueError):
+            HealthRecord.to_ordinal(text)
+
 def test_severity_validation(sample_record):
     """Test that invalid severity level values raise TypeError or ValueError."""
     # Type error: severity level must be a string
@@ -183,4 +218,103 @@ def test_eq_method(sample_record):
     assert sample_record != diff_record
 
     # Test comparison with non-HealthRecord object
-    assert sample_record != 'Not a record'
\ No newline at end of file
+    assert sample_record != 'Not a record'
+
+def test_hash_matches_equality(sample_record):
+    """Test that equal records hash the same and can be used in sets."""
+    same_record = HealthRecord('Broken leg', '2025-11-10', 'high', 'Some other treatment')
+    assert sample_record.key == ('Broken leg', date(2025, 11, 10).toordinal(), Severity.HIGH)
+    assert hash(sample_record) == hash(same_record)
+    assert len({sample_record, same_record}) == 1
+
+    # The key follows changes to the key fields
+    same_record.issue = 'Sprained leg'
+    assert same_record.key == ('Sprained leg', date(2025, 11, 10).toordinal(), Severity.HIGH)
+    assert same_record != sample_record
+
+    # The key uses the parsed date, so differently written text for the same day matches
+    padded_record = HealthRecord('Broken leg', ' 2025-11-10 ', 'High', 'Rest')
+    assert padded_record == sample_record
+    assert hash(padded_record) == hash(sample_record)
+
+
+# ============================ Severity Tests =========================================================
+# Test the Severity enum and the parsed severity on records
+def test_severity_parsed_case_insensitively(sample_record):
+    """Test that severity strings are parsed into ranked Severity values."""
+    assert sample_record.severity is Severity.HIGH
+    sample_record.severity_level = 'CRITICAL'
+    assert sample_record.severity is Severity.CRITICAL
+    assert sample_record.severity_level == 'CRITICAL'
+    assert Severity.LOW < Severity.MEDIUM < Severity.HIGH < Severity.CRITICAL
+    with pytest.raises(AttributeError):
+        sample_record.severity = Severity.LOW
+
+def test_severity_from_enum(sample_record):
+    """Test that a Severity can be given directly and is displayed by name."""
+    sample_record.severity_level = Severity.MEDIUM
+    assert sample_record.severity is Severity.MEDIUM
+    assert sample_record.severity_level == 'Medium'
+    assert sample_record.update_severity(Severity.HIGH) == 'Severity level updated: High'
+
+def test_equality_ignores_severity_case(sample_record):
+    """Test that records differing only in the case of the severity are equal."""
+    assert sample_record == HealthRecord('Broken leg', '2025-11-10', 'HIGH', 'Rest')
+
+def test_severity_parse():
+    """Test Severity.parse with valid and invalid values."""
+    assert Severity.parse('medium') is Severity.MEDIUM
+    assert Severity.parse(Severity.LOW) is Severity.LOW
+    assert Severity.HIGH.is_critical and not Severity.MEDIUM.is_critical
+    with pytest.raises(ValueError):
+        Severity.parse('severe')
+    with pytest.raises(TypeError):
+        Severity.parse(3)
+
+
+# ============================ Memory Layout Tests ====================================================
+# Records use __slots__ and share repeated text
+def test_records_use_slots(sample_record):
+    """Test that records have no per-instance __dict__ but keep property validation."""
+    assert not hasattr(sample_record, '__dict__')
+    with pytest.raises(AttributeError):
+        sample_record.notes = 'Not an attribute'
+    with pytest.raises(ValueError):
+        sample_record.issue = ''
+
+def test_repeated_text_is_shared():
+    """Test that equal issue, severity and treatment text is stored as one shared string."""
+    # Splitting builds new string objects, like reading records from a file
+    first = HealthRecord(*'Routine checkup|2025-11-10|Low|All clear, healthy'.split('|'))
+    second = HealthRecord(*'Routine checkup|2025-11-10|Low|All clear, healthy'.split('|'))
+    assert first.issue is second.issue
+    assert first.severity_level is second.severity_level
+    assert first.treatment_plan is second.treatment_plan
+
+    second.update_treatment(''.join(['Booster ', 'due']))
+    assert second.treatment_plan is HealthRecord('Checkup', '2025-11-10', 'Low', 'Booster due').treatment_plan
+
+def test_text_pool_is_bounded(monkeypatch):
+    """Test that only issue and treatment text is pooled and a full pool starts again."""
+    monkeypatch.setattr(health_record, '_TEXT_POOL', {})
+    monkeypatch.setattr(health_record, '_TEXT_POOL_LIMIT', 2)
+    first = HealthRecord('Checkup', '2025-11-10', 'Low', 'Routine')
+    assert health_record._TEXT_POOL == {'Checkup': 'Checkup', 'Routine': 'Routine'}
+
+    # The pool is full, so it is cleared before new text is added
+    HealthRecord('Dental cleaning', '2025-11-11', 'Low', 'Routine')
+    assert health_record._TEXT_POOL == {'Dental cleaning': 'Dental cleaning', 'Routine': 'Routine'}
+
+    # Text pooled in the new round is shared again, and earlier records keep their text
+    later = HealthRecord(*'Dental cleaning|2025-11-12|Low|Routine'.split('|'))
+    assert later.issue is health_record._TEXT_POOL['Dental cleaning']
+    assert later.treatment_plan is health_record._TEXT_POOL['Routine']
+    assert first.issue == 'Checkup'
+
+
+def test_severity_text_uses_constants():
+    """Test that common severity spellings are shared constants and other spellings are kept as given."""
+    first = HealthRecord('Checkup', '2025-11-10', ''.join(['Hi', 'gh']), 'Routine')
+    second = HealthRecord('Checkup', '2025-11-11', ''.join(['Hi', 'gh']), 'Routine')
+    assert first.severity_level is second.severity_level
+    assert HealthRecord('Checkup', '2025-11-10', 'hIGh', 'Routine').severity_level == 'hIGh'
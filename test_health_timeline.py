@@ -0,0 +1,64 @@
+"""
+File: test_health_timeline.py
+Description: Test suite for the HealthTimeline class.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+import pytest
+from animal import Mammal
+from health_record import HealthRecord
+from health_timeline import HealthTimeline
+
+
+# ============================ Fixtures ===============================================================
+@pytest.fixture
+def lion():
+    """Fixture to create a sample Mammal."""
+    return Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+
+
+@pytest.fixture
+def records():
+    """Fixture to create records on three different days, two of them on the same day."""
+    return [HealthRecord('Checkup', '2025-11-10', 'low', 'Routine'),
+            HealthRecord('Vaccinated', '2025-11-01', 'low', 'Routine'),
+            HealthRecord('Limping', '2025-11-10', 'medium', 'Rest'),
+            HealthRecord('Injury', '2025-11-20', 'high', 'Bandage')]
+
+
+@pytest.fixture
+def timeline(lion, records):
+    """Fixture to create a timeline holding the sample records."""
+    timeline = HealthTimeline()
+    for record in records:
+        timeline.add(lion, record, record.date_ordinal)
+    return timeline
+
+
+# ============================ Timeline Tests =========================================================
+def test_between_is_sorted_and_inclusive(timeline, lion, records):
+    """Test that range scans return events in date order, same-day events in insertion order."""
+    start = HealthRecord.to_ordinal('2025-11-01')
+    end = HealthRecord.to_ordinal('2025-11-10')
+    assert timeline.between(start, end) == [(lion, records[1]), (lion, records[0]), (lion, records[2])]
+    assert timeline.between(end + 1, end + 5) == []
+    assert len(timeline) == 4
+
+
+def test_latest(timeline, lion, records):
+    """Test that latest returns the newest events first."""
+    assert timeline.latest(2) == [(lion, records[3]), (lion, records[2])]
+    assert len(timeline.latest(10)) == 4
+    assert timeline.latest(0) == []
+
+
+def test_remove(timeline, lion, records):
+    """Test that remove drops only the given record."""
+    timeline.remove(records[0], records[0].date_ordinal)
+    assert timeline.latest(10) == [(lion, records[3]), (lion, records[2]), (lion, records[1])]
+
+    # Removing a record that is not in the timeline does nothing
+    timeline.remove(records[0], records[0].date_ordinal)
+    assert len(timeline) == 3
@@ -0,0 +1,110 @@
+"""
+File: test_placement.py
+Description: Test suite for the PlacementEngine and PlacementResult classes.
+Author: Ayesha Siddiqa
+ID: 110481368
+Username: SIDAY032
+This is my own work as defined by the University's Academic Integrity Policy.
+"""
+import pytest
+from animal import Animal, Mammal, Bird
+from enclosure import Enclosure
+from health_record import HealthRecord
+from placement import PlacementEngine
+from zoo import Zoo
+
+
+# ============================ Fixtures ===============================================================
+@pytest.fixture
+def zoo():
+    """Fixture to create a zoo with two Savannah mammal enclosures and one aviary."""
+    zoo = Zoo('Taronga Zoo')
+    zoo.add_enclosures([Enclosure('Large', 'Savannah', Mammal),
+                        Enclosure('Medium', 'Savannah', Mammal),
+                        Enclosure('Large', 'Tropical', Bird)])
+    return zoo
+
+
+@pytest.fixture
+def lions():
+    """Fixture to create five sample lions."""
+    return [Mammal(f'Lion {i}', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+            for i in range(5)]
+
+
+# ============================ Placement Tests ========================================================
+def test_place_animals_balances_enclosures(zoo, lions):
+    """Test that animals are spread evenly over compatible enclosures."""
+    zoo.add_animals(lions)
+    result = PlacementEngine(zoo).place_animals(lions)
+
+    savannah = zoo.find_compatible_enclosures(lions[0])
+    assert [enclosure.count_animals() for enclosure in savannah] == [3, 2]
+    assert len(result.placements) == 5
+    assert result.unplaceable == []
+    for animal, enclosure in result.placements:
+        assert zoo.enclosure_of(animal) is enclosure
+
+
+def test_place_animals_fills_emptiest_first(zoo, lions):
+    """Test that existing occupants are taken into account when balancing."""
+    zoo.add_animals(lions)
+    first, second = zoo.find_compatible_enclosures(lions[0])
+    zoo.assign_animal_to_enclosure(lions[0], first)
+    zoo.assign_animal_to_enclosure(lions[1], first)
+
+    # Already housed animals stay where they are
+    result = PlacementEngine(zoo).place_animals(lions)
+    assert [enclosure for _, enclosure in result.placements] == [second, second, first]
+    assert first.count_animals() == 3
+    assert second.count_animals() == 2
+
+
+def test_place_animals_reports_unplaceable(zoo, lions):
+    """Test that critical animals and animals without an enclosure are reported, not placed."""
+    penguin = Bird('Pingu', 'Penguin', 3, 'Fish', 'Arctic', 'Squawk', 'Sleek', 'Warm-blooded', False)
+    lions[0].add_health_record(HealthRecord('Injury', '2025-11-10', 'critical', 'Surgery'))
+    zoo.add_animals(lions + [penguin])
+
+    result = PlacementEngine(zoo).place_animals(lions + [penguin])
+    assert result.unplaceable == [(lions[0], PlacementEngine.CRITICAL_HEALTH),
+                                  (penguin, PlacementEngine.NO_ENCLOSURE)]
+    assert len(result.placements) == 4
+    assert zoo.enclosure_of(lions[0]) is None
+    assert '4 animals placed, 2 could not be placed.' in str(result)
+    assert 'Pingu the Penguin: no compatible enclosure' in str(result)
+
+
+def test_place_animals_shared_enclosures(zoo, lions):
+    """Test balancing when an enclosure for any Animal is shared with the mammal enclosures."""
+    zoo.add_enclosure(Enclosure('Huge', 'Savannah', Animal))
+    zoo.add_animals(lions)
+    PlacementEngine(zoo).place_animals(lions)
+
+    counts = [enclosure.count_animals() for enclosure in zoo.find_compatible_enclosures(lions[0])]
+    assert sorted(counts) == [1, 2, 2]
+
+
+def test_place_animals_validation(zoo, lions):
+    """Test that invalid batches raise before any animal is placed."""
+    engine = PlacementEngine(zoo)
+    zoo.add_animal(lions[0])
+
+    # lions[1] is not in the zoo
+    with pytest.raises(ValueError):
+        engine.place_animals([lions[0], lions[1]])
+    assert zoo.enclosure_of(lions[0]) is None
+
+    with pytest.raises(ValueError):
+        engine.place_animals([lions[0], lions[0]])
+    with pytest.raises(TypeError):
+        engine.place_animals(['Simba'])
+    with pytest.raises(TypeError):
+        PlacementEngine('Taronga Zoo')
+
+
+def test_place_animals_empty_batch(zoo):
+    """Test that an empty batch places nothing."""
+    result = PlacementEngine(zoo).place_animals([])
+    assert result.placements == []
+    assert result.unplaceable == []
@@ -99,18 +99,34 @@ def test_staff_id_read_only(zookeeper):
 
 
 def test_assigned_lists_read_only(zookeeper, sample_lion):
-    """Test that assigned_animals and assigned_enclosures return copies."""
+    """Test that assigned_animals and assigned_enclosures are read-only views."""
     # Assign an animal
     zookeeper.assign_animal(sample_lion)
 
-    # Get the list
-    animals_list = zookeeper.assigned_animals
+    # Get the view
+    animals_view = zookeeper.assigned_animals
 
-    # Modifying the returned list should not affect the internal list
-    animals_list.append('fake animal')
+    # The view cannot be modified
+    with pytest.raises(AttributeError):
+        animals_view.append('fake animal')
+    with pytest.raises(AttributeError):
+        zookeeper.assigned_enclosures.append('fake enclosure')
 
     # Internal list should still have only one animal
     assert len(zookeeper.assigned_animals) == 1
+    assert zookeeper.count_assigned_animals() == 1
+
+
+def test_assigned_views_are_live(zookeeper, sample_lion, sample_tiger, sample_enclosure):
+    """Test that views show later assignments and counts stay in step."""
+    animals_view = zookeeper.assigned_animals
+    zookeeper.assign_animal(sample_lion)
+    zookeeper.assign_animal(sample_tiger)
+    zookeeper.assign_enclosure(sample_enclosure)
+
+    assert animals_view == [sample_lion, sample_tiger]
+    assert zookeeper.count_assigned_animals() == 2
+    assert zookeeper.count_assigned_enclosures() == 1
 
 
 # ============================ Validation Tests =======================================================
@@ -208,6 +224,27 @@ def test_assign_animal_max_limit(zookeeper):
         zookeeper.assign_animal(extra_animal)
 
 
+# ============================ Unassign Animal Tests ==================================================
+# Test removing animal assignments from staff members
+
+def test_unassign_animal_valid(zookeeper, sample_lion, sample_tiger):
+    """Test unassigning one of several animals."""
+    zookeeper.assign_animal(sample_lion)
+    zookeeper.assign_animal(sample_tiger)
+
+    msg = zookeeper.unassign_animal(sample_lion)
+    assert 'Simba the Lion has been unassigned from John.' in msg
+    assert zookeeper.assigned_animals == [sample_tiger]
+
+
+def test_unassign_animal_not_assigned(zookeeper, sample_lion):
+    """Test that unassigning an animal that is not assigned raises ValueError."""
+    with pytest.raises(ValueError):
+        zookeeper.unassign_animal(sample_lion)
+    with pytest.raises(TypeError):
+        zookeeper.unassign_animal('not an animal')
+
+
 # ============================ Assign Enclosure Tests =================================================
 # Test assigning enclosures to staff members with various edge cases
 
@@ -273,6 +310,26 @@ def test_assign_enclosure_max_limit(zookeeper):
         zookeeper.assign_enclosure(extra_enclosure)
 
 
+# ============================ Unassign Enclosure Tests ===============================================
+# Test removing enclosure assignments from staff members
+
+def test_unassign_enclosure_valid(zookeeper, sample_enclosure):
+    """Test unassigning an enclosure."""
+    zookeeper.assign_enclosure(sample_enclosure)
+
+    msg = zookeeper.unassign_enclosure(sample_enclosure)
+    assert 'Savannah enclosure has been unassigned from John.' in msg
+    assert zookeeper.assigned_enclosures == []
+
+
+def test_unassign_enclosure_not_assigned(zookeeper, sample_enclosure):
+    """Test that unassigning an enclosure that is not assigned raises ValueError."""
+    with pytest.raises(ValueError):
+        zookeeper.unassign_enclosure(sample_enclosure)
+    with pytest.raises(TypeError):
+        zookeeper.unassign_enclosure('not an enclosure')
+
+
 # ============================ String Method Test =====================================================
 # Test that __str__ returns a properly formatted string
 
@@ -330,6 +387,15 @@ def test_staff_equality_different_types():
     assert keeper == vet
 
 
+def test_staff_hash_matches_equality():
+    """Test that staff with the same ID share a hash and collapse in a set."""
+    keeper1 = Zookeeper('John', 101)
+    keeper2 = Zookeeper('John', 101)
+    vet = Veterinarian('Emily', 201)
+    assert hash(keeper1) == hash(keeper2)
+    assert len({keeper1, keeper2, vet}) == 2
+
+
 def test_staff_equality_with_non_staff(zookeeper):
     """Test that comparing staff with non-Staff object returns False."""
     # Comparing with non-Staff object
@@ -375,6 +441,16 @@ def test_feed_animal_not_assigned(zookeeper, sample_lion):
         zookeeper.feed_animal(sample_lion)
 
 
+def test_feed_animal_lookalike_not_assigned(zookeeper, sample_lion):
+    """Test that an animal with the same details as an assigned one is not authorised."""
+    # Same details as sample_lion but a different animal
+    lookalike = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Long', 'Warm-blooded')
+    zookeeper.assign_animal(sample_lion)
+
+    with pytest.raises(ValueError):
+        zookeeper.feed_animal(lookalike)
+
+
 def test_feed_animal_invalid_type(zookeeper):
     """Test that feeding a non-Animal object raises TypeError."""
     # Type error: must be Animal instance
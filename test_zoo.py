@@ -6,12 +6,17 @@ ID: 110481368
 Username: SIDAY032
 This is my own work as defined by the University's Academic Integrity Policy.
 """
+import gc
+import io
+import weakref
+
 import pytest
-from zoo import Zoo
-from animal import Mammal, Bird
+from zoo import Zoo, BulkAddResult
+from collection_view import ReadOnlyView
+from animal import Animal, Mammal, Bird
 from enclosure import Enclosure
 from staff import Zookeeper, Veterinarian
-from health_record import HealthRecord
+from health_record import HealthRecord, Severity
 
 
 # ============================ Fixtures ===============================================================
@@ -94,20 +99,20 @@ def test_zoo_name_getter(zoo):
 
 
 def test_zoo_animals_getter(zoo):
-    """Test that animals property returns empty list initially."""
-    assert isinstance(zoo.animals, list)
+    """Test that animals property returns an empty view initially."""
+    assert isinstance(zoo.animals, ReadOnlyView)
     assert zoo.animals == []
 
 
 def test_zoo_enclosures_getter(zoo):
-    """Test that enclosures property returns empty list initially."""
-    assert isinstance(zoo.enclosures, list)
+    """Test that enclosures property returns an empty view initially."""
+    assert isinstance(zoo.enclosures, ReadOnlyView)
     assert zoo.enclosures == []
 
 
 def test_zoo_staff_getter(zoo):
-    """Test that staff property returns empty list initially."""
-    assert isinstance(zoo.staff, list)
+    """Test that staff property returns an empty view initially."""
+    assert isinstance(zoo.staff, ReadOnlyView)
     assert zoo.staff == []
 
 
@@ -126,56 +131,79 @@ def test_zoo_name_setter(zoo):
 
 
 # ============================ Read-Only Property Tests ===========================================
-# Test that animals, enclosures, and staff properties return copies (read-only)
-
-def test_zoo_animals_property_returns_copy(zoo, sample_lion):
-    """Test that animals property returns a copy (read-only)."""
-    # Manually add to internal list for testing
-    zoo._Zoo__animals.append(sample_lion)
-
-    # Get the list
-    animals_list = zoo.animals
+# Test that animals, enclosures, and staff properties are read-only views
 
-    # Modify the returned list
-    animals_list.append('fake animal')
+def test_zoo_animals_property_is_read_only_view(zoo, sample_lion, sample_tiger):
+    """Test that animals property is a read-only view that follows the zoo."""
+    zoo.add_animal(sample_lion)
+    animals_view = zoo.animals
 
-    # Internal list should be unchanged
-    assert len(zoo.animals) == 1
-    assert 'fake animal' not in zoo.animals
+    # The view cannot be modified
+    with pytest.raises(AttributeError):
+        animals_view.append('fake animal')
+    with pytest.raises(TypeError):
+        animals_view[0] = sample_tiger
 
+    # The view is live: later changes to the zoo are visible without a new copy
+    zoo.add_animal(sample_tiger)
+    assert len(animals_view) == 2
+    assert animals_view[-1] is sample_tiger
+    assert 'fake animal' not in animals_view
+    assert sample_tiger in animals_view
 
-def test_zoo_enclosures_property_returns_copy(zoo, sample_enclosure):
-    """Test that enclosures property returns a copy (read-only)."""
-    # Manually add to internal list for testing
-    zoo._Zoo__enclosures.append(sample_enclosure)
 
-    # Get the list
-    enclosures_list = zoo.enclosures
+def test_zoo_enclosures_property_is_read_only_view(zoo, sample_enclosure):
+    """Test that enclosures property is a read-only view."""
+    zoo.add_enclosure(sample_enclosure)
+    enclosures_view = zoo.enclosures
 
-    # Modify the returned list
-    enclosures_list.append('fake enclosure')
+    with pytest.raises(AttributeError):
+        enclosures_view.append('fake enclosure')
 
-    # Internal list should be unchanged
     assert len(zoo.enclosures) == 1
     assert 'fake enclosure' not in zoo.enclosures
+    assert sample_enclosure in enclosures_view
 
 
-def test_zoo_staff_property_returns_copy(zoo, sample_zookeeper):
-    """Test that staff property returns a copy (read-only)."""
-    # Manually add to internal list for testing
-    zoo._Zoo__staff.append(sample_zookeeper)
-
-    # Get the list
-    staff_list = zoo.staff
+def test_zoo_staff_property_is_read_only_view(zoo, sample_zookeeper):
+    """Test that staff property is a read-only view."""
+    zoo.add_staff(sample_zookeeper)
+    staff_view = zoo.staff
 
-    # Modify the returned list
-    staff_list.append('fake staff')
+    with pytest.raises(AttributeError):
+        staff_view.append('fake staff')
 
-    # Internal list should be unchanged
     assert len(zoo.staff) == 1
     assert 'fake staff' not in zoo.staff
 
 
+def test_zoo_views_support_sequence_operations(zoo, sample_lion, sample_tiger, sample_parrot):
+    """Test indexing, slicing, reversing and comparing the animals view."""
+    zoo.add_animals([sample_lion, sample_tiger, sample_parrot])
+    animals_view = zoo.animals
+
+    assert animals_view[0] is sample_lion
+    assert animals_view[1] is sample_tiger
+    assert animals_view[-1] is sample_parrot
+    assert animals_view[0:2] == [sample_lion, sample_tiger]
+    assert list(reversed(animals_view)) == [sample_parrot, sample_tiger, sample_lion]
+    assert animals_view.index(sample_tiger) == 1
+    assert animals_view == [sample_lion, sample_tiger, sample_parrot]
+    with pytest.raises(IndexError):
+        animals_view[3]
+
+
+def test_zoo_count_methods(zoo, sample_lion, sample_enclosure, sample_zookeeper, sample_vet):
+    """Test the O(1) count methods."""
+    assert zoo.count_animals() == 0
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosure(sample_enclosure)
+    zoo.add_staff_members([sample_zookeeper, sample_vet])
+    assert zoo.count_animals() == 1
+    assert zoo.count_enclosures() == 1
+    assert zoo.count_staff() == 2
+
+
 # ============================ Validation Tests ===================================================
 # Test that invalid inputs raise appropriate exceptions
 
@@ -284,6 +312,35 @@ def test_add_duplicate_animal(zoo, sample_lion):
         zoo.add_animal(sample_lion)
 
 
+def test_add_identical_twins(zoo):
+    """Test that two distinct animals with identical details are tracked separately."""
+    twin1 = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+    twin2 = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+
+    zoo.add_animal(twin1)
+    zoo.add_animal(twin2)
+    assert len(zoo.animals) == 2
+
+    # Removing one twin leaves the other object in the zoo
+    zoo.remove_animal(twin1)
+    assert len(zoo.animals) == 1
+    assert zoo.animals[0] is twin2
+
+
+def test_add_and_remove_many_animals(zoo):
+    """Test that a large number of animals can be added and removed."""
+    animals = [Mammal(f'Lion {i}', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+               for i in range(2000)]
+    for animal in animals:
+        zoo.add_animal(animal)
+    assert len(zoo.animals) == 2000
+
+    # Remove every second animal and check the order of the rest is kept
+    for animal in animals[::2]:
+        zoo.remove_animal(animal)
+    assert zoo.animals == animals[1::2]
+
+
 # ============================ Remove Animal Tests ================================================
 # Test removing animals from the zoo
 
@@ -337,6 +394,73 @@ def test_remove_animal_invalid_type(zoo):
         zoo.remove_animal(None)
 
 
+def test_remove_animal_cascades(zoo, sample_lion, sample_enclosure, sample_zookeeper, sample_vet):
+    """Test that removing an animal unlinks it from its enclosure and staff."""
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosure(sample_enclosure)
+    zoo.add_staff_members([sample_zookeeper, sample_vet])
+    zoo.assign_animal_to_enclosure(sample_lion, sample_enclosure)
+    sample_zookeeper.assign_animal(sample_lion)
+    sample_vet.assign_animal(sample_lion)
+
+    zoo.remove_animal(sample_lion)
+
+    # No dangling references remain in the enclosure or staff assignments
+    assert sample_lion not in sample_enclosure.animals
+    assert sample_lion not in sample_zookeeper.assigned_animals
+    assert sample_lion not in sample_vet.assigned_animals
+    assert zoo.staff_for(sample_lion) == []
+
+    # The emptied enclosure can now be removed
+    zoo.remove_enclosure(sample_enclosure)
+
+
+def test_remove_animal_already_out_of_enclosure(zoo, sample_lion, sample_enclosure, sample_zookeeper):
+    """Test that the cascade still runs when the animal was taken out of its enclosure directly."""
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosure(sample_enclosure)
+    zoo.add_staff(sample_zookeeper)
+    zoo.assign_animal_to_enclosure(sample_lion, sample_enclosure)
+    sample_zookeeper.assign_animal(sample_lion)
+    sample_enclosure.remove_animal(sample_lion)
+
+    zoo.remove_animal(sample_lion)
+    assert sample_lion not in zoo.animals
+    assert sample_lion not in sample_zookeeper.assigned_animals
+    assert zoo.staff_for(sample_lion) == []
+
+
+def test_remove_animal_after_direct_add_to_second_enclosure(zoo, sample_lion, sample_enclosure):
+    """Test that no zoo enclosure keeps a removed animal that was also added to another enclosure directly."""
+    second_enclosure = Enclosure('Medium', 'Savannah', Mammal, 90)
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosures([sample_enclosure, second_enclosure])
+    zoo.assign_animal_to_enclosure(sample_lion, sample_enclosure)
+    second_enclosure.add_animal(sample_lion)
+
+    zoo.remove_animal(sample_lion)
+    assert sample_lion not in sample_enclosure.animals
+    assert sample_lion not in second_enclosure.animals
+
+
+def test_removed_animal_is_garbage_collected(zoo, sample_enclosure, sample_zookeeper):
+    """Test that the zoo keeps no reference to a removed animal."""
+    lion = Mammal('Simba', 'Lion', 5, 'Carnivore', 'Savannah', 'Roar', 'Golden', 'Warm-blooded')
+    lion.add_health_record(HealthRecord('Checkup', '2025-11-10', 'Low', 'None'))
+    zoo.add_animal(lion)
+    zoo.add_enclosure(sample_enclosure)
+    zoo.add_staff(sample_zookeeper)
+    zoo.assign_animal_to_enclosure(lion, sample_enclosure)
+    sample_zookeeper.assign_animal(lion)
+
+    lion_ref = weakref.ref(lion)
+    zoo.remove_animal(lion)
+    del lion
+    gc.collect()
+
+    assert lion_ref() is None
+
+
 # ============================ Find Animal Tests ==================================================
 # Test finding animals by name
 
@@ -427,6 +551,83 @@ def test_find_animal_empty_name(zoo):
         zoo.find_animal_by_name('   ')
 
 
+def test_find_animals_by_name_returns_all_matches(zoo, sample_lion):
+    """Test that find_animals_by_name returns every animal with the name."""
+    other_simba = Mammal('SIMBA', 'Lion', 2, 'Carnivore', 'Savannah', 'Roar', 'Short', 'Warm-blooded')
+    zoo.add_animal(sample_lion)
+    zoo.add_animal(other_simba)
+
+    # Both animals match regardless of case, in the order they were added
+    matches = zoo.find_animals_by_name('simba')
+    assert len(matches) == 2
+    assert matches[0] is sample_lion
+    assert matches[1] is other_simba
+
+    # find_animal_by_name still returns the first match
+    assert zoo.find_animal_by_name('Simba') is sample_lion
+
+
+def test_find_animals_by_name_no_match(zoo, sample_lion):
+    """Test that find_animals_by_name returns an empty list when nothing matches."""
+    zoo.add_animal(sample_lion)
+    assert zoo.find_animals_by_name('Nala') == []
+
+    # Validation matches find_animal_by_name
+    with pytest.raises(TypeError):
+        zoo.find_animals_by_name(123)
+    with pytest.raises(ValueError):
+        zoo.find_animals_by_name('  ')
+
+
+def test_find_animal_after_rename(zoo, sample_lion):
+    """Test that renaming an animal through its setter updates the name index."""
+    zoo.add_animal(sample_lion)
+    sample_lion.name = 'Mufasa'
+
+    # The new name is found and the old one is gone
+    assert zoo.find_animal_by_name('mufasa') is sample_lion
+    with pytest.raises(ValueError):
+        zoo.find_animal_by_name('Simba')
+
+
+def test_find_animal_after_rename_keeps_zoo_order(zoo, sample_lion, sample_tiger):
+    """Test that a renamed animal is still found in the order it was added to the zoo."""
+    zoo.add_animal(sample_lion)
+    zoo.add_animal(sample_tiger)
+
+    # The lion was added first, so it comes first once it shares the tiger's name
+    sample_lion.name = 'Luna'
+    assert zoo.find_animal_by_name('Luna') is sample_lion
+    assert zoo.find_animals_by_name('luna') == [sample_lion, sample_tiger]
+
+
+def test_find_animal_after_remove(zoo, sample_lion):
+    """Test that removed animals are no longer found or tracked by the zoo."""
+    zoo.add_animal(sample_lion)
+    zoo.remove_animal(sample_lion)
+
+    with pytest.raises(ValueError):
+        zoo.find_animal_by_name('Simba')
+
+    # Renaming after removal does not affect the zoo
+    sample_lion.name = 'Mufasa'
+    assert zoo.find_animals_by_name('Mufasa') == []
+
+
+def test_add_animal_already_in_another_zoo(zoo, sample_lion):
+    """Test that an animal cannot be added to two zoos at once."""
+    other_zoo = Zoo('Melbourne Zoo')
+    other_zoo.add_animal(sample_lion)
+
+    with pytest.raises(ValueError):
+        zoo.add_animal(sample_lion)
+
+    # Once removed from the first zoo it can move to the second
+    other_zoo.remove_animal(sample_lion)
+    zoo.add_animal(sample_lion)
+    assert sample_lion in zoo.animals
+
+
 # ===============================================
 #        Enclosure Management Tests
 # ===============================================
@@ -571,6 +772,70 @@ def test_remove_enclosure_invalid_type(zoo):
         zoo.remove_enclosure(None)
 
 
+def test_add_enclosure_already_in_another_zoo(zoo, sample_enclosure):
+    """Test that an enclosure cannot belong to two zoos at once."""
+    other_zoo = Zoo('Melbourne Zoo')
+    other_zoo.add_enclosure(sample_enclosure)
+
+    with pytest.raises(ValueError):
+        zoo.add_enclosure(sample_enclosure)
+    with pytest.raises(ValueError):
+        zoo.add_enclosures([sample_enclosure])
+
+    # Once removed from the first zoo it can join the second
+    other_zoo.remove_enclosure(sample_enclosure)
+    zoo.add_enclosure(sample_enclosure)
+    assert sample_enclosure in zoo.enclosures
+
+
+# ============================ Compatible Enclosure Tests =========================================
+# Test the (environment, animal type) placement index
+
+def test_find_compatible_enclosures(zoo, sample_lion, sample_parrot, sample_enclosure):
+    """Test that only enclosures with a matching environment and animal type are returned."""
+    second_savannah = Enclosure('Medium', 'Savannah', Mammal)
+    jungle = Enclosure('Large', 'Jungle', Mammal)
+    aviary = Enclosure('Large', 'Savannah', Bird)
+    zoo.add_enclosures([sample_enclosure, jungle, aviary, second_savannah])
+
+    # The animals do not need to be in the zoo yet
+    assert zoo.find_compatible_enclosures(sample_lion) == [sample_enclosure, second_savannah]
+    assert zoo.find_compatible_enclosures(sample_parrot) == []
+
+
+def test_find_compatible_enclosures_includes_base_class(zoo, sample_lion, sample_enclosure):
+    """Test that an enclosure for any Animal accepts a Mammal too."""
+    any_animal = Enclosure('Huge', 'Savannah', Animal)
+    zoo.add_enclosures([any_animal, sample_enclosure])
+
+    compatible = zoo.find_compatible_enclosures(sample_lion)
+    assert compatible == [sample_enclosure, any_animal]
+    for enclosure in compatible:
+        enclosure.add_animal(sample_lion)
+
+
+def test_find_compatible_enclosures_follows_changes(zoo, sample_lion, sample_enclosure):
+    """Test that retyping or removing an enclosure updates the placement index."""
+    zoo.add_enclosure(sample_enclosure)
+
+    sample_enclosure.environmental_type = 'Jungle'
+    assert zoo.find_compatible_enclosures(sample_lion) == []
+    sample_enclosure.environmental_type = 'Savannah'
+    sample_enclosure.animal_type = Bird
+    assert zoo.find_compatible_enclosures(sample_lion) == []
+    sample_enclosure.animal_type = Mammal
+    assert zoo.find_compatible_enclosures(sample_lion) == [sample_enclosure]
+
+    zoo.remove_enclosure(sample_enclosure)
+    assert zoo.find_compatible_enclosures(sample_lion) == []
+
+
+def test_find_compatible_enclosures_invalid_type(zoo):
+    """Test that a non-Animal argument raises TypeError."""
+    with pytest.raises(TypeError):
+        zoo.find_compatible_enclosures('Simba')
+
+
 # ===============================================
 #        Staff Management Tests
 # ===============================================
@@ -702,6 +967,228 @@ def test_remove_staff_invalid_type(zoo):
     with pytest.raises(TypeError):
         zoo.remove_staff(None)
 
+
+# ============================ Staff Lookup Tests =================================================
+# Test the animal -> staff and enclosure -> staff reverse indexes
+
+def test_staff_for_animal(zoo, sample_lion, sample_tiger, sample_zookeeper, sample_vet):
+    """Test finding the staff assigned to an animal."""
+    zoo.add_animals([sample_lion, sample_tiger])
+
+    # Assignments made before joining the zoo are indexed when the staff member is added
+    sample_zookeeper.assign_animal(sample_lion)
+    zoo.add_staff(sample_zookeeper)
+
+    # Assignments made afterwards are indexed by Staff.assign_animal
+    zoo.add_staff(sample_vet)
+    sample_vet.assign_animal(sample_lion)
+    sample_vet.assign_animal(sample_tiger)
+
+    assert zoo.staff_for(sample_lion) == [sample_zookeeper, sample_vet]
+    assert zoo.staff_for(sample_tiger) == [sample_vet]
+    with pytest.raises(TypeError):
+        zoo.staff_for('not an animal')
+
+
+def test_staff_for_enclosure(zoo, sample_enclosure, sample_zookeeper):
+    """Test finding the staff assigned to an enclosure."""
+    zoo.add_enclosure(sample_enclosure)
+    assert zoo.staff_for_enclosure(sample_enclosure) == []
+
+    zoo.add_staff(sample_zookeeper)
+    sample_zookeeper.assign_enclosure(sample_enclosure)
+    assert zoo.staff_for_enclosure(sample_enclosure) == [sample_zookeeper]
+    with pytest.raises(TypeError):
+        zoo.staff_for_enclosure('not an enclosure')
+
+
+def test_staff_for_after_remove_staff(zoo, sample_lion, sample_enclosure, sample_zookeeper):
+    """Test that removed staff members drop out of the reverse indexes."""
+    zoo.add_staff(sample_zookeeper)
+    sample_zookeeper.assign_animal(sample_lion)
+    sample_zookeeper.assign_enclosure(sample_enclosure)
+
+    zoo.remove_staff(sample_zookeeper)
+    assert zoo.staff_for(sample_lion) == []
+    assert zoo.staff_for_enclosure(sample_enclosure) == []
+
+
+def test_remove_enclosure_unlinks_staff(zoo, sample_enclosure, sample_zookeeper, sample_vet):
+    """Test that removing an enclosure unassigns it from every staff member."""
+    zoo.add_enclosure(sample_enclosure)
+    zoo.add_staff_members([sample_zookeeper, sample_vet])
+    sample_zookeeper.assign_enclosure(sample_enclosure)
+    sample_vet.assign_enclosure(sample_enclosure)
+
+    zoo.remove_enclosure(sample_enclosure)
+    assert zoo.staff_for_enclosure(sample_enclosure) == []
+    assert sample_enclosure not in sample_zookeeper.assigned_enclosures
+    assert sample_enclosure not in sample_vet.assigned_enclosures
+
+
+def test_staff_for_enclosure_after_unassign(zoo, sample_enclosure, sample_zookeeper):
+    """Test that Staff.unassign_enclosure updates the enclosure -> staff index."""
+    zoo.add_enclosure(sample_enclosure)
+    zoo.add_staff(sample_zookeeper)
+    sample_zookeeper.assign_enclosure(sample_enclosure)
+
+    sample_zookeeper.unassign_enclosure(sample_enclosure)
+    assert zoo.staff_for_enclosure(sample_enclosure) == []
+
+
+def test_add_staff_already_in_another_zoo(zoo, sample_zookeeper):
+    """Test that a staff member cannot work at two zoos at once."""
+    other_zoo = Zoo('Melbourne Zoo')
+    other_zoo.add_staff(sample_zookeeper)
+
+    with pytest.raises(ValueError):
+        zoo.add_staff(sample_zookeeper)
+    with pytest.raises(ValueError):
+        zoo.add_staff_members([sample_zookeeper])
+
+    # Once removed from the first zoo they can join the second
+    other_zoo.remove_staff(sample_zookeeper)
+    zoo.add_staff(sample_zookeeper)
+    assert sample_zookeeper in zoo.staff
+
+
+def test_get_staff_by_id(zoo, sample_zookeeper, sample_vet):
+    """Test looking up staff members by staff ID."""
+    zoo.add_staff_members([sample_zookeeper, sample_vet])
+    assert zoo.get_staff_by_id(101) is sample_zookeeper
+    assert zoo.get_staff_by_id(201) is sample_vet
+
+    # Removed staff members can no longer be found
+    zoo.remove_staff(sample_vet)
+    with pytest.raises(ValueError):
+        zoo.get_staff_by_id(201)
+
+
+def test_get_staff_by_id_invalid_type(zoo):
+    """Test that non-integer staff IDs raise TypeError."""
+    with pytest.raises(TypeError):
+        zoo.get_staff_by_id('101')
+    with pytest.raises(TypeError):
+        zoo.get_staff_by_id(True)
+
+
+def test_staff_by_role(zoo, sample_zookeeper, sample_vet):
+    """Test grouping staff members by role (case-insensitive)."""
+    second_keeper = Zookeeper('Jane', 102)
+    zoo.add_staff_members([sample_zookeeper, sample_vet, second_keeper])
+
+    assert zoo.staff_by_role('Zookeeper') == [sample_zookeeper, second_keeper]
+    assert zoo.staff_by_role('veterinarian') == [sample_vet]
+    assert zoo.staff_by_role('Curator') == []
+
+    zoo.remove_staff(sample_zookeeper)
+    assert zoo.staff_by_role('Zookeeper') == [second_keeper]
+
+
+def test_staff_by_role_after_role_change(zoo, sample_zookeeper):
+    """Test that changing a staff member's role moves them in the role index."""
+    zoo.add_staff(sample_zookeeper)
+    sample_zookeeper.role = 'Head Keeper'
+
+    assert zoo.staff_by_role('Zookeeper') == []
+    assert zoo.staff_by_role('Head Keeper') == [sample_zookeeper]
+
+
+def test_staff_by_role_keeps_zoo_order_after_role_change(zoo, sample_zookeeper):
+    """Test that a staff member who changes role and back keeps their place in the zoo order."""
+    second_keeper = Zookeeper('Jane', 102)
+    zoo.add_staff_members([sample_zookeeper, second_keeper])
+
+    sample_zookeeper.role = 'Vet'
+    sample_zookeeper.role = 'Zookeeper'
+    assert zoo.staff_by_role('Zookeeper') == [sample_zookeeper, second_keeper]
+
+
+def test_staff_by_role_validation(zoo):
+    """Test that invalid role arguments raise TypeError or ValueError."""
+    with pytest.raises(TypeError):
+        zoo.staff_by_role(None)
+    with pytest.raises(ValueError):
+        zoo.staff_by_role('  ')
+
+
+# ===============================================
+#            Bulk Loading Tests
+# ===============================================
+# Test adding animals, enclosures and staff in batches
+
+def test_add_animals_bulk(zoo, sample_lion, sample_tiger, sample_parrot):
+    """Test adding a batch of animals in one call."""
+    result = zoo.add_animals([sample_lion, sample_tiger, sample_parrot])
+
+    # A compact result object is returned instead of one message per animal
+    assert isinstance(result, BulkAddResult)
+    assert result.count == 3
+    assert result.kind == 'animals'
+    assert str(result) == '3 animals added to the zoo.'
+
+    # Animals are stored and indexed like single adds
+    assert zoo.animals == [sample_lion, sample_tiger, sample_parrot]
+    assert zoo.find_animal_by_name('Luna') is sample_tiger
+    assert zoo.list_animals_by_species('Parrot') == [sample_parrot]
+
+
+def test_add_animals_bulk_is_all_or_nothing(zoo, sample_lion, sample_tiger, sample_parrot):
+    """Test that an invalid item anywhere in the batch leaves the zoo unchanged."""
+    zoo.add_animal(sample_parrot)
+
+    # Invalid type at the end of the batch
+    with pytest.raises(TypeError):
+        zoo.add_animals([sample_lion, sample_tiger, 'not an animal'])
+    # Animal already in the zoo
+    with pytest.raises(ValueError):
+        zoo.add_animals([sample_lion, sample_parrot])
+    # Same animal twice in the batch
+    with pytest.raises(ValueError):
+        zoo.add_animals([sample_lion, sample_tiger, sample_lion])
+
+    assert zoo.animals == [sample_parrot]
+    with pytest.raises(ValueError):
+        zoo.find_animal_by_name('Simba')
+
+
+def test_add_enclosures_bulk(zoo, sample_enclosure):
+    """Test adding a batch of enclosures, all or nothing."""
+    aviary = Enclosure('Medium', 'Tropical', Bird, 90)
+    result = zoo.add_enclosures([sample_enclosure, aviary])
+    assert result.count == 2
+    assert zoo.enclosures == [sample_enclosure, aviary]
+
+    # A duplicate rejects the whole batch
+    pond = Enclosure('Small', 'Aquatic', Bird)
+    with pytest.raises(ValueError):
+        zoo.add_enclosures([pond, aviary])
+    with pytest.raises(TypeError):
+        zoo.add_enclosures([pond, 'not an enclosure'])
+    assert len(zoo.enclosures) == 2
+
+
+def test_add_staff_members_bulk(zoo, sample_zookeeper, sample_vet):
+    """Test adding a batch of staff members, all or nothing."""
+    result = zoo.add_staff_members([sample_zookeeper, sample_vet])
+    assert str(result) == '2 staff members added to the zoo.'
+    assert zoo.staff == [sample_zookeeper, sample_vet]
+
+    # Two new staff members sharing an ID reject the whole batch
+    with pytest.raises(ValueError):
+        zoo.add_staff_members([Zookeeper('Sam', 300), Veterinarian('Alex', 300)])
+    with pytest.raises(TypeError):
+        zoo.add_staff_members([Zookeeper('Sam', 300), None])
+    assert len(zoo.staff) == 2
+
+
+def test_add_bulk_empty_batch(zoo):
+    """Test that empty batches add nothing."""
+    assert zoo.add_animals([]).count == 0
+    assert zoo.add_enclosures(iter([])).count == 0
+    assert zoo.add_staff_members(()).count == 0
+
+
 # ===============================================
 #        Animal Enclosure Assignment Tests
 # ===============================================
@@ -825,6 +1312,104 @@ def test_assign_animal_invalid_enclosure_type(zoo, sample_lion):
         zoo.assign_animal_to_enclosure(sample_lion, 'not an enclosure')
 
 
+def test_reassign_animal_moves_it(zoo, sample_lion, sample_enclosure):
+    """Test that reassigning an animal removes it from its previous enclosure."""
+    second_enclosure = Enclosure('Medium', 'Savannah', Mammal, 90)
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosures([sample_enclosure, second_enclosure])
+
+    zoo.assign_animal_to_enclosure(sample_lion, sample_enclosure)
+    assert zoo.enclosure_of(sample_lion) is sample_enclosure
+
+    # Move the lion to the second enclosure
+    zoo.assign_animal_to_enclosure(sample_lion, second_enclosure)
+    assert zoo.enclosure_of(sample_lion) is second_enclosure
+    assert sample_lion not in sample_enclosure.animals
+    assert sample_lion in second_enclosure.animals
+
+
+def test_failed_move_keeps_animal_in_place(zoo, sample_lion, sample_enclosure):
+    """Test that a rejected move leaves the animal in its current enclosure."""
+    aviary = Enclosure('Medium', 'Savannah', Bird, 90)
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosures([sample_enclosure, aviary])
+    zoo.assign_animal_to_enclosure(sample_lion, sample_enclosure)
+
+    # The aviary only accepts birds
+    with pytest.raises(TypeError):
+        zoo.assign_animal_to_enclosure(sample_lion, aviary)
+    assert zoo.enclosure_of(sample_lion) is sample_enclosure
+    assert sample_lion in sample_enclosure.animals
+
+    # Assigning to the same enclosure again is rejected by the enclosure
+    with pytest.raises(ValueError):
+        zoo.assign_animal_to_enclosure(sample_lion, sample_enclosure)
+    assert zoo.enclosure_of(sample_lion) is sample_enclosure
+
+
+def test_move_after_direct_enclosure_changes(zoo, sample_lion, sample_enclosure):
+    """Test that enclosure_of follows Enclosure.add_animal/remove_animal called directly."""
+    second_enclosure = Enclosure('Medium', 'Savannah', Mammal, 90)
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosures([sample_enclosure, second_enclosure])
+
+    # Placing the animal directly is still tracked by the zoo
+    sample_enclosure.add_animal(sample_lion)
+    assert zoo.enclosure_of(sample_lion) is sample_enclosure
+
+    # Taking it out directly clears the map, so a later move does not raise
+    sample_enclosure.remove_animal(sample_lion)
+    assert zoo.enclosure_of(sample_lion) is None
+    zoo.assign_animal_to_enclosure(sample_lion, second_enclosure)
+    assert zoo.enclosure_of(sample_lion) is second_enclosure
+    assert sample_lion not in sample_enclosure.animals
+
+
+def test_direct_add_moves_animal_between_zoo_enclosures(zoo, sample_lion, sample_enclosure):
+    """Test that an animal lives in only one enclosure of the zoo, even with direct Enclosure calls."""
+    second_enclosure = Enclosure('Medium', 'Savannah', Mammal, 90)
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosures([sample_enclosure, second_enclosure])
+    zoo.assign_animal_to_enclosure(sample_lion, sample_enclosure)
+
+    # Adding the animal directly to a second zoo enclosure moves it there
+    second_enclosure.add_animal(sample_lion)
+    assert sample_lion not in sample_enclosure.animals
+    assert zoo.enclosure_of(sample_lion) is second_enclosure
+
+    second_enclosure.remove_animal(sample_lion)
+    assert zoo.enclosure_of(sample_lion) is None
+
+
+def test_enclosure_of_ignores_animals_outside_the_zoo(zoo, sample_lion, sample_enclosure):
+    """Test that animals placed directly in a zoo enclosure are not tracked unless they are in the zoo."""
+    zoo.add_enclosure(sample_enclosure)
+    sample_enclosure.add_animal(sample_lion)
+
+    # The zoo recorded nothing for the outsider
+    zoo.add_animal(sample_lion)
+    assert zoo.enclosure_of(sample_lion) is None
+
+
+def test_add_enclosure_with_animals_inside(zoo, sample_lion, sample_enclosure):
+    """Test that animals already inside an enclosure are tracked when it joins the zoo."""
+    zoo.add_animal(sample_lion)
+    sample_enclosure.add_animal(sample_lion)
+    zoo.add_enclosure(sample_enclosure)
+    assert zoo.enclosure_of(sample_lion) is sample_enclosure
+
+
+def test_enclosure_of(zoo, sample_lion):
+    """Test enclosure_of for unassigned animals and invalid input."""
+    zoo.add_animal(sample_lion)
+    assert zoo.enclosure_of(sample_lion) is None
+
+    with pytest.raises(TypeError):
+        zoo.enclosure_of('not an animal')
+    with pytest.raises(ValueError):
+        zoo.enclosure_of(Mammal('Nala', 'Lion', 4, 'Carnivore', 'Savannah', 'Roar', 'Tan', 'Warm-blooded'))
+
+
 # ===============================================
 #        Reporting and Display Tests
 # ===============================================
@@ -926,6 +1511,38 @@ def test_generate_report_with_critical_health(zoo, sample_lion):
     assert 'CRITICAL HEALTH ISSUES' in report
 
 
+def test_iter_report_matches_generate_report(zoo, sample_lion, sample_enclosure, sample_zookeeper):
+    """Test that the streamed report lines join to the full report."""
+    zoo.add_animal(sample_lion)
+    zoo.add_enclosure(sample_enclosure)
+    zoo.add_staff(sample_zookeeper)
+
+    lines = list(zoo.iter_report())
+
+    # Every chunk is a single line ending in a newline
+    assert all(line.endswith('\n') and line.count('\n') == 1 for line in lines)
+    assert ''.join(lines) == zoo.generate_report()
+
+
+def test_write_report_to_file_object(zoo, sample_lion, sample_tiger):
+    """Test that write_report writes the same text as generate_report."""
+    zoo.add_animal(sample_lion)
+    zoo.add_animal(sample_tiger)
+
+    # Small chunks force several write calls
+    buffer = io.StringIO()
+    zoo.write_report(buffer, chunk_size=2)
+    assert buffer.getvalue() == zoo.generate_report()
+
+
+def test_write_report_invalid_chunk_size(zoo):
+    """Test that write_report validates the chunk size."""
+    with pytest.raises(TypeError):
+        zoo.write_report(io.StringIO(), chunk_size='10')
+    with pytest.raises(ValueError):
+        zoo.write_report(io.StringIO(), chunk_size=0)
+
+
 # ============================ List Critical Health Tests =========================================
 # Test filtering animals with critical health issues
 
@@ -989,6 +1606,117 @@ def test_list_critical_health_multiple_critical(zoo, sample_lion, sample_tiger):
     assert sample_tiger in critical
 
 
+def test_list_critical_health_follows_severity_updates(zoo, sample_lion):
+    """Test that updating a record's severity updates the critical list."""
+    zoo.add_animal(sample_lion)
+    record = HealthRecord('Injury', '2025-11-10', 'low', 'Observe')
+    sample_lion.add_health_record(record)
+    assert zoo.list_animals_with_critical_health() == []
+
+    # Escalate the record
+    record.update_severity('critical')
+    assert zoo.list_animals_with_critical_health() == [sample_lion]
+
+    # Downgrade the record again
+    record.update_severity('medium')
+    assert zoo.list_animals_with_critical_health() == []
+
+
+def test_list_critical_health_animal_added_while_critical(zoo, sample_lion):
+    """Test that animals which are already critical when added are listed."""
+    sample_lion.add_health_record(HealthRecord('Injury', '2025-11-10', 'High', 'Rest'))
+    zoo.add_animal(sample_lion)
+    assert zoo.list_animals_with_critical_health() == [sample_lion]
+
+    # Removed animals drop out of the critical list
+    zoo.remove_animal(sample_lion)
+    assert zoo.list_animals_with_critical_health() == []
+
+
+# ============================ Health Event Tests =================================================
+# Test the zoo-wide, date-ordered health timelines
+
+def test_health_events_between(zoo, sample_lion, sample_tiger, sample_parrot):
+    """Test a zoo-wide date range scan across several animals."""
+    zoo.add_animals([sample_lion, sample_tiger, sample_parrot])
+    checkup = HealthRecord('Checkup', '2025-11-10', 'low', 'Routine')
+    injury = HealthRecord('Injury', '2025-11-03', 'high', 'Bandage')
+    old = HealthRecord('Vaccinated', '2025-10-01', 'low', 'Routine')
+    sample_lion.add_health_record(checkup)
+    sample_tiger.add_health_record(injury)
+    sample_parrot.add_health_record(old)
+
+    assert zoo.health_events_between('2025-11-01', '2025-11-30') == [(sample_tiger, injury), (sample_lion, checkup)]
+    assert zoo.health_events_between('2025-11-01', '2025-11-30', severity='HIGH') == [(sample_tiger, injury)]
+    assert zoo.health_events_between('2025-12-01', '2025-12-31') == []
+
+
+def test_latest_health_events(zoo, sample_lion, sample_tiger):
+    """Test newest-first queries, overall and per severity."""
+    zoo.add_animals([sample_lion, sample_tiger])
+    records = [HealthRecord(f'Check {day}', f'2025-11-{day:02d}', 'low' if day % 2 else 'critical', 'Routine')
+               for day in range(1, 7)]
+    for record in records:
+        sample_lion.add_health_record(record)
+
+    assert zoo.latest_health_events(2) == [(sample_lion, records[5]), (sample_lion, records[4])]
+    assert zoo.latest_health_events(2, severity='critical') == [(sample_lion, records[5]), (sample_lion, records[3])]
+    assert zoo.latest_health_events(0) == []
+    assert len(zoo.latest_health_events(100)) == 6
+
+
+def test_health_events_follow_changes(zoo, sample_lion):
+    """Test that date and severity changes, and removing the animal, update the timelines."""
+    record = HealthRecord('Injury', '2025-11-03', 'medium', 'Bandage')
+    sample_lion.add_health_record(record)
+
+    # Records added before the animal joined the zoo are indexed too
+    zoo.add_animal(sample_lion)
+    assert zoo.health_events_between('2025-11-03', '2025-11-03', 'medium') == [(sample_lion, record)]
+
+    record.date_reported = '2025-11-20'
+    assert zoo.health_events_between('2025-11-01', '2025-11-10') == []
+    assert zoo.health_events_between('2025-11-20', '2025-11-20') == [(sample_lion, record)]
+
+    record.severity_level = 'High'
+    assert zoo.latest_health_events(1, severity='medium') == []
+    assert zoo.latest_health_events(1, severity='high') == [(sample_lion, record)]
+
+    zoo.remove_animal(sample_lion)
+    assert zoo.latest_health_events(5) == []
+
+
+def test_count_health_events(zoo, sample_lion, sample_tiger):
+    """Test the zoo-wide and per-severity record counters."""
+    zoo.add_animals([sample_lion, sample_tiger])
+    sample_lion.add_health_record(HealthRecord('Checkup', '2025-11-01', 'Low', 'Routine'))
+    sample_tiger.add_health_record(HealthRecord('Injury', '2025-11-02', 'High', 'Bandage'))
+    record = HealthRecord('Fever', '2025-11-03', 'high', 'Rest')
+    sample_tiger.add_health_record(record)
+
+    assert zoo.count_health_events() == 3
+    assert zoo.count_health_events('HIGH') == 2
+    assert zoo.count_health_events(Severity.CRITICAL) == 0
+
+    record.severity_level = 'critical'
+    assert zoo.count_health_events(Severity.HIGH) == 1
+    assert zoo.count_health_events(Severity.CRITICAL) == 1
+
+
+def test_health_events_validation(zoo):
+    """Test that invalid arguments raise TypeError or ValueError."""
+    with pytest.raises(ValueError):
+        zoo.health_events_between('2025-11-10', '2025-11-01')
+    with pytest.raises(ValueError):
+        zoo.health_events_between('2025-11-01', '2025-11-10', severity='urgent')
+    with pytest.raises(TypeError):
+        zoo.latest_health_events('5')
+    with pytest.raises(ValueError):
+        zoo.latest_health_events(-1)
+    with pytest.raises(TypeError):
+        zoo.latest_health_events(5, severity=3)
+
+
 # ============================ List Animals By Species Tests ======================================
 # Test filtering animals by species
 
@@ -1080,6 +1808,56 @@ def test_list_by_species_empty_string(zoo):
         zoo.list_animals_by_species('   ')
 
 
+def test_list_by_species_after_species_change(zoo, sample_lion, sample_tiger):
+    """Test that changing an animal's species updates the species index."""
+    zoo.add_animal(sample_lion)
+    zoo.add_animal(sample_tiger)
+
+    # Re-classify the tiger as a lion
+    sample_tiger.species = 'Lion'
+    assert zoo.list_animals_by_species('lion') == [sample_lion, sample_tiger]
+    assert zoo.list_animals_by_species('Tiger') == []
+
+
+def test_animals_grouped_by_species(zoo, sample_lion, sample_tiger, sample_parrot):
+    """Test grouping every animal by species in one call."""
+    nala = Mammal('Nala', 'lion', 4, 'Carnivore', 'Savannah', 'Roar', 'Tan', 'Warm-blooded')
+    zoo.add_animal(sample_lion)
+    zoo.add_animal(sample_tiger)
+    zoo.add_animal(sample_parrot)
+    zoo.add_animal(nala)
+
+    groups = zoo.animals_grouped_by_species()
+
+    # Species match case-insensitively and keep the first spelling
+    assert set(groups) == {'Lion', 'Tiger', 'Parrot'}
+    assert groups['Lion'] == [sample_lion, nala]
+    assert groups['Tiger'] == [sample_tiger]
+    assert groups['Parrot'] == [sample_parrot]
+
+
+def test_species_lookups_after_species_change_keep_zoo_order(zoo, sample_lion, sample_tiger, sample_parrot):
+    """Test that re-classified animals are listed and grouped in zoo order."""
+    zoo.add_animals([sample_tiger, sample_parrot, sample_lion])
+
+    # The tiger was added first, so it leads the lion group once it becomes a 'LION'
+    sample_tiger.species = 'LION'
+    assert zoo.list_animals_by_species('Lion') == [sample_tiger, sample_lion]
+
+    groups = zoo.animals_grouped_by_species()
+    assert list(groups) == ['LION', 'Parrot']
+    assert groups['LION'] == [sample_tiger, sample_lion]
+
+
+def test_animals_grouped_by_species_after_remove(zoo, sample_lion):
+    """Test that empty species groups disappear when their last animal is removed."""
+    assert zoo.animals_grouped_by_species() == {}
+
+    zoo.add_animal(sample_lion)
+    zoo.remove_animal(sample_lion)
+    assert zoo.animals_grouped_by_species() == {}
+
+
 # ============================ String Method Test =================================================
 # Test __str__ method
 
@@ -1101,3 +1879,25 @@ def test_str_method_with_entities(zoo, sample_lion, sample_enclosure):
     assert 'Savannah' in zoo_str
 
 
+
+
+def test_list_critical_health_keeps_zoo_order(zoo, sample_lion, sample_tiger):
+    """Test that critical animals are listed in the order they were added to the zoo."""
+    zoo.add_animals([sample_lion, sample_tiger])
+
+    # The tiger becomes critical first, but the lion was added to the zoo first
+    sample_tiger.add_health_record(HealthRecord('Injury', '2025-11-10', 'critical', 'Surgery'))
+    sample_lion.add_health_record(HealthRecord('Illness', '2025-11-11', 'high', 'Rest'))
+    assert zoo.list_animals_with_critical_health() == [sample_lion, sample_tiger]
+
+
+def test_zoo_animals_view_snapshot_for_removal(zoo, sample_lion, sample_tiger):
+    """Test that removing animals while iterating needs a list snapshot of the live view."""
+    zoo.add_animals([sample_lion, sample_tiger])
+    with pytest.raises(RuntimeError):
+        for animal in zoo.animals:
+            zoo.remove_animal(animal)
+
+    for animal in list(zoo.animals):
+        zoo.remove_animal(animal)
+    assert zoo.count_animals() == 0
@@ -6,10 +6,53 @@ ID: 110481368
 Username: SIDAY032
 This is my own work as defined by the University's Academic Integrity Policy.
 """
+from itertools import count
+
 from animal import Animal
+from collection_view import ReadOnlyView
 from enclosure import Enclosure
+from health_record import HealthRecord, Severity
+from health_timeline import HealthTimeline
 from staff import Staff
 
+
+class BulkAddResult:
+    """
+    Compact summary returned by the Zoo bulk loading methods
+    (add_animals, add_enclosures, add_staff_members).
+
+    Attributes:
+        __kind (str): What was added (e.g. 'animals').
+        __count (int): How many items were added.
+    """
+
+    def __init__(self, kind: str, count: int) -> None:
+        """
+        Initialize a new BulkAddResult.
+
+        Args:
+            kind (str): What was added (e.g. 'animals').
+            count (int): How many items were added.
+        """
+        self.__kind = kind
+        self.__count = count
+
+    def get_kind(self) -> str:
+        """Return what was added."""
+        return self.__kind
+
+    def get_count(self) -> int:
+        """Return how many items were added."""
+        return self.__count
+
+    kind = property(get_kind)  # Read-only
+    count = property(get_count)  # Read-only
+
+    def __str__(self) -> str:
+        """Return a one line confirmation message."""
+        return f'{self.__count} {self.__kind} added to the zoo.'
+
+
 class Zoo:
     """
     Represents the entire zoo system, responsible for managing
@@ -17,9 +60,21 @@ class Zoo:
 
     Attributes:
         _name (str): The name of the zoo.
-        __animals (list): List of all animals in the zoo.
-        __enclosures (list): List of all enclosures in the zoo.
-        __staff (list): List of all staff members in the zoo.
+        __animals (dict): All animals in the zoo, keyed by animal_id (insertion-ordered).
+        __animal_positions (dict): animal_id -> sequence number of when the animal was added to the zoo.
+        __animals_by_name (dict): Case-folded animal name -> animals with that name.
+        __animals_by_species (dict): Case-folded species -> animals of that species.
+        __critical_animals (dict): Animals that currently have critical health issues.
+        __health_timeline (HealthTimeline): (animal, record) events for every animal, sorted by reported date.
+        __health_timeline_by_severity (dict): Severity -> HealthTimeline of records with that severity.
+        __animal_enclosures (dict): animal_id -> the enclosure the animal is currently assigned to.
+        __animal_staff (dict): animal_id -> staff members (by staff_id) assigned to that animal.
+        __enclosure_staff (dict): enclosure_id -> staff members (by staff_id) assigned to that enclosure.
+        __enclosures (dict): All enclosures in the zoo, keyed by enclosure_id (insertion-ordered).
+        __enclosures_by_placement (dict): (environmental type, animal type) -> enclosures (by enclosure_id).
+        __staff (dict): All staff members in the zoo, keyed by staff_id (insertion-ordered).
+        __staff_positions (dict): staff_id -> sequence number of when the staff member was added to the zoo.
+        __staff_by_role (dict): Case-folded role -> staff members (by staff_id) with that role.
     """
 
 # ============================ Constructor ========================================================
@@ -33,10 +88,24 @@ class Zoo:
         # Use property to ensure validation via setter
         self.name = name
 
-        # Initialize empty lists for zoo entities
-        self.__animals = []
-        self.__enclosures = []
-        self.__staff = []
+        # Initialize empty containers for zoo entities.
+        # Animals, enclosures and staff are keyed by their unique IDs so membership, add and remove are O(1).
+        self.__animals = {}
+        self.__animal_positions = {}
+        self.__add_sequence = count()
+        self.__animals_by_name = {}
+        self.__animals_by_species = {}
+        self.__critical_animals = {}
+        self.__health_timeline = HealthTimeline()
+        self.__health_timeline_by_severity = {level: HealthTimeline() for level in Severity}
+        self.__animal_enclosures = {}
+        self.__animal_staff = {}
+        self.__enclosure_staff = {}
+        self.__enclosures = {}
+        self.__enclosures_by_placement = {}
+        self.__staff = {}
+        self.__staff_positions = {}
+        self.__staff_by_role = {}
 
 # ============================ Getters ============================================================
     # Return the current value of each zoo attribute
@@ -44,17 +113,37 @@ class Zoo:
         """Return the zoo's name."""
         return self._name
 
-    def get_animals(self) -> list:
-        """Return a copy of the animals list."""
-        return list(self.__animals)
+    def get_animals(self) -> ReadOnlyView:
+        """
+        Return a read-only view of the animals (no copy is made).
+
+        The view is live, so iterate over list(zoo.animals) when adding or removing
+        animals inside the loop; changing the zoo while iterating the view itself
+        raises RuntimeError. Integer indexing (zoo.animals[i]) walks the underlying
+        dict and costs O(n) per call, so loop over the view rather than over
+        range(len(zoo.animals)), or take a list first for repeated random access.
+        """
+        return ReadOnlyView(self.__animals, Animal.get_animal_id)
+
+    def get_enclosures(self) -> ReadOnlyView:
+        """Return a read-only view of the enclosures (no copy is made)."""
+        return ReadOnlyView(self.__enclosures, Enclosure.get_enclosure_id)
+
+    def get_staff(self) -> ReadOnlyView:
+        """Return a read-only view of the staff members (no copy is made)."""
+        return ReadOnlyView(self.__staff, Staff.get_staff_id)
 
-    def get_enclosures(self) -> list:
-        """Return a copy of the enclosures list."""
-        return list(self.__enclosures)
+    def count_animals(self) -> int:
+        """Return the number of animals in the zoo."""
+        return len(self.__animals)
 
-    def get_staff(self) -> list:
-        """Return a copy of the staff list."""
-        return list(self.__staff)
+    def count_enclosures(self) -> int:
+        """Return the number of enclosures in the zoo."""
+        return len(self.__enclosures)
+
+    def count_staff(self) -> int:
+        """Return the number of staff members in the zoo."""
+        return len(self.__staff)
 
 # ============================ Setters ============================================================
     # Validate and set new values for zoo attributes
@@ -77,9 +166,9 @@ class Zoo:
 # ============================ Properties =========================================================
     # Define properties for attribute access
     name = property(get_name, set_name)
-    animals = property(get_animals)  # Read-only
-    enclosures = property(get_enclosures)  # Read-only
-    staff = property(get_staff)  # Read-only
+    animals = property(get_animals)  # Read-only view
+    enclosures = property(get_enclosures)  # Read-only view
+    staff = property(get_staff)  # Read-only view
 
 # ============================ Animal Management ==================================================
     # Methods for managing animals in the zoo
@@ -102,17 +191,24 @@ class Zoo:
             raise TypeError('Only Animal objects can be added to the zoo.')
 
         # Check for duplicate animals
-        if animal in self.__animals:
+        if animal.animal_id in self.__animals:
             raise ValueError(f'{animal.name} the {animal.species} is already in the zoo.')
 
-        # Add animal to zoo
-        self.__animals.append(animal)
+        # An animal can only be indexed by one zoo at a time
+        if animal._zoo is not None:
+            raise ValueError(f'{animal.name} the {animal.species} already belongs to {animal._zoo.name}.')
+
+        # Add animal to zoo and its lookup indexes
+        self.__animals[animal.animal_id] = animal
+        self.__index_animal(animal)
+        animal._zoo = self
         return f'{animal.name} the {animal.species} has been added to the zoo.'
 
 
     def remove_animal(self, animal: Animal) -> str:
         """
-        Removes an animal from the zoo.
+        Removes an animal from the zoo, together with its enclosure
+        placement and any staff assignments.
 
         Args:
             animal (Animal): The animal to remove from the zoo.
@@ -129,11 +225,22 @@ class Zoo:
             raise TypeError('Only Animal objects can be removed from the zoo.')
 
         # Check if animal exists in zoo
-        if animal not in self.__animals:
+        if animal.animal_id not in self.__animals:
             raise ValueError(f'{animal.name} the {animal.species} is not in the zoo.')
 
-        # Remove animal from zoo
-        self.__animals.remove(animal)
+        # Unlink the animal from its enclosure and staff using the reverse indexes first,
+        # so nothing in the zoo keeps a reference to it. A zoo animal lives in at most one
+        # enclosure of the zoo (see _enclosure_animal_added), so the map names the only one.
+        enclosure = self.__animal_enclosures.pop(animal.animal_id, None)
+        if enclosure is not None and animal in enclosure.animals:
+            enclosure.remove_animal(animal)
+        for staff_member in list(self.__animal_staff.get(animal.animal_id, {}).values()):
+            staff_member.unassign_animal(animal)
+
+        # Remove animal from zoo and its lookup indexes
+        del self.__animals[animal.animal_id]
+        self.__unindex_animal(animal)
+        animal._zoo = None
         return f'{animal.name} the {animal.species} has been removed from the zoo.'
 
     def find_animal_by_name(self, name: str) -> Animal:
@@ -148,7 +255,29 @@ class Zoo:
             ValueError: If name is empty or animal not found.
 
         Returns:
-            Animal: The animal with the matching name.
+            Animal: The first animal added to the zoo with the matching name.
+        """
+        # Look up every animal with this name and return the first one
+        matches = self.find_animals_by_name(name)
+        if matches:
+            return matches[0]
+
+        # Animal not found
+        raise ValueError(f'No animal named "{name}" found in the zoo.')
+
+    def find_animals_by_name(self, name: str) -> list:
+        """
+        Find every animal in the zoo with the given name (case-insensitive).
+
+        Args:
+            name (str): The name of the animals to find.
+
+        Raises:
+            TypeError: If name is not a string.
+            ValueError: If name is empty.
+
+        Returns:
+            list: List of Animal objects with the matching name, in the order they were added to the zoo (empty if none).
         """
         # Validate name type
         if not isinstance(name, str):
@@ -158,13 +287,93 @@ class Zoo:
         if name.strip() == '':
             raise ValueError('Name cannot be empty.')
 
-        # Search for animal by name
-        for animal in self.__animals:
-            if animal.name.lower() == name.lower():
-                return animal
+        # Single dictionary lookup in the case-folded name index
+        return self.__in_zoo_order(self.__animals_by_name.get(name.casefold(), {}).values())
+
+# ============================ Animal Indexes =====================================================
+    # Keep the secondary lookup indexes in step with the animals dictionary
+    def __index_animal(self, animal: Animal) -> None:
+        """Add an animal to the secondary lookup indexes."""
+        self.__animal_positions[animal.animal_id] = next(self.__add_sequence)
+        self.__animals_by_name.setdefault(animal.name.casefold(), {})[animal.animal_id] = animal
+        self.__animals_by_species.setdefault(animal.species.casefold(), {})[animal.animal_id] = animal
+        if animal.has_critical_health_issues():
+            self.__critical_animals[animal.animal_id] = animal
+        for record in animal.display_health_records():
+            self._health_record_added(animal, record)
+
+    def __unindex_animal(self, animal: Animal) -> None:
+        """Remove an animal from the secondary lookup indexes."""
+        self.__animal_positions.pop(animal.animal_id, None)
+        self.__discard_from_index(self.__animals_by_name, animal.name.casefold(), animal)
+        self.__discard_from_index(self.__animals_by_species, animal.species.casefold(), animal)
+        self.__critical_animals.pop(animal.animal_id, None)
+        for record in animal.display_health_records():
+            self.__unindex_health_record(record, record.date_ordinal, record.severity)
+
+    @staticmethod
+    def __discard_from_index(index: dict, key, animal: Animal) -> None:
+        """Remove an animal from one bucket of an index, dropping the bucket once it is empty."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(animal.animal_id, None)
+            if not bucket:
+                del index[key]
+
+    def __in_zoo_order(self, animals) -> list:
+        """
+        Return animals from an index bucket in the order they were added to the zoo.
+        Renamed or re-speciated animals are appended to the end of their new bucket,
+        so buckets are sorted by zoo position when read (buckets are small).
+        """
+        return sorted(animals, key=lambda animal: self.__animal_positions[animal.animal_id])
 
-        # Animal not found
-        raise ValueError(f'No animal named "{name}" found in the zoo.')
+    def _animal_renamed(self, animal: Animal, old_name: str) -> None:
+        """
+        Move an animal to its new bucket in the name index.
+        Called by the Animal.name setter when an animal owned by this zoo is renamed.
+        """
+        self.__discard_from_index(self.__animals_by_name, old_name.casefold(), animal)
+        self.__animals_by_name.setdefault(animal.name.casefold(), {})[animal.animal_id] = animal
+
+    def _animal_respeciated(self, animal: Animal, old_species: str) -> None:
+        """
+        Move an animal to its new bucket in the species index.
+        Called by the Animal.species setter when an animal owned by this zoo changes species.
+        """
+        self.__discard_from_index(self.__animals_by_species, old_species.casefold(), animal)
+        self.__animals_by_species.setdefault(animal.species.casefold(), {})[animal.animal_id] = animal
+
+    def _animal_health_changed(self, animal: Animal) -> None:
+        """
+        Add or drop an animal from the critical health set.
+        Called by Animal when one of its health records is added or changes severity.
+        """
+        if animal.has_critical_health_issues():
+            self.__critical_animals[animal.animal_id] = animal
+        else:
+            self.__critical_animals.pop(animal.animal_id, None)
+
+    def _health_record_added(self, animal: Animal, record: HealthRecord) -> None:
+        """
+        Add a health record to the health timelines.
+        Called by Animal.add_health_record for animals owned by this zoo.
+        """
+        self.__health_timeline.add(animal, record, record.date_ordinal)
+        self.__health_timeline_by_severity[record.severity].add(animal, record, record.date_ordinal)
+
+    def _health_record_changed(self, animal: Animal, record: HealthRecord, old_ordinal: int, old_severity: Severity) -> None:
+        """
+        Move a health record whose date or severity changed within the health timelines.
+        Called by Animal for records of animals owned by this zoo.
+        """
+        self.__unindex_health_record(record, old_ordinal, old_severity)
+        self._health_record_added(animal, record)
+
+    def __unindex_health_record(self, record: HealthRecord, ordinal: int, severity: Severity) -> None:
+        """Remove a health record from the health timelines, given the date and severity it was indexed with."""
+        self.__health_timeline.remove(record, ordinal)
+        self.__health_timeline_by_severity[severity].remove(record, ordinal)
 
 # ============================ Enclosure Management ===============================================
     # Methods for managing enclosures in the zoo
@@ -177,7 +386,7 @@ class Zoo:
 
         Raises:
             TypeError: If enclosure is not an Enclosure instance.
-            ValueError: If enclosure is already in the zoo.
+            ValueError: If enclosure is already in the zoo or belongs to another zoo.
 
         Returns:
             str: Confirmation message after adding the enclosure.
@@ -187,16 +396,21 @@ class Zoo:
             raise TypeError('Only Enclosure objects can be added to the zoo.')
 
         # Check for duplicate enclosures
-        if enclosure in self.__enclosures:
+        if enclosure.enclosure_id in self.__enclosures:
             raise ValueError(f'{enclosure.environmental_type} enclosure is already in the zoo.')
 
-        # Add enclosure to zoo
-        self.__enclosures.append(enclosure)
+        # An enclosure can only be indexed by one zoo at a time
+        if enclosure._zoo is not None:
+            raise ValueError(f'{enclosure.environmental_type} enclosure already belongs to {enclosure._zoo.name}.')
+
+        # Add enclosure to zoo and its placement index
+        self.__enclosures[enclosure.enclosure_id] = enclosure
+        self.__index_enclosure(enclosure)
         return f'{enclosure.environmental_type} enclosure has been added to the zoo.'
 
     def remove_enclosure(self, enclosure: Enclosure) -> str:
         """
-        Removes an enclosure from the zoo.
+        Removes an enclosure from the zoo, together with any staff assignments.
 
         Args:
             enclosure (Enclosure): The enclosure to remove from the zoo.
@@ -213,17 +427,113 @@ class Zoo:
             raise TypeError('Only Enclosure objects can be removed from the zoo.')
 
         # Check if enclosure exists in zoo
-        if enclosure not in self.__enclosures:
+        if enclosure.enclosure_id not in self.__enclosures:
             raise ValueError(f'{enclosure.environmental_type} enclosure is not in the zoo.')
 
         # Check if enclosure still has animals
-        if len(enclosure.animals) > 0:
-            raise ValueError(f'Cannot remove enclosure: it still contains {len(enclosure.animals)} animal(s).')
+        if enclosure.count_animals() > 0:
+            raise ValueError(f'Cannot remove enclosure: it still contains {enclosure.count_animals()} animal(s).')
 
-        # Remove enclosure from zoo
-        self.__enclosures.remove(enclosure)
+        # Remove enclosure from zoo and its placement index
+        del self.__enclosures[enclosure.enclosure_id]
+        self.__unindex_enclosure(enclosure)
+
+        # Unlink the enclosure from its staff using the reverse index
+        for staff_member in list(self.__enclosure_staff.get(enclosure.enclosure_id, {}).values()):
+            staff_member.unassign_enclosure(enclosure)
         return f'{enclosure.environmental_type} enclosure has been removed from the zoo.'
 
+    def find_compatible_enclosures(self, animal: Animal) -> list:
+        """
+        Returns the enclosures in this zoo that accept an animal's class and environment.
+
+        The animal does not have to be in the zoo yet, so shipments can be planned before intake.
+        Capacity and the animal's health are not checked.
+
+        Args:
+            animal (Animal): The animal to find enclosures for.
+
+        Raises:
+            TypeError: If animal is not an Animal instance.
+
+        Returns:
+            list: Compatible Enclosure objects (empty if none).
+        """
+        # Validate type
+        if not isinstance(animal, Animal):
+            raise TypeError('animal must be an Animal instance.')
+
+        # An enclosure for a class also accepts its subclasses, so look up every
+        # Animal class the animal inherits from (one dictionary lookup each)
+        buckets = [self.__enclosures_by_placement.get((animal.environment, animal_class))
+                   for animal_class in type(animal).__mro__ if issubclass(animal_class, Animal)]
+        buckets = [bucket for bucket in buckets if bucket]
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+
+        # Several buckets match (or none): merge them in enclosure creation order
+        return sorted((enclosure for bucket in buckets for enclosure in bucket.values()),
+                      key=Enclosure.get_enclosure_id)
+
+# ============================ Enclosure Indexes ==================================================
+    # Keep the placement index in step with the enclosures dictionary
+    @staticmethod
+    def __placement_key(enclosure: Enclosure) -> tuple:
+        """Return the placement index key of an enclosure."""
+        return enclosure.environmental_type, enclosure.animal_type
+
+    def __index_enclosure(self, enclosure: Enclosure) -> None:
+        """Add an enclosure and the animals already inside it to the indexes and claim ownership."""
+        enclosure._zoo = self
+        self.__enclosures_by_placement.setdefault(self.__placement_key(enclosure), {})[enclosure.enclosure_id] = enclosure
+        for animal in enclosure.animals:
+            self._enclosure_animal_added(enclosure, animal)
+
+    def __unindex_enclosure(self, enclosure: Enclosure) -> None:
+        """Remove an enclosure from the placement index and release ownership."""
+        enclosure._zoo = None
+        self.__discard_enclosure(self.__placement_key(enclosure), enclosure)
+
+    def __discard_enclosure(self, key: tuple, enclosure: Enclosure) -> None:
+        """Remove an enclosure from one bucket of the placement index, dropping the bucket once it is empty."""
+        bucket = self.__enclosures_by_placement.get(key)
+        if bucket is not None:
+            bucket.pop(enclosure.enclosure_id, None)
+            if not bucket:
+                del self.__enclosures_by_placement[key]
+
+    def _enclosure_retyped(self, enclosure: Enclosure, old_environment: str, old_animal_type: type) -> None:
+        """
+        Move an enclosure to its new bucket in the placement index.
+        Called by the Enclosure environmental_type and animal_type setters for enclosures in this zoo.
+        """
+        self.__discard_enclosure((old_environment, old_animal_type), enclosure)
+        self.__enclosures_by_placement.setdefault(self.__placement_key(enclosure), {})[enclosure.enclosure_id] = enclosure
+
+    def _enclosure_animal_added(self, enclosure: Enclosure, animal: Animal) -> None:
+        """
+        Record that an animal of this zoo now lives in an enclosure.
+        Called by Enclosure.add_animal for enclosures in this zoo, including direct calls
+        that bypass assign_animal_to_enclosure.
+
+        An animal lives in one enclosure of the zoo at a time, so it is taken out of its
+        previous enclosure. Animals that are not in the zoo are not tracked.
+        """
+        if animal.animal_id not in self.__animals:
+            return
+        previous = self.__animal_enclosures.get(animal.animal_id)
+        self.__animal_enclosures[animal.animal_id] = enclosure
+        if previous is not None and previous is not enclosure and animal in previous.animals:
+            previous.remove_animal(animal)
+
+    def _enclosure_animal_removed(self, enclosure: Enclosure, animal: Animal) -> None:
+        """
+        Forget an animal's enclosure once it has been taken out of it.
+        Called by Enclosure.remove_animal for enclosures in this zoo.
+        """
+        if self.__animal_enclosures.get(animal.animal_id) is enclosure:
+            del self.__animal_enclosures[animal.animal_id]
+
 # ============================ Staff Management ===================================================
     # Methods for managing staff members in the zoo
     def add_staff(self, staff_member: Staff) -> str:
@@ -235,7 +545,7 @@ class Zoo:
 
         Raises:
             TypeError: If staff_member is not a Staff instance.
-            ValueError: If staff member is already in the zoo.
+            ValueError: If staff member is already in the zoo or works at another zoo.
 
         Returns:
             str: Confirmation message after adding the staff member.
@@ -244,12 +554,17 @@ class Zoo:
         if not isinstance(staff_member, Staff):
             raise TypeError('Only Staff objects can be added to the zoo.')
 
-        # Check for duplicate staff (by staff_id using __eq__)
-        if staff_member in self.__staff:
+        # Check for duplicate staff (by staff_id)
+        if staff_member.staff_id in self.__staff:
             raise ValueError(f'{staff_member.name} (ID: {staff_member.staff_id}) is already in the zoo.')
 
-        # Add staff member to zoo
-        self.__staff.append(staff_member)
+        # A staff member can only be indexed by one zoo at a time
+        if staff_member._zoo is not None:
+            raise ValueError(f'{staff_member.name} (ID: {staff_member.staff_id}) already works at {staff_member._zoo.name}.')
+
+        # Add staff member to zoo and index their existing assignments
+        self.__staff[staff_member.staff_id] = staff_member
+        self.__index_staff(staff_member)
         return f'{staff_member.name} ({staff_member.role}) has been added to the zoo staff.'
 
     def remove_staff(self, staff_member: Staff) -> str:
@@ -271,13 +586,277 @@ class Zoo:
             raise TypeError('Only Staff objects can be removed from the zoo.')
 
         # Check if staff member exists in zoo
-        if staff_member not in self.__staff:
+        if staff_member.staff_id not in self.__staff:
             raise ValueError(f'{staff_member.name} is not in the zoo staff.')
 
-        # Remove staff member from zoo
-        self.__staff.remove(staff_member)
+        # Remove the stored staff member (matched by staff_id) and their assignments from the indexes
+        stored = self.__staff.pop(staff_member.staff_id)
+        self.__unindex_staff(stored)
         return f'{staff_member.name} ({staff_member.role}) has been removed from the zoo staff.'
 
+    def get_staff_by_id(self, staff_id: int) -> Staff:
+        """
+        Find a staff member in the zoo by staff ID.
+
+        Args:
+            staff_id (int): The ID of the staff member to find.
+
+        Raises:
+            TypeError: If staff_id is not an integer.
+            ValueError: If no staff member with this ID works at the zoo.
+
+        Returns:
+            Staff: The staff member with the matching ID.
+        """
+        # Validate type (bool is an int subclass but never a valid ID)
+        if not isinstance(staff_id, int) or isinstance(staff_id, bool):
+            raise TypeError('Staff ID must be an integer.')
+
+        # Single dictionary lookup by staff_id
+        staff_member = self.__staff.get(staff_id)
+        if staff_member is None:
+            raise ValueError(f'No staff member with ID {staff_id} found in the zoo.')
+        return staff_member
+
+    def staff_by_role(self, role: str) -> list:
+        """
+        Returns every staff member with the given role (case-insensitive).
+
+        Args:
+            role (str): The role to look up, e.g. 'Veterinarian'.
+
+        Raises:
+            TypeError: If role is not a string.
+            ValueError: If role is empty.
+
+        Returns:
+            list: Staff objects with the matching role, in the order they were added (empty if none).
+        """
+        # Validate role type
+        if not isinstance(role, str):
+            raise TypeError('Role must be a string.')
+
+        # Validate role not empty
+        if role.strip() == '':
+            raise ValueError('Role cannot be empty.')
+
+        # Single dictionary lookup in the case-folded role index. Staff who change role are
+        # appended to their new bucket, so the (small) bucket is sorted back into zoo order.
+        return sorted(self.__staff_by_role.get(role.casefold(), {}).values(),
+                      key=lambda staff_member: self.__staff_positions[staff_member.staff_id])
+
+    def staff_for(self, animal: Animal) -> list:
+        """
+        Returns the staff members of this zoo assigned to an animal.
+
+        Args:
+            animal (Animal): The animal to look up.
+
+        Raises:
+            TypeError: If animal is not an Animal instance.
+
+        Returns:
+            list: Staff objects assigned to the animal (empty if none).
+        """
+        # Validate type
+        if not isinstance(animal, Animal):
+            raise TypeError('animal must be an Animal instance.')
+
+        # Single lookup in the animal -> staff index
+        return list(self.__animal_staff.get(animal.animal_id, {}).values())
+
+    def staff_for_enclosure(self, enclosure: Enclosure) -> list:
+        """
+        Returns the staff members of this zoo assigned to an enclosure.
+
+        Args:
+            enclosure (Enclosure): The enclosure to look up.
+
+        Raises:
+            TypeError: If enclosure is not an Enclosure instance.
+
+        Returns:
+            list: Staff objects assigned to the enclosure (empty if none).
+        """
+        # Validate type
+        if not isinstance(enclosure, Enclosure):
+            raise TypeError('enclosure must be an Enclosure instance.')
+
+        # Single lookup in the enclosure -> staff index
+        return list(self.__enclosure_staff.get(enclosure.enclosure_id, {}).values())
+
+# ============================ Staff Indexes ======================================================
+    # Keep the role, animal -> staff and enclosure -> staff indexes in step with the staff members
+    def __index_staff(self, staff_member: Staff) -> None:
+        """Add a staff member to the role index, index their assignments and claim ownership."""
+        staff_member._zoo = self
+        self.__staff_positions[staff_member.staff_id] = next(self.__add_sequence)
+        self.__staff_by_role.setdefault(staff_member.role.casefold(), {})[staff_member.staff_id] = staff_member
+        for animal in staff_member.assigned_animals:
+            self._staff_assigned_animal(staff_member, animal)
+        for enclosure in staff_member.assigned_enclosures:
+            self._staff_assigned_enclosure(staff_member, enclosure)
+
+    def __unindex_staff(self, staff_member: Staff) -> None:
+        """Remove a staff member from the role and reverse indexes and release ownership."""
+        staff_member._zoo = None
+        self.__staff_positions.pop(staff_member.staff_id, None)
+        self.__discard_staff(self.__staff_by_role, staff_member.role.casefold(), staff_member)
+        for animal in staff_member.assigned_animals:
+            self.__discard_staff(self.__animal_staff, animal.animal_id, staff_member)
+        for enclosure in staff_member.assigned_enclosures:
+            self.__discard_staff(self.__enclosure_staff, enclosure.enclosure_id, staff_member)
+
+    @staticmethod
+    def __discard_staff(index: dict, key: int, staff_member: Staff) -> None:
+        """Remove a staff member from one bucket of a staff index, dropping the bucket once it is empty."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(staff_member.staff_id, None)
+            if not bucket:
+                del index[key]
+
+    def _staff_role_changed(self, staff_member: Staff, old_role: str) -> None:
+        """
+        Move a staff member to their new bucket in the role index.
+        Called by the Staff.role setter when a staff member working at this zoo changes role.
+        """
+        self.__discard_staff(self.__staff_by_role, old_role.casefold(), staff_member)
+        self.__staff_by_role.setdefault(staff_member.role.casefold(), {})[staff_member.staff_id] = staff_member
+
+    def _staff_assigned_animal(self, staff_member: Staff, animal: Animal) -> None:
+        """
+        Record that a staff member looks after an animal.
+        Called by Staff.assign_animal for staff members working at this zoo.
+        """
+        self.__animal_staff.setdefault(animal.animal_id, {})[staff_member.staff_id] = staff_member
+
+    def _staff_unassigned_animal(self, staff_member: Staff, animal: Animal) -> None:
+        """
+        Record that a staff member no longer looks after an animal.
+        Called by Staff.unassign_animal for staff members working at this zoo.
+        """
+        self.__discard_staff(self.__animal_staff, animal.animal_id, staff_member)
+
+    def _staff_assigned_enclosure(self, staff_member: Staff, enclosure: Enclosure) -> None:
+        """
+        Record that a staff member looks after an enclosure.
+        Called by Staff.assign_enclosure for staff members working at this zoo.
+        """
+        self.__enclosure_staff.setdefault(enclosure.enclosure_id, {})[staff_member.staff_id] = staff_member
+
+    def _staff_unassigned_enclosure(self, staff_member: Staff, enclosure: Enclosure) -> None:
+        """
+        Record that a staff member no longer looks after an enclosure.
+        Called by Staff.unassign_enclosure for staff members working at this zoo.
+        """
+        self.__discard_staff(self.__enclosure_staff, enclosure.enclosure_id, staff_member)
+
+# ============================ Bulk Loading =======================================================
+    # Batch versions of the add methods: validate everything first, then add all or nothing
+    def add_animals(self, animals) -> BulkAddResult:
+        """
+        Adds a batch of animals to the zoo in one step.
+
+        The whole batch is validated before anything is added, so on error
+        the zoo is left unchanged.
+
+        Args:
+            animals (iterable): The Animal objects to add.
+
+        Raises:
+            TypeError: If any item is not an Animal instance.
+            ValueError: If an animal appears twice in the batch, is already in the zoo,
+                        or belongs to another zoo.
+
+        Returns:
+            BulkAddResult: How many animals were added.
+        """
+        batch = {}
+        for animal in animals:
+            # Validate that animal is an Animal instance
+            if not isinstance(animal, Animal):
+                raise TypeError('Only Animal objects can be added to the zoo.')
+            # Check for duplicates inside the batch and in the zoo in one hashed pass
+            if animal.animal_id in batch or animal.animal_id in self.__animals:
+                raise ValueError(f'{animal.name} the {animal.species} is already in the zoo.')
+            if animal._zoo is not None:
+                raise ValueError(f'{animal.name} the {animal.species} already belongs to {animal._zoo.name}.')
+            batch[animal.animal_id] = animal
+
+        # Everything is valid: add the whole batch
+        for animal in batch.values():
+            self.__animals[animal.animal_id] = animal
+            self.__index_animal(animal)
+            animal._zoo = self
+        return BulkAddResult('animals', len(batch))
+
+    def add_enclosures(self, enclosures) -> BulkAddResult:
+        """
+        Adds a batch of enclosures to the zoo in one step (all or nothing).
+
+        Args:
+            enclosures (iterable): The Enclosure objects to add.
+
+        Raises:
+            TypeError: If any item is not an Enclosure instance.
+            ValueError: If an enclosure appears twice in the batch, is already in the zoo,
+                        or belongs to another zoo.
+
+        Returns:
+            BulkAddResult: How many enclosures were added.
+        """
+        batch = {}
+        for enclosure in enclosures:
+            # Validate that enclosure is an Enclosure instance
+            if not isinstance(enclosure, Enclosure):
+                raise TypeError('Only Enclosure objects can be added to the zoo.')
+            # Check for duplicates inside the batch and in the zoo
+            if enclosure.enclosure_id in batch or enclosure.enclosure_id in self.__enclosures:
+                raise ValueError(f'{enclosure.environmental_type} enclosure is already in the zoo.')
+            if enclosure._zoo is not None:
+                raise ValueError(f'{enclosure.environmental_type} enclosure already belongs to {enclosure._zoo.name}.')
+            batch[enclosure.enclosure_id] = enclosure
+
+        # Everything is valid: add the whole batch
+        self.__enclosures.update(batch)
+        for enclosure in batch.values():
+            self.__index_enclosure(enclosure)
+        return BulkAddResult('enclosures', len(batch))
+
+    def add_staff_members(self, staff_members) -> BulkAddResult:
+        """
+        Adds a batch of staff members to the zoo in one step (all or nothing).
+
+        Args:
+            staff_members (iterable): The Staff objects to add.
+
+        Raises:
+            TypeError: If any item is not a Staff instance.
+            ValueError: If a staff_id appears twice in the batch, is already in the zoo,
+                        or the staff member works at another zoo.
+
+        Returns:
+            BulkAddResult: How many staff members were added.
+        """
+        batch = {}
+        for staff_member in staff_members:
+            # Validate that staff_member is a Staff instance
+            if not isinstance(staff_member, Staff):
+                raise TypeError('Only Staff objects can be added to the zoo.')
+            # Check for duplicates inside the batch and in the zoo
+            if staff_member.staff_id in batch or staff_member.staff_id in self.__staff:
+                raise ValueError(f'{staff_member.name} (ID: {staff_member.staff_id}) is already in the zoo.')
+            if staff_member._zoo is not None:
+                raise ValueError(f'{staff_member.name} (ID: {staff_member.staff_id}) already works at {staff_member._zoo.name}.')
+            batch[staff_member.staff_id] = staff_member
+
+        # Everything is valid: add the whole batch
+        self.__staff.update(batch)
+        for staff_member in batch.values():
+            self.__index_staff(staff_member)
+        return BulkAddResult('staff members', len(batch))
+
 # ============================ Animal Enclosure Assignment ========================================
     # Methods for assigning animals to appropriate enclosures
     def assign_animal_to_enclosure(self, animal: Animal, enclosure: Enclosure) -> str:
@@ -290,6 +869,9 @@ class Zoo:
         - The animal matches the enclosure type
         - The animal's environment matches the enclosure
 
+        If the animal is already assigned to another enclosure it is moved:
+        it is removed from its previous enclosure once the new one accepts it.
+
         Args:
             animal (Animal): The animal to assign.
             enclosure (Enclosure): The enclosure to assign the animal to.
@@ -308,23 +890,50 @@ class Zoo:
             raise TypeError('enclosure must be an Enclosure instance.')
 
         # Check if animal is in zoo
-        if animal not in self.__animals:
+        if animal.animal_id not in self.__animals:
             raise ValueError(f'{animal.name} is not in the zoo. Add the animal first.')
 
         # Check if enclosure is in zoo
-        if enclosure not in self.__enclosures:
+        if enclosure.enclosure_id not in self.__enclosures:
             raise ValueError(f'{enclosure.environmental_type} enclosure is not in the zoo. Add the enclosure first.')
 
         # Check if animal can be moved (no critical health issues)
         if not animal.can_be_moved():
             raise ValueError(f'{animal.name} has critical health issues and cannot be moved.')
 
-        # Attempt to add animal to enclosure (enclosure validates type and environment)
+        # Attempt to add animal to enclosure (enclosure validates type and environment).
+        # Once it is accepted, the enclosure notifies the zoo, which records the new
+        # enclosure and takes the animal out of its previous one.
         result = enclosure.add_animal(animal)
 
         # Return confirmation
         return f'{animal.name} assigned to {enclosure.environmental_type} enclosure. {result}'
 
+    def enclosure_of(self, animal: Animal):
+        """
+        Returns the enclosure an animal is currently assigned to.
+
+        Args:
+            animal (Animal): The animal to look up.
+
+        Raises:
+            TypeError: If animal is not an Animal instance.
+            ValueError: If animal is not in the zoo.
+
+        Returns:
+            Enclosure: The animal's current enclosure, or None if it has not been assigned.
+        """
+        # Validate type
+        if not isinstance(animal, Animal):
+            raise TypeError('animal must be an Animal instance.')
+
+        # Check if animal is in zoo
+        if animal.animal_id not in self.__animals:
+            raise ValueError(f'{animal.name} is not in the zoo.')
+
+        # Single lookup in the animal -> enclosure map
+        return self.__animal_enclosures.get(animal.animal_id)
+
     # ============================ Reporting ==========================================================
     # Methods for generating reports about the zoo
     def generate_report(self) -> str:
@@ -335,63 +944,172 @@ class Zoo:
         Returns:
             str: A detailed report of the zoo's current state.
         """
-        # Build report header
-        report = f'{"=" * 60}\n'
-        report += f'{self.name} - Zoo Report\n'
-        report += f'{"=" * 60}\n\n'
+        # Join the streamed report lines once instead of concatenating repeatedly
+        return ''.join(self.iter_report())
+
+    def iter_report(self):
+        """
+        Yields the zoo report line by line, so large reports never need to be
+        held in memory as a single string.
+
+        Yields:
+            str: The next line of the report, including its trailing newline.
+        """
+        # Report header
+        yield f'{"=" * 60}\n'
+        yield f'{self.name} - Zoo Report\n'
+        yield f'{"=" * 60}\n'
+        yield '\n'
 
         # Animals section
-        report += f'ANIMALS ({len(self.__animals)}):\n'
-        report += '-' * 60 + '\n'
+        yield f'ANIMALS ({len(self.__animals)}):\n'
+        yield '-' * 60 + '\n'
         if self.__animals:
-            for animal in self.__animals:
-                report += f'  - {animal.name} ({animal.species}), Age: {animal.age}, '
-                report += f'Diet: {animal.dietary_needs}, Environment: {animal.environment}\n'
+            for animal in self.__animals.values():
+                yield (f'  - {animal.name} ({animal.species}), Age: {animal.age}, '
+                       f'Diet: {animal.dietary_needs}, Environment: {animal.environment}\n')
                 # Check for critical health issues
                 if animal.has_critical_health_issues():
-                    report += f'    !!  CRITICAL HEALTH ISSUES - Cannot be moved\n'
+                    yield '    !!  CRITICAL HEALTH ISSUES - Cannot be moved\n'
         else:
-            report += '  No animals in the zoo.\n'
-        report += '\n'
+            yield '  No animals in the zoo.\n'
+        yield '\n'
 
         # Enclosures section
-        report += f'ENCLOSURES ({len(self.__enclosures)}):\n'
-        report += '-' * 60 + '\n'
+        yield f'ENCLOSURES ({len(self.__enclosures)}):\n'
+        yield '-' * 60 + '\n'
         if self.__enclosures:
-            for enclosure in self.__enclosures:
-                report += f'  - {enclosure.environmental_type} ({enclosure.size}), '
-                report += f'Type: {enclosure.animal_type.__name__}, '
-                report += f'Cleanliness: {enclosure.cleanliness_level}%, '
-                report += f'Animals: {len(enclosure.animals)}\n'
+            for enclosure in self.__enclosures.values():
+                yield (f'  - {enclosure.environmental_type} ({enclosure.size}), '
+                       f'Type: {enclosure.animal_type.__name__}, '
+                       f'Cleanliness: {enclosure.cleanliness_level}%, '
+                       f'Animals: {enclosure.count_animals()}\n')
         else:
-            report += '  No enclosures in the zoo.\n'
-        report += '\n'
+            yield '  No enclosures in the zoo.\n'
+        yield '\n'
 
         # Staff section
-        report += f'STAFF ({len(self.__staff)}):\n'
-        report += '-' * 60 + '\n'
+        yield f'STAFF ({len(self.__staff)}):\n'
+        yield '-' * 60 + '\n'
         if self.__staff:
-            for staff_member in self.__staff:
-                report += f'  - {staff_member.name} (ID: {staff_member.staff_id}), '
-                report += f'Role: {staff_member.role}, '
-                report += f'Animals: {len(staff_member.assigned_animals)}, '
-                report += f'Enclosures: {len(staff_member.assigned_enclosures)}\n'
+            for staff_member in self.__staff.values():
+                yield (f'  - {staff_member.name} (ID: {staff_member.staff_id}), '
+                       f'Role: {staff_member.role}, '
+                       f'Animals: {staff_member.count_assigned_animals()}, '
+                       f'Enclosures: {staff_member.count_assigned_enclosures()}\n')
         else:
-            report += '  No staff members in the zoo.\n'
+            yield '  No staff members in the zoo.\n'
+
+        yield '\n'
+        yield '=' * 60 + '\n'
+
+    def write_report(self, fp, chunk_size: int = 1000) -> None:
+        """
+        Writes the zoo report to a file-like object in chunks of lines.
 
-        report += '\n' + '=' * 60 + '\n'
-        return report
+        Args:
+            fp: Any object with a write(str) method (open file, io.StringIO, socket wrapper, ...).
+            chunk_size (int): Number of report lines to join per write call (default 1000).
+
+        Raises:
+            TypeError: If chunk_size is not an integer.
+            ValueError: If chunk_size is less than 1.
+        """
+        # Validate chunk size (bool is a subclass of int, so exclude it explicitly)
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):
+            raise TypeError('Chunk size must be an integer.')
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1.')
+
+        # Buffer a bounded number of lines so memory stays flat however large the zoo is
+        chunk = []
+        for line in self.iter_report():
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                fp.write(''.join(chunk))
+                chunk.clear()
+        if chunk:
+            fp.write(''.join(chunk))
+
+    def health_events_between(self, start, end, severity: str = None) -> list:
+        """
+        Returns the health records reported across the zoo between two dates, inclusive.
+
+        Args:
+            start (str | date): First date to include (YYYY-MM-DD string or datetime.date).
+            end (str | date): Last date to include (YYYY-MM-DD string or datetime.date).
+            severity (str | Severity): Only include records with this severity level (case-insensitive).
+
+        Raises:
+            TypeError: If a date or severity has the wrong type.
+            ValueError: If a date is invalid, start is after end, or severity is not a valid level.
+
+        Returns:
+            list: (animal, record) pairs, oldest first.
+        """
+        start_ordinal = HealthRecord.to_ordinal(start)
+        end_ordinal = HealthRecord.to_ordinal(end)
+        if start_ordinal > end_ordinal:
+            raise ValueError('Start date must not be after end date.')
+
+        # Binary search in the sorted timeline; animals without records in range are never visited
+        return self.__select_health_timeline(severity).between(start_ordinal, end_ordinal)
+
+    def latest_health_events(self, count: int, severity: str = None) -> list:
+        """
+        Returns the most recently reported health records across the zoo.
+
+        Args:
+            count (int): Maximum number of records to return.
+            severity (str | Severity): Only include records with this severity level (case-insensitive).
+
+        Raises:
+            TypeError: If count is not an integer or severity is not a string.
+            ValueError: If count is negative or severity is not a valid level.
+
+        Returns:
+            list: Up to count (animal, record) pairs, newest first.
+        """
+        # Validate count (bool is an int subclass, so exclude it explicitly)
+        if isinstance(count, bool) or not isinstance(count, int):
+            raise TypeError('Count must be an integer.')
+        if count < 0:
+            raise ValueError('Count cannot be negative.')
+
+        return self.__select_health_timeline(severity).latest(count)
+
+    def count_health_events(self, severity=None) -> int:
+        """
+        Returns the number of health records across the zoo, optionally for one severity level.
+
+        Args:
+            severity (str | Severity): Only count records with this severity level (case-insensitive).
+
+        Raises:
+            TypeError: If severity is not a string or Severity.
+            ValueError: If severity is not a valid level.
+
+        Returns:
+            int: Number of matching records (O(1)).
+        """
+        return len(self.__select_health_timeline(severity))
+
+    def __select_health_timeline(self, severity) -> HealthTimeline:
+        """Return the timeline for a severity level, or the zoo-wide timeline if severity is None."""
+        if severity is None:
+            return self.__health_timeline
+        return self.__health_timeline_by_severity[Severity.parse(severity)]
 
     def list_animals_with_critical_health(self) -> list:
         """
         Returns a list of animals with critical health issues.
 
         Returns:
-            list: List of Animal objects with critical health issues.
+            list: List of Animal objects with critical health issues, in the order they were added to the zoo.
         """
-        # Filter animals with critical health issues
-        critical_animals = [animal for animal in self.__animals if animal.has_critical_health_issues()]
-        return critical_animals
+        # Read the live set of critical animals kept up to date by Animal notifications.
+        # The set is ordered by when animals became critical, so only its few members are sorted back into zoo order.
+        return self.__in_zoo_order(self.__critical_animals.values())
 
     def list_animals_by_species(self, species: str) -> list:
         """
@@ -405,7 +1123,7 @@ class Zoo:
             ValueError: If species is empty.
 
         Returns:
-            list: List of Animal objects of the specified species.
+            list: List of Animal objects of the specified species, in the order they were added to the zoo.
         """
         # Validate species type
         if not isinstance(species, str):
@@ -415,10 +1133,25 @@ class Zoo:
         if species.strip() == '':
             raise ValueError('Species cannot be empty.')
 
-        # Filter animals by species (case-insensitive)
-        animals_by_species = [animal for animal in self.__animals
-                              if animal.species.lower() == species.lower()]
-        return animals_by_species
+        # Single dictionary lookup in the case-folded species index
+        return self.__in_zoo_order(self.__animals_by_species.get(species.casefold(), {}).values())
+
+    def animals_grouped_by_species(self) -> dict:
+        """
+        Returns every animal in the zoo grouped by species.
+
+        Species are matched case-insensitively; each group is keyed by the
+        species name as written on the earliest-added animal of that group.
+        Groups, and the animals within each group, are in the order they were
+        added to the zoo.
+
+        Returns:
+            dict: Species name -> list of Animal objects of that species.
+        """
+        # Read the groups straight from the species index, each sorted into zoo order
+        groups = [self.__in_zoo_order(bucket.values()) for bucket in self.__animals_by_species.values()]
+        groups.sort(key=lambda animals: self.__animal_positions[animals[0].animal_id])
+        return {animals[0].species: animals for animals in groups}
 
     # ============================ String Method ======================================================
     def __str__(self) -> str: